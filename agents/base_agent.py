@@ -10,9 +10,11 @@ import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, Any, List, Optional, Generator, Literal
 import os
 
+import httpx
 from anthropic import Anthropic
 from openai import OpenAI
 
@@ -33,6 +35,36 @@ from config import (
 from mcp_server.server import get_mcp_server
 
 
+# orjson ist optional (C-Encoder, deutlich schneller für große Tool-Ergebnisse);
+# Fallback auf stdlib json. Beide lassen Nicht-ASCII-Zeichen unescaped.
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+
+# Keep-Alive-Pool für die LLM-Clients: Verbindungen bleiben zwischen den
+# Phasen (und über mehrere Läufe hinweg) offen, statt pro Agent neu per TLS
+# aufgebaut zu werden
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60)
+
+
+@lru_cache(maxsize=1)
+def get_anthropic_client() -> Anthropic:
+    """Prozessweiter Anthropic-Client mit gemeinsamem Connection-Pool."""
+    return Anthropic(api_key=ANTHROPIC_API_KEY, http_client=httpx.Client(limits=HTTP_POOL_LIMITS))
+
+
+@lru_cache(maxsize=1)
+def get_openai_client() -> OpenAI:
+    """Prozessweiter OpenAI-Client mit gemeinsamem Connection-Pool."""
+    return OpenAI(api_key=OPENAI_API_KEY, http_client=httpx.Client(limits=HTTP_POOL_LIMITS))
+
+
 class EventType(Enum):
     """Typen von Agent-Events für die UI"""
     THINKING = "thinking"
@@ -43,7 +75,7 @@ class EventType(Enum):
     STATUS = "status"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentEvent:
     """Ein Event das der Agent während der Ausführung generiert"""
     event_type: EventType
@@ -96,7 +128,7 @@ class BaseAgent(ABC):
         if self._anthropic_client is None:
             if not ANTHROPIC_API_KEY:
                 raise ValueError("ANTHROPIC_API_KEY nicht gesetzt")
-            self._anthropic_client = Anthropic(api_key=ANTHROPIC_API_KEY)
+            self._anthropic_client = get_anthropic_client()
         return self._anthropic_client
     
     @property
@@ -104,7 +136,7 @@ class BaseAgent(ABC):
         if self._openai_client is None:
             if not OPENAI_API_KEY:
                 raise ValueError("OPENAI_API_KEY nicht gesetzt")
-            self._openai_client = OpenAI(api_key=OPENAI_API_KEY)
+            self._openai_client = get_openai_client()
         return self._openai_client
     
     @property
@@ -415,7 +447,7 @@ class BaseAgent(ABC):
                     "content": [{
                         "type": "tool_result",
                         "tool_use_id": msg["tool_use_id"],
-                        "content": json.dumps(msg["result"], ensure_ascii=False)
+                        "content": _json_dumps(msg["result"])
                     }]
                 })
         return formatted
@@ -429,7 +461,7 @@ class BaseAgent(ABC):
                 formatted.append({
                     "role": "tool",
                     "tool_call_id": msg["tool_call_id"],
-                    "content": json.dumps(msg["result"], ensure_ascii=False)
+                    "content": _json_dumps(msg["result"])
                 })
         return formatted
     
@@ -470,7 +502,7 @@ class BaseAgent(ABC):
             return self._truncate_structured_result(result)
         
         # Fallback: Alte Gesamt-Truncation für unstrukturierte Ergebnisse
-        result_str = json.dumps(result, ensure_ascii=False)
+        result_str = _json_dumps(result)
         if len(result_str) <= MAX_TOOL_RESULT_CHARS:
             return result
         truncated_str = result_str[:MAX_TOOL_RESULT_CHARS]
@@ -495,7 +527,7 @@ class BaseAgent(ABC):
         original_length = 0
         
         for source in result["results"]:
-            original_length += len(json.dumps(source, ensure_ascii=False))
+            original_length += len(_json_dumps(source))
             
             # Wichtige Felder behalten (URL, Titel immer vollständig)
             truncated_source = {
@@ -19,7 +19,25 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 
-@dataclass
+# orjson ist optional (C-Parser, ~3x schneller); Fallback auf stdlib json.
+# orjson.JSONDecodeError erbt von json.JSONDecodeError -> gleiche except-Klauseln
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Einstiegspunkte für das Verdict-JSON (Methode 1: ```json-Block, Methode 2: {"verdict")
+_JSON_FENCE_RE = re.compile(r'```json\s*(\{)')
+_VERDICT_START_RE = re.compile(r'\{\s*"verdict"')
+
+# Token-Scanner für die Klammerbalancierung: String-Literale (inkl. Escapes,
+# auch unterminiert bis Textende) oder einzelne Klammern. Alles dazwischen
+# überspringt die Regex-Engine in C statt Zeichen für Zeichen in Python.
+_JSON_TOKEN_RE = re.compile(r'"[^"\\]*(?:\\[\s\S][^"\\]*)*"?|[{}]')
+
+
+@dataclass(slots=True)
 class EditorIssue:
     """Ein einzelnes vom Editor identifiziertes Problem"""
     type: str
@@ -27,6 +45,7 @@ class EditorIssue:
     severity: str
     suggested_action: str
     research_query: Optional[str] = None
+    location: Optional[str] = None  # Abschnitt/Satz, auf den sich das Issue bezieht
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -34,11 +53,12 @@ class EditorIssue:
             "description": self.description,
             "severity": self.severity,
             "suggested_action": self.suggested_action,
-            "research_query": self.research_query
+            "research_query": self.research_query,
+            "location": self.location
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class EditorVerdict:
     """Strukturiertes Editor-Urteil fuer Smart Routing."""
     verdict: str
@@ -63,33 +83,14 @@ class EditorVerdict:
             return None
         
         depth = 0
-        in_string = False
-        escape_next = False
-        
-        for i in range(start_idx, len(text)):
-            char = text[i]
-            
-            if escape_next:
-                escape_next = False
-                continue
-            
-            if char == '\\' and in_string:
-                escape_next = True
-                continue
-            
-            if char == '"' and not escape_next:
-                in_string = not in_string
-                continue
-            
-            if in_string:
-                continue
-            
+        for token in _JSON_TOKEN_RE.finditer(text, start_idx):
+            char = token.group()
             if char == '{':
                 depth += 1
             elif char == '}':
                 depth -= 1
                 if depth == 0:
-                    return text[start_idx:i+1]
+                    return text[start_idx:token.end()]
         
         return None  # Unbalanced
     
@@ -104,7 +105,8 @@ class EditorVerdict:
                     description=issue_data.get("description", ""),
                     severity=issue_data.get("severity", "minor"),
                     suggested_action=issue_data.get("suggested_action", "revise"),
-                    research_query=issue_data.get("research_query")
+                    research_query=issue_data.get("research_query"),
+                    location=issue_data.get("location")
                 ))
         return issues
     
@@ -114,13 +116,13 @@ class EditorVerdict:
         
         # === METHODE 1: JSON im ```json ... ``` Block ===
         # Auch wenn schließendes ``` fehlt!
-        json_block_match = re.search(r'```json\s*(\{)', response_text)
+        json_block_match = _JSON_FENCE_RE.search(response_text)
         if json_block_match:
             json_start = json_block_match.start(1)
             json_str = cls._extract_balanced_json(response_text, json_start)
             if json_str:
                 try:
-                    data = json.loads(json_str)
+                    data = _json_loads(json_str)
                     return cls(
                         verdict=data.get("verdict", "revise"),
                         confidence=float(data.get("confidence", 0.5)),
@@ -132,12 +134,12 @@ class EditorVerdict:
                     print(f"[EditorVerdict] Methode 1 fehlgeschlagen: {e}")
         
         # === METHODE 2: Finde { mit "verdict" und balanciere Klammern ===
-        verdict_match = re.search(r'\{\s*"verdict"', response_text)
+        verdict_match = _VERDICT_START_RE.search(response_text)
         if verdict_match:
             json_str = cls._extract_balanced_json(response_text, verdict_match.start())
             if json_str:
                 try:
-                    data = json.loads(json_str)
+                    data = _json_loads(json_str)
                     return cls(
                         verdict=data.get("verdict", "revise"),
                         confidence=float(data.get("confidence", 0.5)),
@@ -153,7 +155,7 @@ class EditorVerdict:
             json_str = cls._extract_balanced_json(response_text, match.start())
             if json_str and '"verdict"' in json_str:
                 try:
-                    data = json.loads(json_str)
+                    data = _json_loads(json_str)
                     if "verdict" in data:
                         return cls(
                             verdict=data.get("verdict", "revise"),
@@ -40,10 +40,17 @@ from agents.orchestrator import ResearchPlan, ResearchRound
 from agents.prompt_optimizer import PromptOptimizerAgent
 from session_logger import get_log_for_article, list_all_logs, LOGS_DIR
 from mcp_server.server import get_mcp_server
+from mcp_server.tools.async_runner import close_http_client
 
 app = FastAPI(title="HayMAS API")
 
 
+@app.on_event("shutdown")
+def _shutdown_http_client():
+    """Schließt die gepoolten HTTP-Verbindungen der Research-Tools"""
+    close_http_client()
+
+
 # CORS für lokale Entwicklung
 app.add_middleware(
     CORSMiddleware,
@@ -190,6 +190,28 @@ OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "output")
 # Sprache für Wissensartikel
 DEFAULT_LANGUAGE = "de"
 
+# Persistenter Cache für Such-Ergebnisse - nur mit HAYMAS_CACHE=1, damit
+# wiederholte Läufe nicht stillschweigend gespeicherte Ergebnisse bekommen
+SEARCH_CACHE_ENABLED = os.getenv("HAYMAS_CACHE", "") == "1"
+SEARCH_CACHE_PATH = os.path.join(os.path.dirname(__file__), "data", "search_cache.sqlite")
+
+# Gültigkeit der gecachten Ergebnisse pro Tool (Sekunden)
+SEARCH_CACHE_TTL = {
+    "gnews": 6 * 3600,                   # News veralten schnell
+    "tavily": 12 * 3600,
+    "hackernews": 24 * 3600,
+    "wikipedia": 3 * 24 * 3600,
+    "semantic_scholar": 7 * 24 * 3600,   # Paper ändern sich kaum
+    "arxiv": 7 * 24 * 3600,
+}
+SEARCH_CACHE_DEFAULT_TTL = 12 * 3600
+
+# Persistenter Cache für LLM-Antworten (Schlüssel: Modell + Prompt-Hash).
+# Ebenfalls nur mit HAYMAS_CACHE=1 aktiv, z.B. für Entwicklung und Tests.
+LLM_CACHE_ENABLED = os.getenv("HAYMAS_CACHE", "") == "1"
+LLM_CACHE_PATH = os.path.join(os.path.dirname(__file__), "data", "llm_cache.sqlite")
+LLM_CACHE_TTL = 7 * 24 * 3600
+
 # =============================================================================
 # Wissensartikel-Einstellungen
 # =============================================================================
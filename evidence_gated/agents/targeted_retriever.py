@@ -6,6 +6,7 @@ Nutzt unsere bestehenden Tools (Tavily, Wikipedia, etc.)
 """
 
 from typing import Dict, Any, Generator, List
+from urllib.parse import urlparse
 
 import sys
 import os
@@ -144,7 +145,6 @@ class TargetedRetrieverAgent(BaseAgent):
     def _extract_publisher(self, url: str) -> str:
         """Extrahiert Publisher aus URL."""
         try:
-            from urllib.parse import urlparse
             domain = urlparse(url).netloc
             # Entferne www. und .com/.de/etc
             domain = domain.replace("www.", "")
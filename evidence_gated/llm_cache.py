@@ -0,0 +1,88 @@
+"""
+Evidence-Gated System - LLM Response Cache
+
+Persistenter Cache für LLM-Antworten (SQLite, nur Standardbibliothek).
+Schlüssel ist der SHA-256 über Modell, Token-Limit und Prompt - ein
+identischer Prompt an dasselbe Modell liefert die gespeicherte Antwort,
+ohne erneut Tokens zu verbrauchen.
+"""
+
+import os
+import json
+import hashlib
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, Optional
+
+import sys
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT_DIR not in sys.path:
+    sys.path.append(_ROOT_DIR)
+
+from config import LLM_CACHE_PATH, LLM_CACHE_ENABLED, LLM_CACHE_TTL
+
+
+class LLMCache:
+    """
+    Thread-sicherer Cache für LLM-Antworten auf SQLite-Basis.
+
+    Gespeichert werden Antworttext und Token-Verbrauch des ursprünglichen
+    Calls. Der Aufrufer entscheidet, ob eine Antwort cachebar ist (z.B. erst
+    nach erfolgreichem Parsen), damit kaputte Antworten nicht hängen bleiben.
+    """
+
+    def __init__(self, path: str = LLM_CACHE_PATH, ttl: int = LLM_CACHE_TTL):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " expires_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def _key(model: str, max_tokens: int, prompt: str) -> str:
+        return hashlib.sha256(f"{model}|{max_tokens}|{prompt}".encode("utf-8")).hexdigest()
+
+    def get(self, model: str, max_tokens: int, prompt: str) -> Optional[Dict[str, Any]]:
+        """Gibt {"text", "tokens"} zurück oder None (Miss / abgelaufen)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM llm_cache WHERE key = ?",
+                (self._key(model, max_tokens, prompt),)
+            ).fetchone()
+        if row is None or row[1] < time.time():
+            return None
+        return json.loads(row[0])
+
+    def set(self, model: str, max_tokens: int, prompt: str, text: str, tokens: Dict[str, int]):
+        """Speichert eine Antwort mit der konfigurierten TTL."""
+        if not text:
+            return
+        value = json.dumps({"text": text, "tokens": tokens}, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (self._key(model, max_tokens, prompt), value, time.time() + self.ttl)
+            )
+            self._conn.commit()
+
+
+# Globale Cache-Instanz
+_cache_instance = None
+
+
+def get_llm_cache() -> Optional[LLMCache]:
+    """Gibt die globale Cache-Instanz zurück (None wenn deaktiviert)."""
+    global _cache_instance
+    if not LLM_CACHE_ENABLED:
+        return None
+    if _cache_instance is None:
+        _cache_instance = LLMCache()
+    return _cache_instance
@@ -10,10 +10,19 @@ Alle Artefakte des Evidence-Gated Workflows:
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Dict, Optional, Any
 from enum import Enum
 from datetime import date
 import json
+import re
+
+
+# Pattern ohne Treffer (TermMap ohne Negative Keywords)
+_NEVER_MATCH_RE = re.compile(r"(?!)")
+
+# Erstes Domain-Label einer http(s)-URL (ohne "www.") für den Publisher
+_DOMAIN_RE = re.compile(r'^https?://(?:www\.)?([^./:?#@]+)', re.IGNORECASE)
 
 
 # =============================================================================
@@ -64,7 +73,7 @@ class ClaimStatus(Enum):
 # PHASE 1: QUERY NORMALIZATION
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class QuestionBrief:
     """
     Präzisierte Fragestellung mit Scope-Definition.
@@ -96,9 +105,24 @@ class QuestionBrief:
     @classmethod
     def from_dict(cls, data: Dict) -> "QuestionBrief":
         return cls(**data)
+    
+    @classmethod
+    def from_llm_dict(cls, data: Dict, question: str, as_of_date: str = "") -> "QuestionBrief":
+        """Tolerante Konstruktion aus LLM-JSON (fehlende Felder -> Defaults)."""
+        return cls(
+            core_question=data.get("core_question", question),
+            original_question=question,
+            audience=data.get("audience", "Fachexperten"),
+            tone=data.get("tone", "wissenschaftlich"),
+            target_pages=data.get("target_pages", 12),
+            as_of_date=data.get("as_of_date", as_of_date or date.today().isoformat()),
+            freshness_priority=data.get("freshness_priority", "high"),
+            scope_in=data.get("scope_in", []),
+            scope_out=data.get("scope_out", [])
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class TermMap:
     """
     Terminologie-Mapping für präzise Suchen.
@@ -110,6 +134,9 @@ class TermMap:
     disambiguation_notes: List[str]      # Klärungen (z.B. "Produkt vs. Feature")
     search_variants: Dict[str, List[str]]  # Term -> Suchvarianten (3-5 pro Term)
     
+    # Memoisiertes Negative-Keyword-Pattern (siehe negative_pattern)
+    _negative_re: Optional[re.Pattern] = field(default=None, init=False, repr=False, compare=False)
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
             "canonical_terms": self.canonical_terms,
@@ -123,6 +150,38 @@ class TermMap:
     def from_dict(cls, data: Dict) -> "TermMap":
         return cls(**data)
     
+    @classmethod
+    def from_llm_dict(cls, data: Dict) -> "TermMap":
+        """Tolerante Konstruktion aus LLM-JSON (fehlende Felder -> Defaults)."""
+        return cls(
+            canonical_terms=data.get("canonical_terms", []),
+            synonyms=data.get("synonyms", {}),
+            negative_keywords=data.get("negative_keywords", []),
+            disambiguation_notes=data.get("disambiguation_notes", []),
+            search_variants=data.get("search_variants", {})
+        )
+    
+    @property
+    def negative_pattern(self) -> re.Pattern:
+        """
+        Alle Negative Keywords als ein vorkompiliertes Pattern.
+        
+        Ein search() prüft einen Text in einem Durchlauf auf sämtliche
+        Keywords (case-insensitiv) statt einer Python-Schleife pro Keyword.
+        Keywords matchen nur als ganze Wörter ("AI" nicht in "Certain").
+        """
+        if self._negative_re is None:
+            # Längste zuerst, damit überlappende Keywords vollständig matchen
+            keywords = sorted(
+                {k.strip() for k in self.negative_keywords if k and k.strip()},
+                key=len, reverse=True
+            )
+            self._negative_re = (
+                re.compile(r"(?<!\w)(?:" + "|".join(map(re.escape, keywords)) + r")(?!\w)", re.IGNORECASE)
+                if keywords else _NEVER_MATCH_RE
+            )
+        return self._negative_re
+    
     def get_all_search_terms(self, canonical_term: str) -> List[str]:
         """Gibt alle Suchvarianten für einen kanonischen Term zurück."""
         terms = [canonical_term]
@@ -135,7 +194,7 @@ class TermMap:
 # PHASE 2: OUTLINE & CLAIMS
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class OutlineSection:
     """Ein Abschnitt im Outline."""
     number: str                    # z.B. "1", "2.1"
@@ -145,7 +204,7 @@ class OutlineSection:
     estimated_pages: float = 1.0   # Geschätzte Seitenzahl
 
 
-@dataclass
+@dataclass(slots=True)
 class Outline:
     """Gliederung des Papers."""
     sections: List[OutlineSection]
@@ -175,9 +234,23 @@ class Outline:
             sections=sections,
             total_estimated_pages=data.get("total_estimated_pages", 0)
         )
-
-
-@dataclass
+    
+    @classmethod
+    def from_llm_dict(cls, data: Dict) -> "Outline":
+        """Tolerante Konstruktion aus LLM-JSON (unbekannte Keys werden ignoriert)."""
+        return cls(sections=[
+            OutlineSection(
+                number=s.get("number", ""),
+                title=s.get("title", ""),
+                goal=s.get("goal", ""),
+                expected_claim_ids=s.get("expected_claim_ids", []),
+                estimated_pages=s.get("estimated_pages", 1.0)
+            )
+            for s in data.get("sections", [])
+        ])
+
+
+@dataclass(slots=True)
 class RetrievalTicket:
     """
     Recherche-Auftrag für einen B/C-Claim.
@@ -203,9 +276,19 @@ class RetrievalTicket:
             "recency_days": self.recency_days,
             "acceptance_criteria": self.acceptance_criteria
         }
+    
+    @classmethod
+    def from_llm_dict(cls, data: Dict) -> "RetrievalTicket":
+        """Tolerante Konstruktion aus LLM-JSON (unbekannte Keys werden ignoriert)."""
+        return cls(
+            queries=data.get("queries", []),
+            min_sources=data.get("min_sources", 1),
+            preferred_domains=data.get("preferred_domains", []),
+            excluded_domains=data.get("excluded_domains", [])
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class Claim:
     """
     Ein einzelner Claim - das Herzstück des Systems.
@@ -266,9 +349,23 @@ class Claim:
             status=ClaimStatus(data.get("status", "pending")),
             section_id=data.get("section_id", "")
         )
+    
+    @classmethod
+    def from_llm_dict(cls, data: Dict, index: int) -> "Claim":
+        """Tolerante Konstruktion aus LLM-JSON; index (1-basiert) für Default-IDs."""
+        ticket_data = data.get("retrieval_ticket")
+        return cls(
+            claim_id=data.get("claim_id", f"C-{index:02d}"),
+            claim_text=data.get("claim_text", ""),
+            claim_type=ClaimType(data.get("claim_type", "definition")),
+            evidence_class=EvidenceClass(data.get("evidence_class", "B")),
+            freshness_required=data.get("freshness_required", False),
+            section_id=data.get("section_id", ""),
+            retrieval_ticket=RetrievalTicket.from_llm_dict(ticket_data) if ticket_data else None
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class ClaimRegister:
     """
     Das zentrale Register aller Claims.
@@ -283,6 +380,9 @@ class ClaimRegister:
     min_total_claims: int = 12
     min_c_claims: int = 4
     
+    # Memoisiertes Ergebnis von validate() (slots=True erlaubt kein cached_property)
+    _validation: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
             "question_brief": self.question_brief.to_dict(),
@@ -303,15 +403,65 @@ class ClaimRegister:
             claims=[Claim.from_dict(c) for c in data.get("claims", [])]
         )
     
+    @classmethod
+    def from_llm_dict(
+        cls,
+        data: Dict,
+        question: str,
+        as_of_date: str = "",
+        min_total_claims: int = 12,
+        min_c_claims: int = 4
+    ) -> "ClaimRegister":
+        """
+        Baut das komplette Register in einem Aufruf aus der ClaimMiner-Antwort.
+        
+        Im Gegensatz zu from_dict tolerant gegenüber fehlenden Feldern;
+        data selbst bleibt unverändert.
+        """
+        claims = [
+            Claim.from_llm_dict(c, i)
+            for i, c in enumerate(data.get("claims") or [], 1)
+        ]
+        
+        return cls(
+            question_brief=QuestionBrief.from_llm_dict(data.get("question_brief", {}), question, as_of_date),
+            term_map=TermMap.from_llm_dict(data.get("term_map", {})),
+            outline=Outline.from_llm_dict(data.get("outline", {})),
+            claims=claims,
+            min_total_claims=min_total_claims,
+            min_c_claims=min_c_claims
+        )
+    
     # === Validierung ===
     
+    @property
+    def validation(self) -> Dict[str, Any]:
+        """
+        Validierungsergebnis, einmalig berechnet.
+        
+        Die Prüfung hängt nur von Evidenzklasse und Retrieval-Tickets ab,
+        die sich nach dem Claim Mining nicht mehr ändern.
+        """
+        if self._validation is None:
+            self._validation = self._compute_validation()
+        return self._validation
+    
     def validate(self) -> Dict[str, Any]:
         """Prüft ob das ClaimRegister die Mindestanforderungen erfüllt."""
+        return self.validation
+    
+    def _compute_validation(self) -> Dict[str, Any]:
         issues = []
         
         total_claims = len(self.claims)
-        c_claims = len([c for c in self.claims if c.evidence_class == EvidenceClass.C])
-        b_claims = len([c for c in self.claims if c.evidence_class == EvidenceClass.B])
+        a_claims = b_claims = c_claims = 0
+        for claim in self.claims:
+            if claim.evidence_class == EvidenceClass.A:
+                a_claims += 1
+            elif claim.evidence_class == EvidenceClass.B:
+                b_claims += 1
+            elif claim.evidence_class == EvidenceClass.C:
+                c_claims += 1
         
         if total_claims < self.min_total_claims:
             issues.append(f"Zu wenige Claims: {total_claims} < {self.min_total_claims}")
@@ -330,7 +480,7 @@ class ClaimRegister:
             "issues": issues,
             "stats": {
                 "total_claims": total_claims,
-                "a_claims": len([c for c in self.claims if c.evidence_class == EvidenceClass.A]),
+                "a_claims": a_claims,
                 "b_claims": b_claims,
                 "c_claims": c_claims
             }
@@ -357,9 +507,21 @@ class ClaimRegister:
 # PHASE 4-5: EVIDENCE & RATING
 # =============================================================================
 
-@dataclass
+@lru_cache(maxsize=1024)
+def publisher_from_url(url: str) -> str:
+    """Extrahiert Publisher aus URL (gecacht, da pro Quelle aufgerufen)."""
+    match = _DOMAIN_RE.match(url)
+    return match.group(1).title() if match else "Unbekannt"
+
+
+@dataclass(slots=True, frozen=True)
 class SourceRating:
-    """Bewertung einer Quelle nach 5 Dimensionen (0-3 pro Dimension)."""
+    """
+    Bewertung einer Quelle nach 5 Dimensionen (0-3 pro Dimension).
+    
+    Unveränderlich, damit identische Ratings von mehreren Quellen
+    geteilt werden können.
+    """
     authority: int = 0       # Primärquelle / etabliert / unbekannt
     independence: int = 0    # Hersteller-nah? PR? Affiliate?
     recency: int = 0         # Passt zur Freshness-Anforderung?
@@ -381,7 +543,7 @@ class SourceRating:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Source:
     """Eine einzelne Quelle mit Bewertung."""
     source_id: str                    # z.B. "S-001"
@@ -408,9 +570,23 @@ class Source:
             "supports_claims": self.supports_claims,
             "rating": self.rating.to_dict() if self.rating else None
         }
+    
+    @classmethod
+    def from_search_item(cls, source_id: str, claim_id: str, item: Dict[str, Any]) -> "Source":
+        """
+        Baut eine Quelle aus einem Such-Tool-Ergebnis.
+        
+        Positionale Konstruktion, da pro Treffer im Retrieval-Loop aufgerufen.
+        """
+        url = item.get("url", "")
+        snippet = item.get("snippet") or item.get("content") or ""
+        return cls(
+            source_id, item.get("title", ""), publisher_from_url(url), "", "", url,
+            SourceClass.SECONDARY, snippet[:400], [claim_id]
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class EvidencePack:
     """
     Evidenz-Paket für einen Claim.
@@ -455,7 +631,7 @@ class EvidencePack:
 # PHASE 7: REVIEW
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ReviewIssue:
     """Ein einzelnes Problem im Review."""
     issue_type: str        # "uncovered_claim", "hallucination", "contradiction", "style"
@@ -466,7 +642,7 @@ class ReviewIssue:
     suggested_action: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewReport:
     """
     Ergebnis der Editorial Review.
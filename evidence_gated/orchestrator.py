@@ -6,26 +6,627 @@ Mit vollständigem Step-Logging und dynamischer Modellauswahl.
 """
 
 import os
+import io
 import json
 import re
-from typing import Dict, Any, Generator, Optional, List
-from datetime import datetime, date
+import asyncio
+import contextlib
+import itertools
+import random
+from collections import Counter
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from string import Template
+from typing import Dict, Any, Generator, Optional, List, Callable
+from datetime import datetime
 
 import sys
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-
-from agents.base_agent import AgentEvent, EventType, BaseAgent
+# Projekt-Root nur einmal eintragen (wiederholte Imports lassen sys.path nicht wachsen)
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT_DIR not in sys.path:
+    sys.path.append(_ROOT_DIR)
+
+import anthropic
+import openai
+from anthropic import AsyncAnthropic
+from openai import AsyncOpenAI
+
+from agents.base_agent import (
+    AgentEvent, EventType, BaseAgent,
+    get_anthropic_client, get_openai_client
+)
+from agents.editor import EditorVerdict
 from session_logger import SessionLogger
-from config import OUTPUT_DIR, AGENT_MODELS, AVAILABLE_MODELS, get_model_for_agent
+from config import (
+    OUTPUT_DIR, AGENT_MODELS, AVAILABLE_MODELS, get_model_for_agent,
+    ANTHROPIC_API_KEY, OPENAI_API_KEY, GEMINI_API_KEY
+)
 from mcp_server.server import get_mcp_server
+from mcp_server.search_cache import get_search_cache
+
+from .llm_cache import get_llm_cache
 
 from .models import (
     ClaimRegister, EvidencePack, ReviewReport, ClaimStatus,
-    QuestionBrief, TermMap, Outline, OutlineSection,
-    Claim, ClaimType, EvidenceClass, SourceClass, RetrievalTicket,
-    Source, SourceRating
+    QuestionBrief, TermMap, Outline,
+    Claim, EvidenceClass, SourceClass,
+    Source, SourceRating, publisher_from_url
+)
+
+
+# orjson ist optional (C-Parser, ~3x schneller); Fallback auf stdlib json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+_JSON_BLOCK_RE = re.compile(r'```json\s*([\s\S]*?)```')
+_CODE_BLOCK_RE = re.compile(r'```\s*([\s\S]*?)```')
+
+# Quellenreferenzen [1], [2], ... und mehrfache Leerzeichen im Artikel
+_REF_RE = re.compile(r'\[(\d+)\]')
+_MULTISPACE_RE = re.compile(r'  +')
+_EXEC_SUMMARY_RE = re.compile(r'Executive Summary|Management Summary')
+# Outline-Sektionen, die beim Kapitel-Schreiben über den Rahmen-Prompt entstehen
+_FRAME_SECTION_TITLE_RE = re.compile(r'Executive Summary|Management Summary|Limitations', re.IGNORECASE)
+# Artikel an "## "-Überschriften teilen (Teil 0 = Titel/Vorspann)
+_SECTION_SPLIT_RE = re.compile(r'(?m)^(?=## )')
+_HEADING_NUMBER_RE = re.compile(r'^\d+(?:\.\d+)*\.?\s*')
+
+# Post-Processing: Prozess-Artefakte (Meta-Kommentare über Überarbeitungen).
+# Alle Patterns werden zu einer Alternation verschmolzen -> ein Durchlauf
+# über den Artikel statt einer pro Pattern (keine Capture-Gruppen nötig,
+# ersetzt wird immer durch '')
+_POLISH_PATTERNS = (
+    # Überschriften-Zusätze in Klammern
+    r'\s*\(Abschnitt\s+(?:vervollständigt|ergänzt|überarbeitet|neu)\)',
+    r'\s*\((?:neu|ergänzt|überarbeitet|erweitert)(?:;[^)]+)?\)',
+    r'\s*\(zuvor\s+(?:fehlend|unvollständig|abstrakt)\)',
+    r'\s*\(praxisorientiert\s+ergänzt[^)]*\)',
+    r'\s*\(Hamburg[‑-]Bezug\s+geschärft\)',
+
+    # Meta-Sätze über Überarbeitungen (am Satzanfang)
+    r'(?:^|\n)Die\s+ursprüngliche\s+(?:Fassung|Version)\s+[^.]+\.\s*',
+    r'(?:^|\n)Der\s+ursprüngliche\s+Text\s+[^.]+\.\s*',
+    r'(?:^|\n)In\s+der\s+(?:ursprünglichen|vorherigen)\s+(?:Fassung|Version)\s+[^.]+\.\s*',
+    r'(?:^|\n)Dieser\s+Abschnitt\s+wurde\s+(?:überarbeitet|ergänzt|erweitert)[^.]*\.\s*',
+    r'(?:^|\n)Die\s+vorliegende\s+Überarbeitung\s+[^.]+\.\s*',
+
+    # Fettgedruckte Meta-Hinweise
+    r'\*\*Ergänzend[^*]+\*\*',
+    r'\*\*(?:Zur\s+)?(?:Behebung|Schließung)\s+der\s+(?:zuvor\s+)?kritisierten\s+(?:Lücke|Lücken)[^*]*\*\*',
+    r'\*\*(?:Neu|Ergänzt|Korrigiert)[^*]*\*\*:?\s*',
+
+    # Hinweise in Klammern im Fließtext
+    r'\s*\((?:siehe|vgl\.?)\s+(?:ursprüngliche|vorherige)\s+(?:Fassung|Version)\)',
+    r'\s*\((?:diese|jene)\s+Lücke\s+wurde\s+(?:geschlossen|behoben)\)',
+)
+_POLISH_RE = re.compile(
+    "|".join(f"(?:{p})" for p in _POLISH_PATTERNS),
+    re.IGNORECASE | re.MULTILINE
+)
+_MULTI_NEWLINE_RE = re.compile(r'\n{4,}')
+_SPACE_BEFORE_PUNCT_RE = re.compile(r'\s+([.,;:!?])')
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Max. Startpositionen für raw_decode (begrenzt den Aufwand bei Müll-Text)
+_RAW_DECODE_ATTEMPTS = 5
+
+
+def _decode_first_object(text: str) -> Any:
+    """
+    Dekodiert das erste gültige JSON-Objekt ab einer '{' im Text.
+    
+    Raises:
+        json.JSONDecodeError wenn keine der ersten Startpositionen passt
+    """
+    idx = text.find('{')
+    last_error = json.JSONDecodeError("Kein JSON-Objekt gefunden", text, 0)
+    for _ in range(_RAW_DECODE_ATTEMPTS):
+        if idx == -1:
+            break
+        try:
+            obj, _end = _JSON_DECODER.raw_decode(text, idx)
+            return obj
+        except json.JSONDecodeError as e:
+            last_error = e
+            idx = text.find('{', idx + 1)
+    raise last_error
+
+
+# Transiente Such-Fehler, bei denen sich ein erneuter Versuch lohnt
+_TRANSIENT_ERROR_RE = re.compile(
+    r"\b(429|500|502|503|504|529)\b|rate.?limit|too many requests|timeout|timed out|temporarily|overloaded",
+    re.IGNORECASE
 )
 
+# Transiente LLM-Fehler der SDKs (APITimeoutError ist jeweils eine
+# Unterklasse von APIConnectionError)
+_TRANSIENT_LLM_ERRORS = (
+    anthropic.APIConnectionError, anthropic.RateLimitError, anthropic.InternalServerError,
+    openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError,
+)
+
+
+def _is_transient_llm_error(exc: BaseException) -> bool:
+    """Lohnt sich ein erneuter LLM-Call? (SDK-Fehlertyp oder Fehlertext, z.B. Gemini)"""
+    return isinstance(exc, _TRANSIENT_LLM_ERRORS) or bool(_TRANSIENT_ERROR_RE.search(str(exc)))
+
+
+# Tool-Auswahl: ein Pattern mit einer benannten Gruppe je Tool. Die
+# Lookaheads werden in Alternativen-Reihenfolge geprüft, d.h. die Priorität
+# der Kategorien bleibt erhalten (nicht der früheste Treffer im Text gewinnt).
+_TOOL_RE = re.compile(
+    r"(?=.*?(?:studie|forschung|prozent|wissenschaft))(?P<semantic_scholar>)"
+    r"|(?=.*?(?:release|version|2024|2025|2026|aktuell))(?P<gnews>)"
+    r"|(?=.*?(?:erfahrung|vergleich|community|entwickler))(?P<hackernews>)",
+    re.IGNORECASE | re.DOTALL
+)
+
+
+# Hersteller-Domains (höhere Autorität, geringere Unabhängigkeit)
+_VENDOR_DOMAINS = ("servicenow.com", "microsoft.com", "google.com", "aws.amazon.com")
+_VENDOR_RE = re.compile("|".join(map(re.escape, _VENDOR_DOMAINS)), re.IGNORECASE)
+
+# Lookup-Tabelle für das regelbasierte Rating, indiziert mit is_vendor.
+# SourceRating ist frozen -> alle Quellen einer Klasse teilen eine Instanz
+_RATING_TABLE = (
+    SourceRating(authority=1, independence=2, recency=2, specificity=2, consensus=1),  # unabhängige Quelle
+    SourceRating(authority=2, independence=1, recency=2, specificity=2, consensus=1),  # Hersteller-Quelle
+)
+
+
+class _SafeFilenameTable(dict):
+    """
+    Übersetzungstabelle für str.translate: behält alphanumerische Zeichen
+    (inkl. Umlaute) sowie " -_", entfernt alles andere. Die Entscheidung
+    wird pro Codepoint einmal berechnet und dann gecacht.
+    """
+    
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        char = chr(codepoint)
+        value = codepoint if char.isalnum() or char in " -_" else None
+        self[codepoint] = value
+        return value
+
+
+_SAFE_FILENAME_TABLE = _SafeFilenameTable()
+
+
+# Mapping für Tier-Lookup (claim_miner -> orchestrator tier)
+_TIER_KEYS = {
+    "claim_miner": "orchestrator",
+    "writer": "writer",
+    "editor": "editor",
+    "verifier": "verifier",
+}
+
+# Mapping: Evidence-Gated Agent -> Config Agent Type
+_CONFIG_AGENT_TYPES = {
+    "claim_miner": "orchestrator",  # Kritische Analyse -> Orchestrator-Modell
+    "writer": "writer",
+    "editor": "editor",
+    "verifier": "verifier",
+}
+
+
+@lru_cache(maxsize=64)
+def _resolve_model(agent_type: str, tier: str, writer_provider: str) -> tuple[str, str]:
+    """
+    Löst (agent_type, tier, writer_provider) auf (model_name, provider) auf.
+    
+    Gecacht: die Modell-Konfiguration ändert sich zur Laufzeit nicht, die
+    Tiers einer Session stecken im Cache-Key.
+    """
+    # NEU: Writer-Provider Auswahl (OpenAI vs Gemini)
+    if agent_type == "writer" and writer_provider == "gemini":
+        # Gemini-Modelle für Writer
+        if tier == "premium":
+            return "gemini-3-pro-preview", "gemini"
+        else:
+            return "gemini-2.5-flash", "gemini"
+    
+    config_type = _CONFIG_AGENT_TYPES.get(agent_type, agent_type)
+    
+    try:
+        model_config = get_model_for_agent(config_type, tier)
+        return model_config.name, model_config.provider
+    except KeyError:
+        # Fallback
+        if tier == "premium":
+            return "claude-sonnet-4-5", "anthropic"
+        return "gpt-4o", "openai"
+
+
+@lru_cache(maxsize=8)
+def _article_stats(text: str) -> Dict[str, Any]:
+    """
+    Kennzahlen eines Artikelstands (Wörter, Quellenverweise, Pflichtabschnitte).
+    
+    Gecacht auf den Artikeltext: Editor, Revision und Abschluss fragen
+    denselben Stand mehrfach ab, gezählt wird nur einmal pro Fassung.
+    """
+    return {
+        "word_count": len(text.split()),
+        "ref_count": len(_REF_RE.findall(text)),
+        "has_exec_summary": _EXEC_SUMMARY_RE.search(text) is not None,
+        "has_limitations": "Limitation" in text,
+    }
+
+
+# Grobe Token-Schätzung ohne Tokenizer: Wortstücke bis 6 Zeichen plus
+# Satzzeichen. Lange deutsche Komposita zählen so mehrfach - näher an
+# BPE-Tokenizern als eine reine Zeichengrenze.
+_TOKEN_PIECE_RE = re.compile(r'\w{1,6}|[^\w\s]')
+
+
+@lru_cache(maxsize=8)
+def _truncate_for_editor(text: str, max_tokens: int) -> str:
+    """
+    Kürzt den Artikel auf ca. max_tokens (geschätzt) für den Editor-Prompt.
+    
+    Geschnitten wird am letzten Absatz vor der Grenze. Gecacht auf den
+    Artikeltext: unveränderte Fassungen werden nicht erneut gescannt.
+    """
+    for count, match in enumerate(_TOKEN_PIECE_RE.finditer(text), 1):
+        if count > max_tokens:
+            cut = match.start()
+            paragraph_end = text.rfind("\n\n", 0, cut)
+            return text[:paragraph_end if paragraph_end > cut // 2 else cut].rstrip()
+    return text
+
+
+# Claim-Mining-Prompt: einmal beim Import kompiliert, pro Lauf nur noch
+# substituiert. string.Template nutzt $-Platzhalter, die JSON-Klammern im
+# Beispiel brauchen daher kein Escaping.
+_CLAIM_MINING_PROMPT = Template("""Du bist ein Claim Mining Agent für wissenschaftliche Artikel.
+
+FRAGE: ${question}
+
+ZIEL-FORMAT: ${format_label} (${page_range} Seiten)
+
+AUFGABE: Erstelle ein ClaimRegister mit:
+1. QuestionBrief (präzisierte Frage)
+2. TermMap (Synonyme, Suchvarianten, Negative Keywords)
+3. Outline (Gliederung für ${page_range} Seiten)
+4. Claims (MINDESTENS ${min_claims} Claims, davon MINDESTENS ${min_c_claims} C-Claims!)
+
+CLAIM-TYPEN:
+- definition: "X ist ..."
+- mechanism: "X funktioniert so, dass ..."
+- comparison: "X unterscheidet sich von Y durch ..."
+- effect: "X führt zu ..."
+- quant: Zahlen, Prozente
+- temporal: Zeitangaben, Releases
+- normative: Empfehlungen
+
+EVIDENZKLASSEN:
+- A: Stabiles Wissen, keine Quelle nötig
+- B: 1 gute Quelle
+- C: 2+ unabhängige Quellen (für Zahlen, aktuelle Fakten!)
+
+WICHTIGE STRUKTUR-ANFORDERUNGEN:
+- Sektion 1 MUSS "Executive Summary / Management Summary" sein (2-3 Claims)
+- Jede weitere Sektion sollte 2-4 Claims haben
+- MINDESTENS ${min_sections} Sektionen für einen ${page_range} Seiten Artikel
+- Jeder B/C-Claim braucht ein retrieval_ticket mit 2-3 Queries!
+
+OUTPUT: NUR JSON, kein anderer Text!
+
+```json
+{
+  "question_brief": {
+    "core_question": "...",
+    "audience": "Fachexperten",
+    "tone": "wissenschaftlich",
+    "target_pages": ${target_pages},
+    "as_of_date": "${as_of_date}",
+    "freshness_priority": "high",
+    "scope_in": ["..."],
+    "scope_out": ["..."]
+  },
+  "term_map": {
+    "canonical_terms": ["Begriff1", "Begriff2"],
+    "synonyms": {"Begriff1": ["Syn1", "Syn2"]},
+    "negative_keywords": ["Falsche Treffer"],
+    "disambiguation_notes": ["Klärungen"],
+    "search_variants": {"Begriff1": ["Variante1", "Variante2"]}
+  },
+  "outline": {
+    "sections": [
+      {"number": "1", "title": "Executive Summary", "goal": "Kernaussagen kompakt", "expected_claim_ids": ["C-01", "C-02"], "estimated_pages": 1.0},
+      {"number": "2", "title": "...", "goal": "...", "expected_claim_ids": ["C-03", "C-04", "C-05"], "estimated_pages": 1.5}
+    ]
+  },
+  "claims": [
+    {
+      "claim_id": "C-01",
+      "claim_text": "...",
+      "claim_type": "definition",
+      "evidence_class": "A",
+      "section_id": "1",
+      "retrieval_ticket": null
+    },
+    {
+      "claim_id": "C-02",
+      "claim_text": "...",
+      "claim_type": "temporal",
+      "evidence_class": "C",
+      "freshness_required": true,
+      "section_id": "2",
+      "retrieval_ticket": {
+        "queries": ["Query 1", "Query 2", "Query 3"],
+        "min_sources": 2
+      }
+    }
+  ]
+}
+```""")
+
+
+# Kapitel-Prompt für das parallele Schreiben langer Formate (ein Call pro
+# Outline-Sektion). Titel, Executive Summary und Limitations entstehen
+# separat über _FRAME_WRITING_PROMPT. Der gemeinsame Teil (Regeln, Kernfrage,
+# Struktur) steht als *_STATIC_PROMPT vorn und wird über die parallelen
+# Calls hinweg vom Prompt-Caching der Provider wiederverwendet.
+_SECTION_STATIC_PROMPT = Template("""Du bist ein wissenschaftlicher Autor und schreibst EIN KAPITEL eines Expertenartikels.
+
+# STRIKTE SCHREIBREGELN
+- Es existieren NUR Quellen [1] bis [${max_source_idx}] - KEINE ANDEREN! ERFINDE KEINE Quellenreferenzen!
+- Setze Quellenverweise DIREKT nach der Aussage: "ServiceNow ist eine Cloud-Plattform [1]."
+- KEINE Claim-Anchors (C-01) im Text, kein "laut Quelle X" - nutze [X] Notation
+- Wenn du keine passende Quelle hast: Schreibe die Aussage OHNE Referenz oder lasse sie weg!
+- Wissenschaftlich, aber verständlich - ausführliche Fließtexte statt Aufzählungen
+- Beginne DIREKT mit der Kapitelüberschrift aus "DEIN KAPITEL", Unterkapitel mit "### [Titel]"
+- KEIN Artikeltitel, KEINE Executive Summary, KEINE Limitations - diese entstehen separat
+- Keine Verweise auf andere Kapitel ("wie im nächsten Kapitel ...")
+
+# KERNFRAGE
+${question}
+
+# GESAMTSTRUKTUR DES ARTIKELS (nur zur Einordnung)
+${outline}""")
+
+_SECTION_WRITING_PROMPT = Template("""# DEIN KAPITEL
+## ${number}. ${title}
+- Ziel: ${goal}
+- Umfang: MINDESTENS ${chapter_min} Wörter
+
+# VERWENDBARE CLAIMS MIT QUELLEN
+${claims}
+
+SCHREIBE JETZT DAS KAPITEL (beginnend mit "## ${number}. ${title}"):""")
+
+_FRAME_STATIC_PROMPT = Template("""Du bist ein wissenschaftlicher Autor. Die Kapitel eines Expertenartikels werden parallel geschrieben - du schreibst nur den Rahmenteil aus "DEINE AUFGABE".
+
+# REGELN
+- Es existieren NUR Quellen [1] bis [${max_source_idx}] - KEINE ANDEREN!
+- KEINE Claim-Anchors (C-01) im Text
+- Wissenschaftlich, aber verständlich
+- Schreibe NUR den geforderten Teil, keine weiteren Kapitel
+
+# KERNFRAGE
+${question}
+
+# ARTIKEL-STRUKTUR
+${outline}
+
+# VERWENDBARE CLAIMS MIT QUELLEN
+${claims}""")
+
+_FRAME_WRITING_PROMPT = Template("""# DEINE AUFGABE
+${task}
+
+SCHREIBE JETZT:""")
+
+# Invariante Schreibregeln des Writers (nur vom Format abhängig). Die
+# Session-Daten (Kernfrage, Claims, Quellen-Limit) folgen dahinter.
+_WRITER_STATIC_PROMPT = Template("""Du bist ein wissenschaftlicher Autor und schreibst einen Expertenartikel.
+
+# STRIKTE SCHREIBREGELN
+
+## 1. Quellenverweise (KRITISCH!)
+- Es existieren NUR die Quellen aus dem QUELLEN-LIMIT unten - KEINE ANDEREN!
+- ERFINDE KEINE Quellenreferenzen! Höhere Nummern als im QUELLEN-LIMIT existieren NICHT!
+- Setze Quellenverweise DIREKT nach der Aussage: "ServiceNow ist eine Cloud-Plattform [1]."
+- Bei mehreren Quellen: "Dies wird von mehreren Studien bestätigt [2][3][5]."
+- KEINE Claim-Anchors im Text! Die (C-01) etc. sind nur für dich zur Orientierung.
+- Wenn du keine passende Quelle hast: Schreibe die Aussage OHNE Referenz oder lasse sie weg!
+
+## 2. Artikellänge (KRITISCH!)
+- Ziel: ${words_min}-${words_max} Wörter (${target_pages} Seiten)
+- Executive Summary: ca. ${exec_summary_words} Wörter
+- Jedes Hauptkapitel: MINDESTENS ${chapter_min_words} Wörter
+- Ausführliche Erklärungen, Beispiele, Kontext!
+
+## 3. Struktur
+- Beginne mit "# [Titel]"
+- Dann "## Executive Summary" (PFLICHT!)
+- Dann die weiteren Kapitel gemäß Outline
+- Jedes Kapitel mit "## [Nummer]. [Titel]"
+- Unterkapitel mit "### [Titel]" wenn sinnvoll
+
+## 4. Stil
+- Wissenschaftlich, aber verständlich
+- Konkrete Beispiele und Anwendungsfälle
+- Kritische Einordnung wo angebracht
+- Am Ende: "## Limitations" Abschnitt
+
+## 5. VERBOTEN
+- Keine erfundenen Fakten ohne Quelle
+- Keine Claim-Anchors (C-01) im finalen Text
+- Kein "laut Quelle X" - nutze [X] Notation
+- Keine Aufzählungen als Hauptinhalt - ausführliche Fließtexte!""")
+
+# Invariante Prüfkriterien des Editors (nur vom Format abhängig). Quellen,
+# Statistiken und Artikel folgen dahinter und ändern sich pro Runde.
+_EDITOR_STATIC_PROMPT = Template("""Du bist ein kritischer Editor für wissenschaftliche Fachartikel.
+
+# ZIEL-FORMAT: ${format_label} (${words_min}-${words_max} Wörter)
+
+# PRÜFKRITERIEN
+
+WICHTIG: Prüfe NUR den Text unter "ARTIKEL ZU PRÜFEN"! 
+Ignoriere Claims die nicht im Artikel vorkommen - wenn etwas nicht im Artikel steht, ist es KEIN Problem!
+
+## 1. Länge (KRITISCH!)
+- ZIEL: ${words_min}-${words_max} Wörter (${format_label})
+- Aktuell: siehe ARTIKEL-STATISTIKEN
+- Bei < ${editor_min_words}: verdict = "revise"
+
+## 2. Quellenreferenzierung
+- Sind Quellen [1], [2], etc. im Text referenziert?
+- Werden verschiedene Quellen genutzt (nicht nur [1]-[3])?
+- Aktuell: siehe ARTIKEL-STATISTIKEN
+
+## 3. Struktur
+- Hat der Artikel eine Executive Summary?
+- Sind alle Kapitel ausreichend ausgeführt (nicht nur 2-3 Sätze)?
+- Gibt es einen Limitations-Abschnitt?
+
+## 4. Inhaltliche Qualität
+- Werden die Kernfragen beantwortet?
+- Sind die Informationen konsistent?
+- Gibt es Lücken oder fehlende wichtige Aspekte?
+
+## 5. HALLUZINATIONS-CHECK (KRITISCH!)
+- Prüfe NUR Aussagen die TATSÄCHLICH IM ARTIKEL STEHEN!
+- Wenn eine Behauptung NICHT im Artikel vorkommt → KEIN Issue melden!
+- Prüfe: Welche Faktenbehauptungen im Artikel haben KEINE Quellenreferenz [X]?
+- Vergleiche Aussagen im Artikel mit den VERFÜGBAREN QUELLEN
+- Wenn der Artikel Fakten behauptet die NICHT durch eine der Quellen gedeckt sind → type="hallucination"
+- Besonders kritisch: Zahlen, Statistiken, Zitate ohne [X]-Referenz
+- NICHT prüfen: Dinge die "fehlen" oder "nicht erwähnt werden" - das ist KEIN Halluzinations-Problem!
+
+# OUTPUT-FORMAT (JSON!)
+
+Antworte NUR mit diesem JSON (keine weitere Erklärung):
+
+```json
+{
+  "verdict": "approved|revise|research",
+  "confidence": 0.0-1.0,
+  "summary": "Kurze Zusammenfassung der Bewertung",
+  "issues": [
+    {
+      "type": "length|sources|structure|content_gap|hallucination",
+      "description": "Was ist das Problem?",
+      "severity": "critical|major|minor",
+      "location": "Abschnitt/Satz wo das Problem ist (bei hallucination)",
+      "suggested_action": "revise|research|remove",
+      "research_query": "Falls research nötig: Suchquery"
+    }
+  ]
+}
+```
+
+WICHTIG: 
+- "approved" NUR wenn Artikel im Zielbereich UND gute Quellenreferenzierung UND vollständige Struktur UND keine Halluzinationen
+- "revise" bei Strukturproblemen, zu kurz, oder stilistischen Issues
+- "research" NUR wenn GENERELLE Informationen fehlen (z.B. "Was ist X?" ohne Erklärung)
+
+HALLUZINATIONS-BEHANDLUNG (KRITISCH!):
+- Bei SPEZIFISCHEN ZAHLEN ohne Beleg (z.B. "72 Punkte", "unter 20 FPS", "150 Mitarbeiter") → suggested_action = "remove"
+- Bei KONKRETEN STATISTIKEN ohne Quelle → suggested_action = "remove"  
+- Bei ZITATEN ohne Beleg → suggested_action = "remove"
+- NUR bei ALLGEMEINEN Aussagen die ergänzbar sind → suggested_action = "research"
+- STANDARD für hallucination sollte "remove" sein, nicht "research"!""")
+
+
+# Invariante Überarbeitungsanleitung für den Writer - steht vor Feedback
+# und Artikel, damit wiederholte Revisionsrunden den gecachten Präfix treffen.
+_REVISION_STATIC_PROMPT = """Du bist ein erfahrener wissenschaftlicher Lektor. Deine Aufgabe ist eine GEZIELTE ÜBERARBEITUNG.
+
+# ÜBERARBEITUNGSANLEITUNG
+
+## Dein Auftrag
+Behebe EXAKT die Probleme aus dem EDITOR-FEEDBACK. Nicht mehr, nicht weniger.
+
+## Issue-spezifische Maßnahmen
+- "sources": Füge an den kritisierten Stellen fehlende Quellenverweise [X] ein
+- "structure": Ergänze konkret die fehlenden Abschnitte (z.B. Executive Summary, Limitations)
+- "content_gap": Vertiefe GENAU die genannten Themen mit den neuen Quellen
+- "consistency": Korrigiere PRÄZISE die genannten Widersprüche
+- "length": Erweitere die KONKRET kritisierten dünnen Passagen
+
+## HALLUZINATIONS-BEHANDLUNG (KRITISCH - LIES DAS GENAU!)
+
+### Bei action "remove": KOMPLETTE LÖSCHUNG!
+**WICHTIG:** "remove" bedeutet den GESAMTEN SATZ LÖSCHEN, nicht nur die Zahlen ersetzen!
+
+FALSCH:
+- "Studien zeigen 30-55% Produktivitätssteigerung" → "Studien diskutieren Produktivitätssteigerung"
+- Das ist KEINE Löschung, das ist eine Abschwächung! Der Editor wird das WIEDER finden!
+
+RICHTIG:
+- "Studien zeigen 30-55% Produktivitätssteigerung" → SATZ KOMPLETT STREICHEN
+- Der Satz verschwindet aus dem Artikel, keine weichere Version!
+
+### Konkrete Regeln für "remove":
+1. Finde den GANZEN SATZ der die unbelegte Behauptung enthält
+2. LÖSCHE den Satz KOMPLETT aus dem Artikel
+3. Wenn nötig, passe den Übergang zum nächsten Satz an
+4. KEINE "softeren" Formulierungen wie "Es wird diskutiert...", "Berichte deuten an..."
+
+### WICHTIG: Abschnitte NICHT leer lassen!
+Nach dem Löschen von Halluzinationen:
+- Prüfe ob der Abschnitt noch genug Inhalt hat (mind. 2-3 Absätze)
+- Wenn ein Abschnitt fast leer wird: Fülle ihn mit BELEGTEN Informationen aus den verfügbaren Quellen
+- Nutze Fakten aus dem Quellenmaterial die zum Abschnittsthema passen
+- Jeder neue Satz MUSS eine Quellenreferenz [X] haben
+- Lieber kürzere, belegte Abschnitte als leere Überschriften!
+
+### Bei action "research": 
+- Ergänze Quellenreferenz [X] NUR wenn die neue Quelle EXAKT diese Behauptung belegt
+- Wenn neue Quelle andere Zahlen nennt → passe die Zahl im Artikel an die Quelle an!
+- Wenn keine passende Quelle gefunden wurde → behandle wie "remove"!
+
+## Qualitätsprinzipien
+1. CHIRURGISCHE PRÄZISION: Ändere nur, was kritisiert wurde
+2. KONTEXT BEWAHREN: Bestehende gute Passagen bleiben unverändert
+3. QUELLENINTEGRITÄT: Alle [X]-Verweise müssen erhalten bleiben
+4. VOLLSTÄNDIGKEIT: Gib den GESAMTEN Artikel zurück (nicht nur Änderungen)
+
+## KRITISCH - KEINE META-KOMMENTARE!
+Der finale Artikel ist für LESER bestimmt, NICHT für Editoren. Daher:
+- KEINE Hinweise auf "ursprüngliche Fassung" oder "vorherige Version"
+- KEINE Kommentare wie "(Abschnitt vervollständigt)", "(neu)", "(ergänzt)"
+- KEINE Erklärungen wie "Dieser Abschnitt wurde überarbeitet weil..."
+- KEINE Metainformationen über den Überarbeitungsprozess
+- Der Leser darf NICHT merken, dass der Text überarbeitet wurde
+- Schreibe so, als wäre es die ERSTE und EINZIGE Version
+
+## WICHTIG
+- Keine proaktiven "Verbesserungen" an Stellen ohne Kritik
+- Kein Fülltext - jede Ergänzung muss einen Issue adressieren
+- Der wissenschaftliche Ton bleibt durchgehend sachlich"""
+
+
+def _flat_prompt(prompt: str, static_prefix: str = "") -> str:
+    """Statischer Präfix und dynamischer Teil als ein String."""
+    return f"{static_prefix}\n\n{prompt}" if static_prefix else prompt
+
+
+def _llm_messages(prompt: str, static_prefix: str, provider: str) -> List[Dict[str, Any]]:
+    """
+    Baut die User-Message mit dem statischen Prompt-Teil vorn.
+    
+    Anthropic cacht nur explizit markierte Blöcke (cache_control), OpenAI
+    cacht gleiche Präfixe ab 1024 Tokens automatisch - dort genügt die
+    Reihenfolge.
+    """
+    if static_prefix and provider == "anthropic":
+        content = [
+            {"type": "text", "text": static_prefix, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": prompt}
+        ]
+        return [{"role": "user", "content": content}]
+    return [{"role": "user", "content": _flat_prompt(prompt, static_prefix)}]
+
 
 class EvidenceGatedOrchestrator:
     """
@@ -36,6 +637,49 @@ class EvidenceGatedOrchestrator:
     
     MAX_GAP_LOOPS = 2
     
+    # Unter dieser Claim-Zahl (bei ungültigem Register) bricht process() ab
+    MIN_CLAIMS = 5
+    
+    # Parallel recherchierte Claims in Phase 3-4
+    RETRIEVAL_WORKERS = 8
+    
+    # Max. gleichzeitige Such-Aufrufe pro Tool in Phase 3-4
+    # (Rate-Limits der Provider; nicht gelistete Tools nutzen den Default)
+    TOOL_CONCURRENCY = {
+        "tavily": 5,
+        "semantic_scholar": 2,
+        "gnews": 3,
+        "hackernews": 4,
+    }
+    DEFAULT_TOOL_CONCURRENCY = 4
+    
+    # Wiederholungen bei transienten Such-Fehlern (Rate-Limit, 5xx, Timeout)
+    RETRIEVAL_MAX_ATTEMPTS = 3
+    
+    # Wiederholungen bei transienten LLM-Fehlern: exponentielles Backoff
+    # mit Jitter zwischen LLM_RETRY_MIN_DELAY und LLM_RETRY_MAX_DELAY Sekunden
+    LLM_MAX_ATTEMPTS = 3
+    LLM_RETRY_MIN_DELAY = 2.0
+    LLM_RETRY_MAX_DELAY = 30.0
+    
+    # Zwischenstand beim Claim-Streaming alle N Claims
+    CLAIM_PROGRESS_STEP = 5
+    
+    # Zwischenstand beim Streaming von Editor/Revision alle N Zeichen
+    STREAM_PROGRESS_CHARS = 4000
+    
+    # Artikel-Auszug für den Editor (geschätzte Tokens, ca. 40.000 Zeichen)
+    EDITOR_ARTICLE_MAX_TOKENS = 10000
+    
+    # Abschnittsweise Revision: nur lokal zuordenbare Issue-Typen, und nur
+    # solange die betroffenen Abschnitte höchstens diesen Anteil ausmachen
+    SECTION_REVISION_TYPES = frozenset({"hallucination", "sources", "content_gap", "consistency"})
+    SECTION_REVISION_MAX_SHARE = 0.5
+    
+    # Paralleles Schreiben der Kapitel (nur Formate mit "section_fanout")
+    SECTION_WRITE_CONCURRENCY = 4
+    SECTION_MAX_TOKENS = 6000
+    
     # Format-Spezifikationen für unterschiedliche Artikellängen
     # Enthält jetzt auch min_claims und min_c_claims pro Format
     FORMAT_SPECS = {
@@ -48,7 +692,8 @@ class EvidenceGatedOrchestrator:
             "min_claims": 10,
             "min_c_claims": 3,
             "min_sections": 4,
-            "label": "Kompakte Übersicht"
+            "label": "Kompakte Übersicht",
+            "section_fanout": False
         },
         "article": {
             "target_pages": 8,
@@ -59,7 +704,8 @@ class EvidenceGatedOrchestrator:
             "min_claims": 15,
             "min_c_claims": 5,
             "min_sections": 6,
-            "label": "Standard-Artikel"
+            "label": "Standard-Artikel",
+            "section_fanout": False
         },
         "report": {
             "target_pages": 12,
@@ -70,7 +716,8 @@ class EvidenceGatedOrchestrator:
             "min_claims": 20,
             "min_c_claims": 7,
             "min_sections": 8,
-            "label": "Umfassender Report"
+            "label": "Umfassender Report",
+            "section_fanout": True
         },
         "deep_dive": {
             "target_pages": 18,
@@ -81,7 +728,8 @@ class EvidenceGatedOrchestrator:
             "min_claims": 30,
             "min_c_claims": 10,
             "min_sections": 10,
-            "label": "Deep-Dive Analyse"
+            "label": "Deep-Dive Analyse",
+            "section_fanout": True
         }
     }
     
@@ -89,13 +737,28 @@ class EvidenceGatedOrchestrator:
         self.tiers = tiers or {}
         self.logger: Optional[SessionLogger] = None
         self.mcp = get_mcp_server()
+        self.search_cache = get_search_cache()  # None wenn deaktiviert
+        self.llm_cache = get_llm_cache()  # None wenn deaktiviert
+        
+        # Retrieval-Worker teilen sich Such-Dedup und Tool-Semaphoren
+        self._search_lock = threading.Lock()
+        self._search_futures: Dict[tuple[str, str], Future] = {}
+        self._tool_sems: Dict[str, threading.BoundedSemaphore] = {}
         
         # State
         self.claim_register: Optional[ClaimRegister] = None
         self.evidence_packs: Dict[str, EvidencePack] = {}
         self.article: str = ""
         self.source_index: Dict[str, int] = {}  # URL -> Nummer für konsistente Referenzierung
+        self._url_to_source: Dict[str, Source] = {}  # URL -> erste Quelle mit dieser URL
+        self._idx_to_url: Dict[int, str] = {}  # Umkehrung von source_index
+        self._sources_by_claim: Dict[str, List[Dict[str, Any]]] = {}  # Claim-ID -> Writer-Einträge
+        self._next_source_idx = 1  # nächste freie Quellennummer (Nachrecherche)
         self.format: str = "report"  # Default-Format
+        
+        # Workflow-Startzeit (einmal pro Lauf, für Stand-Datum und Dateinamen)
+        self._started_at: datetime = datetime.now()
+        self._as_of: str = self._started_at.date().isoformat()
     
     def _get_model(self, agent_type: str) -> tuple[str, str]:
         """
@@ -107,97 +770,58 @@ class EvidenceGatedOrchestrator:
         Returns:
             (model_name, provider)
         """
-        # Mapping für Tier-Lookup (claim_miner -> orchestrator tier)
-        tier_mapping = {
-            "claim_miner": "orchestrator",
-            "writer": "writer",
-            "editor": "editor",
-            "verifier": "verifier",
-        }
-        tier_key = tier_mapping.get(agent_type, agent_type)
-        tier = self.tiers.get(tier_key, "premium")
-        
-        # NEU: Writer-Provider Auswahl (OpenAI vs Gemini)
-        if agent_type == "writer":
-            writer_provider = self.tiers.get("writerProvider", "openai")
-            if writer_provider == "gemini":
-                # Gemini-Modelle für Writer
-                if tier == "premium":
-                    return "gemini-3-pro-preview", "gemini"
-                else:
-                    return "gemini-2.5-flash", "gemini"
-        
-        # Mapping: Evidence-Gated Agent -> Config Agent Type
-        type_mapping = {
-            "claim_miner": "orchestrator",  # Kritische Analyse -> Orchestrator-Modell
-            "writer": "writer",
-            "editor": "editor",
-            "verifier": "verifier",
-        }
-        
-        config_type = type_mapping.get(agent_type, agent_type)
-        
-        try:
-            model_config = get_model_for_agent(config_type, tier)
-            return model_config.name, model_config.provider
-        except KeyError:
-            # Fallback
-            if tier == "premium":
-                return "claude-sonnet-4-5", "anthropic"
-            return "gpt-4o", "openai"
+        tier = self.tiers.get(_TIER_KEYS.get(agent_type, agent_type), "premium")
+        writer_provider = self.tiers.get("writerProvider", "openai") if agent_type == "writer" else ""
+        return _resolve_model(agent_type, tier, writer_provider)
     
 
     def _parse_json_robust(self, text: str, context: str = "") -> dict:
         """
         Robustes JSON-Parsing mit mehreren Fallback-Strategien.
         
+        Schnellpfad: Text ist bereits reines JSON (z.B. OpenAI json_object-Modus).
+        
         Strategien:
         1. ```json ... ``` Block
         2. ``` ... ``` Block (ohne json Tag)
-        3. Erstes { ... } im Text finden
+        3. Erstes { ... } im Text per raw_decode
         4. Text bereinigen und erneut versuchen
         """
-        import json
-        import re
-        
-        strategies = []
-        
-        # Strategie 1: ```json ... ``` Block
-        match1 = re.search(r'```json\s*([\s\S]*?)```', text)
-        if match1:
-            strategies.append(("json_block", match1.group(1).strip()))
-        
-        # Strategie 2: ``` ... ``` Block (ohne json)
-        match2 = re.search(r'```\s*([\s\S]*?)```', text)
-        if match2:
-            strategies.append(("code_block", match2.group(1).strip()))
-        
-        # Strategie 3: Erstes { ... } finden (greedy für verschachtelte Objekte)
-        # Finde die Position des ersten {
-        first_brace = text.find('{')
-        if first_brace != -1:
-            # Zähle Klammern um das Ende zu finden
-            depth = 0
-            end_pos = first_brace
-            for i, char in enumerate(text[first_brace:], start=first_brace):
-                if char == '{':
-                    depth += 1
-                elif char == '}':
-                    depth -= 1
-                    if depth == 0:
-                        end_pos = i + 1
-                        break
-            if end_pos > first_brace:
-                strategies.append(("brace_match", text[first_brace:end_pos]))
-        
-        # Strategie 4: Ganzer Text (falls es reines JSON ist)
-        strategies.append(("raw_text", text.strip()))
+        # Schnellpfad: reines JSON ohne Markdown/Prosa direkt parsen
+        stripped = text.strip()
+        if stripped[:1] in ('{', '['):
+            try:
+                return _json_loads(stripped)
+            except json.JSONDecodeError:
+                pass
+        
+        # Strategien werden lazy erzeugt: greift der ```json Block,
+        # entfallen raw_decode und weitere Regex-Durchläufe komplett
+        def strategies():
+            # Strategie 1: ```json ... ``` Block
+            if '```' in text:
+                match1 = _JSON_BLOCK_RE.search(text)
+                if match1:
+                    yield "json_block", match1.group(1).strip()
+                
+                # Strategie 2: ``` ... ``` Block (ohne json)
+                match2 = _CODE_BLOCK_RE.search(text)
+                if match2:
+                    yield "code_block", match2.group(1).strip()
+            
+            # Strategie 3: Erstes { ... } per raw_decode (C-Parser, beachtet
+            # Klammern in Strings) - liefert direkt das Objekt
+            if '{' in text:
+                yield "raw_decode", None
+            
+            # Strategie 4: Ganzer Text (falls es reines JSON ist)
+            yield "raw_text", stripped
         
         # Versuche alle Strategien
         last_error = None
-        for strategy_name, json_str in strategies:
+        for strategy_name, json_str in strategies():
             try:
-                data = json.loads(json_str)
+                data = _decode_first_object(text) if json_str is None else _json_loads(json_str)
                 # Erfolg! Logge welche Strategie funktioniert hat
                 if strategy_name != "json_block":
                     print(f"[{context}] JSON parsed mit Strategie: {strategy_name}")
@@ -232,6 +856,10 @@ class EvidenceGatedOrchestrator:
         self.format = format if format in self.FORMAT_SPECS else "report"
         format_spec = self.FORMAT_SPECS[self.format]
         
+        # Startzeit einmal festhalten (kein Datumssprung bei Läufen über Mitternacht)
+        self._started_at = datetime.now()
+        self._as_of = self._started_at.date().isoformat()
+        
         # Logger initialisieren
         self.logger = SessionLogger(
             question=question,
@@ -263,10 +891,12 @@ class EvidenceGatedOrchestrator:
             self.claim_register = claim_register
             
             # Validierung
-            validation = claim_register.validate()
+            validation = claim_register.validation
+            stats = validation["stats"]
+            total_claims = stats["total_claims"]
             
             # === KRITISCHER CHECK: Ohne Claims kein Artikel! ===
-            if validation['stats']['total_claims'] == 0:
+            if total_claims == 0:
                 error_msg = "❌ KRITISCHER FEHLER: ClaimMiner hat 0 Claims generiert. " \
                            "Ohne Claims kann kein wissenschaftlicher Artikel erstellt werden. " \
                            "Bitte erneut versuchen."
@@ -290,9 +920,9 @@ class EvidenceGatedOrchestrator:
                     content=f"⚠️ ClaimRegister: {'; '.join(validation['issues'])}"
                 )
                 # Bei zu wenigen Claims trotzdem abbrechen
-                if validation['stats']['total_claims'] < 5:
-                    error_msg = f"❌ Zu wenige Claims ({validation['stats']['total_claims']}). " \
-                               f"Mindestens 5 Claims erforderlich für einen Artikel."
+                if total_claims < self.MIN_CLAIMS:
+                    error_msg = f"❌ Zu wenige Claims ({total_claims}). " \
+                               f"Mindestens {self.MIN_CLAIMS} Claims erforderlich für einen Artikel."
                     yield AgentEvent(
                         event_type=EventType.ERROR,
                         agent_name="Orchestrator",
@@ -308,9 +938,9 @@ class EvidenceGatedOrchestrator:
                 yield AgentEvent(
                     event_type=EventType.STATUS,
                     agent_name="Orchestrator",
-                    content=f"✅ {validation['stats']['total_claims']} Claims "
-                            f"(A:{validation['stats']['a_claims']}, B:{validation['stats']['b_claims']}, "
-                            f"C:{validation['stats']['c_claims']})"
+                    content=f"✅ {total_claims} Claims "
+                            f"(A:{stats['a_claims']}, B:{stats['b_claims']}, "
+                            f"C:{stats['c_claims']})"
                 )
             
             # ===== PHASE 3-4: Evidence Planning & Retrieval =====
@@ -320,10 +950,9 @@ class EvidenceGatedOrchestrator:
                 content="🔍 Phase 3-4/8: Targeted Retrieval..."
             )
             
-            yield from self._phase_3_4_retrieval()
+            total_sources = yield from self._phase_3_4_retrieval()
             
             # === CHECK: Wurden genug Quellen gefunden? ===
-            total_sources = sum(len(ep.sources) for ep in self.evidence_packs.values())
             if total_sources == 0:
                 error_msg = "❌ KRITISCHER FEHLER: Keine Quellen gefunden. " \
                            "Ohne Quellen kann kein wissenschaftlicher Artikel erstellt werden. " \
@@ -347,14 +976,14 @@ class EvidenceGatedOrchestrator:
                 )
             
             # ===== PHASE 5: Evidence Rating =====
+            # Das Rating läuft überlappend zum Writer-LLM-Call in Phase 6
+            # (der Writer braucht nur den Quellen-Index, nicht die Ratings)
             yield AgentEvent(
                 event_type=EventType.STATUS,
                 agent_name="Orchestrator",
                 content="⚖️ Phase 5/8: Evidence Rating..."
             )
             
-            yield from self._phase_5_rating()
-            
             # ===== Quellen-Index aufbauen für konsistente Referenzierung =====
             self._build_source_index()
             
@@ -395,7 +1024,7 @@ class EvidenceGatedOrchestrator:
                             agent_name="Editor",
                             content=f"🔍 Nachrecherche erforderlich..."
                         )
-                        yield from self._handle_research_gaps(verdict)
+                        total_sources += yield from self._handle_research_gaps(verdict)
                         # Danach Revision
                         self.article = yield from self._revise_article(verdict)
                     
@@ -434,7 +1063,7 @@ class EvidenceGatedOrchestrator:
             
             self.logger.complete(
                 article_path=article_path,
-                article_words=len(self.article.split())
+                article_words=_article_stats(self.article)["word_count"]
             )
             
             yield AgentEvent(
@@ -450,8 +1079,8 @@ class EvidenceGatedOrchestrator:
                 data={
                     "article_path": article_path,
                     "mode": "evidence_gated",
-                    "claims_total": len(self.claim_register.claims),
-                    "sources_total": sum(len(p.sources) for p in self.evidence_packs.values()),
+                    "claims_total": total_claims,
+                    "sources_total": total_sources,
                     "article_length": len(self.article),
                     "log_file": self.logger.get_log_filename()
                 }
@@ -502,216 +1131,68 @@ class EvidenceGatedOrchestrator:
             content=f"⛏️ Mining Claims mit {model_name} (Format: {format_spec['label']})..."
         )
         
-        prompt = f"""Du bist ein Claim Mining Agent für wissenschaftliche Artikel.
-
-FRAGE: {question}
-
-ZIEL-FORMAT: {format_spec['label']} ({page_range} Seiten)
-
-AUFGABE: Erstelle ein ClaimRegister mit:
-1. QuestionBrief (präzisierte Frage)
-2. TermMap (Synonyme, Suchvarianten, Negative Keywords)
-3. Outline (Gliederung für {page_range} Seiten)
-4. Claims (MINDESTENS {min_claims} Claims, davon MINDESTENS {min_c_claims} C-Claims!)
-
-CLAIM-TYPEN:
-- definition: "X ist ..."
-- mechanism: "X funktioniert so, dass ..."
-- comparison: "X unterscheidet sich von Y durch ..."
-- effect: "X führt zu ..."
-- quant: Zahlen, Prozente
-- temporal: Zeitangaben, Releases
-- normative: Empfehlungen
-
-EVIDENZKLASSEN:
-- A: Stabiles Wissen, keine Quelle nötig
-- B: 1 gute Quelle
-- C: 2+ unabhängige Quellen (für Zahlen, aktuelle Fakten!)
-
-WICHTIGE STRUKTUR-ANFORDERUNGEN:
-- Sektion 1 MUSS "Executive Summary / Management Summary" sein (2-3 Claims)
-- Jede weitere Sektion sollte 2-4 Claims haben
-- MINDESTENS {min_sections} Sektionen für einen {page_range} Seiten Artikel
-- Jeder B/C-Claim braucht ein retrieval_ticket mit 2-3 Queries!
-
-OUTPUT: NUR JSON, kein anderer Text!
-
-```json
-{{
-  "question_brief": {{
-    "core_question": "...",
-    "audience": "Fachexperten",
-    "tone": "wissenschaftlich",
-    "target_pages": {target_pages},
-    "as_of_date": "{date.today().isoformat()}",
-    "freshness_priority": "high",
-    "scope_in": ["..."],
-    "scope_out": ["..."]
-  }},
-  "term_map": {{
-    "canonical_terms": ["Begriff1", "Begriff2"],
-    "synonyms": {{"Begriff1": ["Syn1", "Syn2"]}},
-    "negative_keywords": ["Falsche Treffer"],
-    "disambiguation_notes": ["Klärungen"],
-    "search_variants": {{"Begriff1": ["Variante1", "Variante2"]}}
-  }},
-  "outline": {{
-    "sections": [
-      {{"number": "1", "title": "Executive Summary", "goal": "Kernaussagen kompakt", "expected_claim_ids": ["C-01", "C-02"], "estimated_pages": 1.0}},
-      {{"number": "2", "title": "...", "goal": "...", "expected_claim_ids": ["C-03", "C-04", "C-05"], "estimated_pages": 1.5}}
-    ]
-  }},
-  "claims": [
-    {{
-      "claim_id": "C-01",
-      "claim_text": "...",
-      "claim_type": "definition",
-      "evidence_class": "A",
-      "section_id": "1",
-      "retrieval_ticket": null
-    }},
-    {{
-      "claim_id": "C-02",
-      "claim_text": "...",
-      "claim_type": "temporal",
-      "evidence_class": "C",
-      "freshness_required": true,
-      "section_id": "2",
-      "retrieval_ticket": {{
-        "queries": ["Query 1", "Query 2", "Query 3"],
-        "min_sources": 2
-      }}
-    }}
-  ]
-}}
-```"""
-
-        # === LOGGING: Start ClaimMiner Step ===
-        step_idx = self.logger.start_step(
-            agent="ClaimMiner",
-            model=model_name,
-            provider=provider,
-            tier=tier,
-            action="claim_mining",
-            task=f"Erstelle ClaimRegister für: {question[:80]}..."
+        prompt = _CLAIM_MINING_PROMPT.substitute(
+            question=question,
+            format_label=format_spec['label'],
+            page_range=page_range,
+            min_claims=min_claims,
+            min_c_claims=min_c_claims,
+            min_sections=min_sections,
+            target_pages=target_pages,
+            as_of_date=self._as_of
         )
-        
+
         try:
-            # Provider-spezifischer API-Aufruf
-            if provider == "anthropic":
-                from anthropic import Anthropic
-                from config import ANTHROPIC_API_KEY
-                
-                client = Anthropic(api_key=ANTHROPIC_API_KEY)
-                response = client.messages.create(
-                    model=model_name,
-                    max_tokens=8000,
-                    messages=[{"role": "user", "content": prompt}]
-                )
-                result_text = response.content[0].text
-                tokens = {
-                    "input": response.usage.input_tokens if hasattr(response, 'usage') else 0,
-                    "output": response.usage.output_tokens if hasattr(response, 'usage') else 0
-                }
-            else:
-                from openai import OpenAI
-                from config import OPENAI_API_KEY
-                
-                client = OpenAI(api_key=OPENAI_API_KEY)
-                response = client.chat.completions.create(
-                    model=model_name,
-                    messages=[{"role": "user", "content": prompt}],
-                    max_completion_tokens=8000
-                )
-                result_text = response.choices[0].message.content
-                tokens = {
-                    "input": response.usage.prompt_tokens if hasattr(response, 'usage') else 0,
-                    "output": response.usage.completion_tokens if hasattr(response, 'usage') else 0
-                }
-            
-            # JSON parsen - ROBUST mit mehreren Strategien
-            data = self._parse_json_robust(result_text, "ClaimMiner")
-            
-            # QuestionBrief
-            qb_data = data.get("question_brief", {})
-            question_brief = QuestionBrief(
-                core_question=qb_data.get("core_question", question),
-                original_question=question,
-                audience=qb_data.get("audience", "Fachexperten"),
-                tone=qb_data.get("tone", "wissenschaftlich"),
-                target_pages=qb_data.get("target_pages", 12),
-                as_of_date=qb_data.get("as_of_date", date.today().isoformat()),
-                freshness_priority=qb_data.get("freshness_priority", "high"),
-                scope_in=qb_data.get("scope_in", []),
-                scope_out=qb_data.get("scope_out", [])
-            )
-            
-            # TermMap
-            tm_data = data.get("term_map", {})
-            term_map = TermMap(
-                canonical_terms=tm_data.get("canonical_terms", []),
-                synonyms=tm_data.get("synonyms", {}),
-                negative_keywords=tm_data.get("negative_keywords", []),
-                disambiguation_notes=tm_data.get("disambiguation_notes", []),
-                search_variants=tm_data.get("search_variants", {})
-            )
-            
-            # Outline
-            outline_data = data.get("outline", {})
-            sections = []
-            for s in outline_data.get("sections", []):
-                sections.append(OutlineSection(
-                    number=s.get("number", ""),
-                    title=s.get("title", ""),
-                    goal=s.get("goal", ""),
-                    expected_claim_ids=s.get("expected_claim_ids", []),
-                    estimated_pages=s.get("estimated_pages", 1.0)
-                ))
-            outline = Outline(sections=sections)
-            
-            # Claims
-            claims = []
-            for c in data.get("claims", []):
-                ticket_data = c.get("retrieval_ticket")
-                ticket = None
-                if ticket_data:
-                    ticket = RetrievalTicket(
-                        queries=ticket_data.get("queries", []),
-                        min_sources=ticket_data.get("min_sources", 1),
-                        preferred_domains=ticket_data.get("preferred_domains", []),
-                        excluded_domains=ticket_data.get("excluded_domains", [])
+            with self.logger.step(
+                agent="ClaimMiner",
+                model=model_name,
+                provider=provider,
+                tier=tier,
+                action="claim_mining",
+                task=f"Erstelle ClaimRegister für: {question[:80]}..."
+            ) as step:
+                # Gleicher Prompt (inkl. Stichtag) an dasselbe Modell -> gecachte Antwort
+                cached = self.llm_cache.get(model_name, 8000, prompt) if self.llm_cache else None
+                if cached:
+                    result_text = cached["text"]
+                    tokens = cached["tokens"]
+                else:
+                    # Gestreamter API-Aufruf mit Zwischenständen pro empfangenem Claim
+                    result_text, tokens = yield from self._with_llm_retry(
+                        lambda: self._stream_claim_mining(prompt, model_name, provider, max_tokens=8000),
+                        agent_name="ClaimMiner"
                     )
                 
-                claims.append(Claim(
-                    claim_id=c.get("claim_id", f"C-{len(claims)+1:02d}"),
-                    claim_text=c.get("claim_text", ""),
-                    claim_type=ClaimType(c.get("claim_type", "definition")),
-                    evidence_class=EvidenceClass(c.get("evidence_class", "B")),
-                    freshness_required=c.get("freshness_required", False),
-                    section_id=c.get("section_id", ""),
-                    retrieval_ticket=ticket
-                ))
-            
-            # === LOGGING: End ClaimMiner Step (Success) ===
-            self.logger.end_step(
-                step_idx,
-                status="success",
-                tokens=tokens,
-                result_length=len(result_text),
-                details={
+                # JSON parsen + Register bauen (reine CPU-Arbeit, kein I/O)
+                register = self._parse_claim_register(result_text, question)
+                
+                # Nur brauchbare Register cachen - Antworten, bei denen process()
+                # abbricht, sollen beim erneuten Versuch neu generiert werden
+                if self.llm_cache and not cached and (
+                    register.validation["valid"] or len(register.claims) >= self.MIN_CLAIMS
+                ):
+                    self.llm_cache.set(model_name, 8000, prompt, result_text, tokens)
+                
+                claims = register.claims
+                sections = register.outline.sections
+                
+                # Claim-Statistiken in einem Durchlauf
+                class_counts = Counter(c.evidence_class for c in claims)
+                a_count = class_counts[EvidenceClass.A]
+                b_count = class_counts[EvidenceClass.B]
+                c_count = class_counts[EvidenceClass.C]
+                
+                step.tokens = tokens
+                step.result_length = len(result_text)
+                step.details = {
                     "claims_count": len(claims),
-                    "a_claims": sum(1 for c in claims if c.evidence_class == EvidenceClass.A),
-                    "b_claims": sum(1 for c in claims if c.evidence_class == EvidenceClass.B),
-                    "c_claims": sum(1 for c in claims if c.evidence_class == EvidenceClass.C),
+                    "a_claims": a_count,
+                    "b_claims": b_count,
+                    "c_claims": c_count,
                     "sections_count": len(sections),
-                    "model_used": model_name
+                    "model_used": model_name,
+                    "cache_hit": bool(cached)
                 }
-            )
-            
-            # Berechne Claim-Statistiken
-            a_count = sum(1 for c in claims if c.evidence_class == EvidenceClass.A)
-            b_count = sum(1 for c in claims if c.evidence_class == EvidenceClass.B)
-            c_count = sum(1 for c in claims if c.evidence_class == EvidenceClass.C)
             
             yield AgentEvent(
                 event_type=EventType.STATUS,
@@ -726,26 +1207,10 @@ OUTPUT: NUR JSON, kein anderer Text!
                 }
             )
             
-            # Format-spezifische Claim-Anforderungen
-            format_spec = self.FORMAT_SPECS[self.format]
-            
-            return ClaimRegister(
-                question_brief=question_brief,
-                term_map=term_map,
-                outline=outline,
-                claims=claims,
-                min_total_claims=format_spec["min_claims"],
-                min_c_claims=format_spec["min_c_claims"]
-            )
+            return register
             
         except Exception as e:
-            # === LOGGING: End ClaimMiner Step (Error) ===
-            self.logger.end_step(
-                step_idx,
-                status="error",
-                error=str(e)
-            )
-            
+            # Schritt wurde von logger.step() bereits als "error" beendet
             yield AgentEvent(
                 event_type=EventType.ERROR,
                 agent_name="ClaimMiner",
@@ -770,9 +1235,221 @@ OUTPUT: NUR JSON, kein anderer Text!
                 claims=[]
             )
     
-    def _phase_3_4_retrieval(self) -> Generator[AgentEvent, None, None]:
-        """Phase 3-4: Recherche für B/C Claims."""
-        claims_needing_evidence = self.claim_register.get_claims_needing_evidence()
+    def _iter_text_deltas(
+        self,
+        prompt: str,
+        model_name: str,
+        provider: str,
+        max_tokens: int,
+        usage: Dict[str, int],
+        json_object: bool = False,
+        static_prefix: str = ""
+    ):
+        """
+        Streamt eine OpenAI- oder Anthropic-Antwort als Text-Deltas.
+        
+        Die Token-Counts werden am Ende des Streams in `usage` eingetragen
+        (input/output), da ein Generator keinen zweiten Rückgabewert hat.
+        `static_prefix` wird als cachebarer Prompt-Anfang vorangestellt.
+        """
+        messages = _llm_messages(prompt, static_prefix, provider)
+        if provider == "anthropic":
+            with get_anthropic_client().messages.stream(
+                model=model_name,
+                max_tokens=max_tokens,
+                messages=messages
+            ) as stream:
+                yield from stream.text_stream
+                response = stream.get_final_message()
+            usage["input"] = response.usage.input_tokens
+            usage["output"] = response.usage.output_tokens
+        else:
+            kwargs = {}
+            if json_object:
+                kwargs["response_format"] = {"type": "json_object"}  # reines JSON -> Schnellpfad im Parser
+            stream = get_openai_client().chat.completions.create(
+                model=model_name,
+                messages=messages,
+                max_completion_tokens=max_tokens,
+                stream=True,
+                stream_options={"include_usage": True},
+                **kwargs
+            )
+            for chunk in stream:
+                if chunk.choices:
+                    yield chunk.choices[0].delta.content or ""
+                # Der letzte Chunk trägt nur die Usage (choices ist leer)
+                if getattr(chunk, "usage", None):
+                    usage["input"] = chunk.usage.prompt_tokens
+                    usage["output"] = chunk.usage.completion_tokens
+    
+    def _llm_retry_delay(self, attempt: int) -> float:
+        """Wartezeit vor Versuch attempt+1: exponentiell, gedeckelt, mit Jitter."""
+        delay = min(self.LLM_RETRY_MAX_DELAY, self.LLM_RETRY_MIN_DELAY * 2 ** (attempt - 1))
+        return delay * random.uniform(0.5, 1.5)
+    
+    def _with_llm_retry(
+        self,
+        call: Callable[[], Generator[AgentEvent, None, Any]],
+        agent_name: str
+    ) -> Generator[AgentEvent, None, Any]:
+        """
+        Führt einen (streamenden) LLM-Call aus und wiederholt ihn bei
+        transienten Fehlern (Timeout, Verbindung, 429, 5xx).
+        
+        `call` liefert pro Versuch einen neuen Generator - ein abgebrochener
+        Stream beginnt von vorn. Andere Fehler werden direkt weitergereicht.
+        """
+        for attempt in range(1, self.LLM_MAX_ATTEMPTS + 1):
+            try:
+                return (yield from call())
+            except Exception as e:
+                if attempt == self.LLM_MAX_ATTEMPTS or not _is_transient_llm_error(e):
+                    raise
+                delay = self._llm_retry_delay(attempt)
+                yield AgentEvent(
+                    event_type=EventType.STATUS,
+                    agent_name=agent_name,
+                    content=f"⏳ {type(e).__name__} - neuer Versuch "
+                            f"({attempt + 1}/{self.LLM_MAX_ATTEMPTS}) in {delay:.0f}s..."
+                )
+                time.sleep(delay)
+    
+    @staticmethod
+    def _gemini_generate(prompt: str, model_name: str, max_tokens: int) -> tuple[str, Dict[str, int]]:
+        """Blockierender Gemini-Call (Legacy-SDK ohne Streaming/Async). Returns: (text, tokens)"""
+        import google.generativeai as genai  # optionales Legacy-SDK, nur bei Bedarf laden
+        
+        genai.configure(api_key=GEMINI_API_KEY)
+        model = genai.GenerativeModel(model_name)
+        response = model.generate_content(
+            prompt,
+            generation_config=genai.GenerationConfig(
+                max_output_tokens=max_tokens
+            )
+        )
+        # Gemini gibt Token-Counts in usage_metadata
+        tokens = {
+            "input": response.usage_metadata.prompt_token_count if hasattr(response, 'usage_metadata') else 0,
+            "output": response.usage_metadata.candidates_token_count if hasattr(response, 'usage_metadata') else 0
+        }
+        return response.text, tokens
+    
+    def _stream_claim_mining(
+        self,
+        prompt: str,
+        model_name: str,
+        provider: str,
+        max_tokens: int
+    ) -> Generator[AgentEvent, None, tuple]:
+        """
+        Streamt die ClaimMiner-Antwort und meldet alle CLAIM_PROGRESS_STEP
+        neu begonnenen Claims einen Zwischenstand an die UI.
+        
+        Returns:
+            (text, tokens)
+        """
+        usage = {}
+        deltas = self._iter_text_deltas(prompt, model_name, provider, max_tokens, usage, json_object=True)
+        
+        # "claim_id" kann über Delta-Grenzen hinweg geteilt sein: die letzten
+        # len(marker)-1 Zeichen werden beim nächsten Delta mitgezählt
+        marker = '"claim_id"'
+        buf = io.StringIO()
+        carry = ""
+        claims_seen = 0
+        reported = 0
+        for delta in deltas:
+            buf.write(delta)
+            window = carry + delta
+            claims_seen += window.count(marker)
+            carry = window[-(len(marker) - 1):]
+            if claims_seen >= reported + self.CLAIM_PROGRESS_STEP:
+                reported = claims_seen
+                yield AgentEvent(
+                    event_type=EventType.STATUS,
+                    agent_name="ClaimMiner",
+                    content=f"⛏️ {claims_seen} Claims empfangen...",
+                    data={"claims_streamed": claims_seen}
+                )
+        
+        tokens = {"input": usage.get("input", 0), "output": usage.get("output", 0)}
+        return buf.getvalue(), tokens
+    
+    def _stream_text(
+        self,
+        prompt: str,
+        model_name: str,
+        provider: str,
+        max_tokens: int,
+        agent_name: str,
+        static_prefix: str = ""
+    ) -> Generator[AgentEvent, None, tuple]:
+        """
+        Streamt eine Editor- oder Revisions-Antwort und meldet alle
+        STREAM_PROGRESS_CHARS Zeichen einen Zwischenstand an die UI.
+        Gemini (Legacy-SDK) antwortet ohne Streaming in einem Stück.
+        
+        Returns:
+            (text, tokens)
+        """
+        if provider == "gemini":
+            return self._gemini_generate(_flat_prompt(prompt, static_prefix), model_name, max_tokens)
+        
+        usage = {}
+        buf = io.StringIO()
+        reported = 0
+        deltas = self._iter_text_deltas(
+            prompt, model_name, provider, max_tokens, usage, static_prefix=static_prefix
+        )
+        for delta in deltas:
+            buf.write(delta)
+            received = buf.tell()
+            if received >= reported + self.STREAM_PROGRESS_CHARS:
+                reported = received
+                yield AgentEvent(
+                    event_type=EventType.STATUS,
+                    agent_name=agent_name,
+                    content=f"📝 {received} Zeichen empfangen...",
+                    data={"chars_streamed": received}
+                )
+        
+        tokens = {"input": usage.get("input", 0), "output": usage.get("output", 0)}
+        return buf.getvalue(), tokens
+    
+    def _parse_claim_register(self, result_text: str, question: str) -> ClaimRegister:
+        """
+        Parst die ClaimMiner-Antwort und baut daraus das ClaimRegister.
+        
+        Seiteneffektfrei (nur CPU-Arbeit), kann also bei Bedarf per
+        asyncio.to_thread aus einem Event-Loop heraus ausgelagert werden.
+        """
+        # JSON parsen - ROBUST mit mehreren Strategien
+        data = self._parse_json_robust(result_text, "ClaimMiner")
+        
+        # Format-spezifische Claim-Anforderungen
+        format_spec = self.FORMAT_SPECS[self.format]
+        
+        return ClaimRegister.from_llm_dict(
+            data,
+            question,
+            as_of_date=self._as_of,
+            min_total_claims=format_spec["min_claims"],
+            min_c_claims=format_spec["min_c_claims"]
+        )
+    
+    def _phase_3_4_retrieval(self) -> Generator[AgentEvent, None, int]:
+        """
+        Phase 3-4: Recherche für B/C Claims.
+        
+        Returns:
+            Anzahl gefundener Quellen (für die Checks in process)
+        """
+        # Nur Claims mit Suchqueries sind für die Recherche relevant
+        claims_needing_evidence = [
+            c for c in self.claim_register.get_claims_needing_evidence()
+            if c.retrieval_ticket and c.retrieval_ticket.queries
+        ]
         
         yield AgentEvent(
             event_type=EventType.STATUS,
@@ -792,76 +1469,61 @@ OUTPUT: NUR JSON, kein anderer Text!
         
         total_sources = 0
         tools_used = []
+        errors = []
         
-        for claim in claims_needing_evidence:
-            if not claim.retrieval_ticket or not claim.retrieval_ticket.queries:
-                continue
-            
-            yield AgentEvent(
-                event_type=EventType.STATUS,
-                agent_name="Retriever",
-                content=f"   {claim.claim_id}: {claim.claim_text[:50]}..."
-            )
-            
-            # Tool auswählen
-            tool = self._select_tool(claim)
-            if tool not in tools_used:
-                tools_used.append(tool)
-            
-            sources = []
-            
-            for query in claim.retrieval_ticket.queries[:3]:
-                try:
-                    result = self.mcp.call_tool(f"{tool}_search", {"query": query, "max_results": 3})
-                    
-                    if result and result.get("results"):
-                        for item in result["results"]:
-                            source = Source(
-                                source_id=f"S-{claim.claim_id}-{len(sources)+1:02d}",
-                                title=item.get("title", ""),
-                                publisher=self._extract_publisher(item.get("url", "")),
-                                url=item.get("url", ""),
-                                extract=item.get("snippet", "")[:400],
-                                supports_claims=[claim.claim_id]
-                            )
-                            sources.append(source)
-                            
-                            if len(sources) >= claim.min_sources + 2:
-                                break
-                except Exception as e:
-                    pass
+        # Pro Lauf: In-Memory-Cache der laufenden/fertigen Suchen, damit
+        # identische (tool, query) Paare verschiedener Claims nur einmal
+        # gesucht werden
+        self._search_futures = {}
+        self._tool_sems = {}
+        # Negative Keywords der TermMap einmal kompilieren (vor dem Thread-Pool)
+        self._negative_search = self.claim_register.term_map.negative_pattern.search
+        
+        # Claims parallel recherchieren, Events in Ankunftsreihenfolge
+        packs: Dict[str, EvidencePack] = {}
+        with ThreadPoolExecutor(max_workers=self.RETRIEVAL_WORKERS) as pool:
+            futures = {
+                pool.submit(self._retrieve_for_claim, claim): claim
+                for claim in claims_needing_evidence
+            }
+            for future in as_completed(futures):
+                claim = futures[future]
+                pack, tool, claim_errors = future.result()
+                packs[claim.claim_id] = pack
+                errors.extend(claim_errors)
                 
-                if len(sources) >= claim.min_sources:
-                    break
-            
-            status = ClaimStatus.FULFILLED if len(sources) >= claim.min_sources else ClaimStatus.INSUFFICIENT
-            
-            self.evidence_packs[claim.claim_id] = EvidencePack(
-                claim_id=claim.claim_id,
-                sources=sources,
-                status=status
-            )
-            
-            total_sources += len(sources)
-            
-            yield AgentEvent(
-                event_type=EventType.STATUS,
-                agent_name="Retriever",
-                content=f"   {'✅' if status == ClaimStatus.FULFILLED else '⚠️'} {len(sources)} Quellen"
-            )
+                if tool not in tools_used:
+                    tools_used.append(tool)
+                total_sources += len(pack.sources)
+                
+                yield AgentEvent(
+                    event_type=EventType.STATUS,
+                    agent_name="Retriever",
+                    content=f"   {claim.claim_id}: {claim.claim_text[:50]}..."
+                )
+                yield AgentEvent(
+                    event_type=EventType.STATUS,
+                    agent_name="Retriever",
+                    content=f"   {'✅' if pack.status == ClaimStatus.FULFILLED else '⚠️'} {len(pack.sources)} Quellen"
+                )
+        
+        # In Claim-Reihenfolge übernehmen (stabile Quellen-Nummerierung)
+        for claim in claims_needing_evidence:
+            self.evidence_packs[claim.claim_id] = packs[claim.claim_id]
         
         # === LOGGING: End Retrieval Step ===
         fulfilled = sum(1 for p in self.evidence_packs.values() if p.status == ClaimStatus.FULFILLED)
         self.logger.end_step(
             step_idx,
-            status="success",
+            status="success" if not errors else "partial",
             result_length=total_sources,
             tool_calls=tools_used,
             details={
                 "claims_processed": len(claims_needing_evidence),
                 "claims_fulfilled": fulfilled,
                 "total_sources": total_sources,
-                "tools_used": tools_used
+                "tools_used": tools_used,
+                "errors": errors[:10] if errors else None
             }
         )
         
@@ -877,9 +1539,157 @@ OUTPUT: NUR JSON, kein anderer Text!
                 "tools_used": tools_used
             }
         )
+        
+        return total_sources
+    
+    def _retrieve_for_claim(self, claim: Claim) -> tuple[EvidencePack, str, List[str]]:
+        """
+        Recherchiert einen einzelnen Claim (läuft in einem Worker-Thread).
+        
+        Alle Queries des Claims gehen als ein Batch-Aufruf an MCP; die
+        Ergebnisse werden in Query-Reihenfolge übernommen, bis min_sources
+        erreicht ist.
+        
+        Returns:
+            (EvidencePack, verwendetes Tool, Fehlermeldungen)
+        """
+        tool = self._select_tool(claim)
+        sources = []
+        errors = []
+        # URLs, die dieser Claim schon hat (Queries liefern oft dieselben Treffer)
+        seen_urls = set()
+        # Pro Ergebnis höchstens bis min_sources + 2 Quellen auffüllen
+        hard_cap = claim.min_sources + 2
+        
+        for result in self._search_many(tool, claim.retrieval_ticket.queries[:3]):
+            # Die Tools melden Fehler als {"success": False, "error": ...}
+            error = self._retrieval_error(result)
+            if error:
+                errors.append(f"{claim.claim_id}: {error[:80]}")
+            elif result.get("results"):
+                # Treffer mit Negative Keyword im Titel sind Fehltreffer
+                # (z.B. "Jenkins Agent" statt "ServiceNow Build Agent")
+                new_items = (
+                    item for item in result["results"]
+                    if (not item.get("url") or item["url"] not in seen_urls)
+                    and not self._negative_search(item.get("title") or "")
+                )
+                for item in itertools.islice(new_items, hard_cap - len(sources)):
+                    seen_urls.add(item.get("url"))
+                    sources.append(Source.from_search_item(
+                        f"S-{claim.claim_id}-{len(sources)+1:02d}", claim.claim_id, item
+                    ))
+            
+            if len(sources) >= claim.min_sources:
+                break
+        
+        status = ClaimStatus.FULFILLED if len(sources) >= claim.min_sources else ClaimStatus.INSUFFICIENT
+        pack = EvidencePack(claim_id=claim.claim_id, sources=sources, status=status)
+        return pack, tool, errors
+    
+    def _search_many(self, tool: str, queries: List[str]) -> List[Dict[str, Any]]:
+        """
+        Thread-sichere Suche mehrerer Queries mit Dedup innerhalb des Laufs.
+        
+        Queries, die ein anderer Worker bereits sucht, werden nicht erneut
+        gesucht - es wird auf dessen Ergebnis gewartet. Der Rest geht als
+        ein Batch an MCP. Fehlgeschlagene Suchen werden nicht gemerkt.
+        
+        Returns:
+            Ergebnisse in Reihenfolge der Queries
+        """
+        futures = {}
+        owned = []
+        with self._search_lock:
+            for query in queries:
+                key = (tool, query)
+                future = self._search_futures.get(key)
+                if future is None:
+                    future = self._search_futures[key] = Future()
+                    owned.append(query)
+                futures[query] = future
+        
+        if owned:
+            try:
+                fetched = self._search_batch_uncached(tool, owned)
+            except Exception as e:
+                error = {"success": False, "error": f"{type(e).__name__}: {e}"}
+                fetched = [error] * len(owned)
+            for query, result in zip(owned, fetched):
+                futures[query].set_result(result)
+            # Fehlschläge (Timeout, Rate-Limit) nicht merken - spätere
+            # Runden (z.B. Gap-Research) sollen es erneut versuchen
+            with self._search_lock:
+                for query, result in zip(owned, fetched):
+                    if not result or result.get("success") is False:
+                        self._search_futures.pop((tool, query), None)
+
+        return [futures[query].result() for query in queries]
+    
+    def _search_batch_uncached(self, tool: str, queries: List[str]) -> List[Dict[str, Any]]:
+        """Batch-Suche über MCP: Disk-Cache, Tool-Semaphore, Retry mit Backoff."""
+        results: Dict[str, Dict[str, Any]] = {}
+        
+        # Persistenter Cache: wiederholte Suchen über Läufe hinweg sparen
+        if self.search_cache:
+            for query in queries:
+                cached = self.search_cache.get(tool, query, 3)
+                if cached is not None:
+                    results[query] = cached
+        pending = [q for q in queries if q not in results]
+        
+        with self._search_lock:
+            sem = self._tool_sems.get(tool)
+            if sem is None:
+                sem = self._tool_sems[tool] = threading.BoundedSemaphore(
+                    self.TOOL_CONCURRENCY.get(tool, self.DEFAULT_TOOL_CONCURRENCY)
+                )
+        
+        for attempt in range(self.RETRIEVAL_MAX_ATTEMPTS):
+            if not pending:
+                break
+            if attempt:
+                # Exponentielles Backoff mit Jitter (Slot im Semaphore ist frei)
+                time.sleep(random.uniform(0.5, 1.5) * 2 ** (attempt - 1))
+            
+            with sem:
+                batch = self.mcp.call_tool(
+                    f"{tool}_search_batch", {"queries": pending, "max_results": 3}
+                )
+            per_query = batch.get("results_per_query") if batch else None
+            if per_query is None:
+                # Batch-Aufruf selbst fehlgeschlagen -> gilt für alle Queries
+                per_query = [batch] * len(pending)
+            
+            retry = []
+            for query, result in zip(pending, per_query):
+                results[query] = result
+                error = self._retrieval_error(result)
+                if not error:
+                    if self.search_cache:
+                        self.search_cache.set(tool, query, 3, result)
+                elif _TRANSIENT_ERROR_RE.search(error):
+                    retry.append(query)
+            pending = retry
+        
+        return [results[query] for query in queries]
+    
+    @staticmethod
+    def _retrieval_error(result: Any) -> Optional[str]:
+        """Fehlermeldung eines Such-Ergebnisses, sonst None."""
+        if not result:
+            return "Leeres Ergebnis"
+        if result.get("success") is False and result.get("error"):
+            return str(result["error"])
+        return None
     
-    def _phase_5_rating(self) -> Generator[AgentEvent, None, None]:
-        """Phase 5: Quellen bewerten."""
+    def _phase_5_rating(self, rated_count: int) -> Generator[AgentEvent, None, None]:
+        """
+        Phase 5: Loggt das Quellen-Rating.
+        
+        Das Rating selbst (_rate_sources) läuft parallel zum Writer-LLM-Call
+        in _phase_6_writing.
+        """
         
         # === LOGGING: Start Rating Step ===
         step_idx = self.logger.start_step(
@@ -891,20 +1701,6 @@ OUTPUT: NUR JSON, kein anderer Text!
             task="Bewerte Quellen nach Autorität und Unabhängigkeit"
         )
         
-        rated_count = 0
-        for claim_id, pack in self.evidence_packs.items():
-            for source in pack.sources:
-                # Einfache automatische Bewertung
-                is_vendor = any(vendor in source.url.lower() for vendor in ["servicenow.com", "microsoft.com", "google.com", "aws.amazon.com"])
-                source.rating = SourceRating(
-                    authority=2 if is_vendor else 1,
-                    independence=1 if is_vendor else 2,
-                    recency=2,
-                    specificity=2,
-                    consensus=1
-                )
-                rated_count += 1
-        
         # === LOGGING: End Rating Step ===
         self.logger.end_step(
             step_idx,
@@ -922,39 +1718,65 @@ OUTPUT: NUR JSON, kein anderer Text!
             }
         )
     
+    def _rate_sources(self) -> int:
+        """Bewertet alle Quellen regelbasiert. Returns: Anzahl bewerteter Quellen."""
+        rated_count = 0
+        vendor_search = _VENDOR_RE.search
+        for source in itertools.chain.from_iterable(p.sources for p in self.evidence_packs.values()):
+            # Einfache automatische Bewertung: ein Regex-Scan liefert den
+            # Tabellen-Index, das (geteilte) Rating kommt direkt aus der Tabelle
+            source.rating = _RATING_TABLE[vendor_search(source.url) is not None]
+            rated_count += 1
+        return rated_count
+    
     def _build_source_index(self):
         """
         Baut einen konsistenten Quellen-Index auf.
         Jede URL bekommt eine eindeutige Nummer für die Referenzierung.
-        """
-        self.source_index = {}
-        counter = 1
         
-        for pack in self.evidence_packs.values():
+        Ein Durchlauf über alle Evidence Packs füllt source_index, die
+        Umkehrtabellen und die Writer-Einträge pro Claim.
+        """
+        source_index = {}
+        idx_to_url = {}
+        url_to_source = {}
+        sources_by_claim = {}
+        for claim_id, pack in self.evidence_packs.items():
+            entries = []
             for source in pack.sources:
-                if source.url not in self.source_index:
-                    self.source_index[source.url] = counter
-                    counter += 1
+                url = source.url
+                idx = source_index.get(url)
+                if idx is None:
+                    # Erstes Auftreten der URL: nächste Nummer, erste Quelle gewinnt
+                    idx = source_index[url] = len(source_index) + 1
+                    idx_to_url[idx] = url
+                    url_to_source[url] = source
+                entries.append(self._source_entry(idx, source))
+            sources_by_claim[claim_id] = entries
+        
+        self.source_index = source_index
+        self._idx_to_url = idx_to_url
+        self._url_to_source = url_to_source
+        self._sources_by_claim = sources_by_claim
+        self._next_source_idx = len(source_index) + 1
+    
+    @staticmethod
+    def _source_entry(idx: int, source: Source) -> Dict[str, Any]:
+        """Quelle mit Index-Nummer, wie sie der Writer-Prompt verwendet."""
+        return {
+            "index": idx,
+            "title": source.title,
+            "publisher": source.publisher,
+            "url": source.url,
+            "extract": source.extract[:200]
+        }
     
     def _get_sources_for_claim(self, claim_id: str) -> List[Dict[str, Any]]:
         """
-        Gibt alle Quellen für einen Claim mit ihren Index-Nummern zurück.
+        Gibt alle Quellen für einen Claim mit ihren Index-Nummern zurück
+        (vorberechnet in _build_source_index).
         """
-        pack = self.evidence_packs.get(claim_id)
-        if not pack:
-            return []
-        
-        sources = []
-        for source in pack.sources:
-            idx = self.source_index.get(source.url, 0)
-            sources.append({
-                "index": idx,
-                "title": source.title,
-                "publisher": source.publisher,
-                "url": source.url,
-                "extract": source.extract[:200]
-            })
-        return sources
+        return self._sources_by_claim.get(claim_id, [])
     
     def _phase_6_writing(self) -> Generator[AgentEvent, None, str]:
         """Phase 6: Artikel schreiben mit korrekten Quellenverweisen."""
@@ -969,8 +1791,12 @@ OUTPUT: NUR JSON, kein anderer Text!
             content=f"✍️ Schreibe Artikel mit {model_name}..."
         )
         
-        # Claims mit echten Quellen aufbereiten
+        # Claims mit echten Quellen aufbereiten und im selben Durchlauf
+        # als formatierten Text in einen Puffer schreiben
         claims_with_sources = []
+        claim_spans = {}  # claim_id -> (start, end) im claims_text, für Kapitel-Prompts
+        claims_buf = io.StringIO()
+        write = claims_buf.write
         for claim in self.claim_register.claims:
             claim_data = {
                 "id": claim.claim_id,
@@ -991,26 +1817,29 @@ OUTPUT: NUR JSON, kein anderer Text!
                     claim_data["evidence"] = f"{claim.evidence_class.value} (NICHT BELEGT - vorsichtig formulieren!)"
             
             claims_with_sources.append(claim_data)
-        
-        # Claims als formatierter Text
-        claims_text = ""
-        for c in claims_with_sources:
-            claims_text += f"\n### {c['id']} (Sektion {c['section']}, {c['evidence']})\n"
-            claims_text += f"Aussage: {c['text']}\n"
-            if c['sources']:
-                claims_text += "Quellen:\n"
-                for s in c['sources']:
-                    claims_text += f"  - [{s['index']}] {s['publisher']}: {s['title']}\n"
-                    claims_text += f"    URL: {s['url']}\n"
-                    claims_text += f"    Auszug: {s['extract']}...\n"
+            
+            span_start = claims_buf.tell()
+            write(f"\n### {claim_data['id']} (Sektion {claim_data['section']}, {claim_data['evidence']})\n")
+            write(f"Aussage: {claim_data['text']}\n")
+            if claim_data['sources']:
+                write("Quellen:\n")
+                for s in claim_data['sources']:
+                    write(f"  - [{s['index']}] {s['publisher']}: {s['title']}\n")
+                    write(f"    URL: {s['url']}\n")
+                    write(f"    Auszug: {s['extract']}...\n")
+            claim_spans[claim.claim_id] = (span_start, claims_buf.tell())
+        claims_text = claims_buf.getvalue()
         
         # Outline
-        outline_text = ""
+        outline_buf = io.StringIO()
         for s in self.claim_register.outline.sections:
-            outline_text += f"\n{s.number}. {s.title}\n"
-            outline_text += f"   Ziel: {s.goal}\n"
-            outline_text += f"   Claims: {', '.join(s.expected_claim_ids)}\n"
-            outline_text += f"   Umfang: ca. {s.estimated_pages} Seiten\n"
+            outline_buf.write(
+                f"\n{s.number}. {s.title}\n"
+                f"   Ziel: {s.goal}\n"
+                f"   Claims: {', '.join(s.expected_claim_ids)}\n"
+                f"   Umfang: ca. {s.estimated_pages} Seiten\n"
+            )
+        outline_text = outline_buf.getvalue()
         
         # Format-spezifische Längenvorgaben
         format_spec = self.FORMAT_SPECS[self.format]
@@ -1025,9 +1854,21 @@ OUTPUT: NUR JSON, kein anderer Text!
         max_source_idx = max(self.source_index.values()) if self.source_index else 0
         invalid_example = max_source_idx + 5  # Beispiel für ungültige Referenz
         
-        prompt = f"""Du bist ein wissenschaftlicher Autor und schreibst einen Expertenartikel.
-
-# KERNFRAGE
+        # Lange Formate: ein LLM-Call pro Kapitel plus Rahmen (parallel)
+        sections = self.claim_register.outline.sections
+        if format_spec.get("section_fanout") and sections:
+            prompts = self._build_section_prompts(
+                claims_text, claim_spans, outline_text, format_spec, max_source_idx
+            )
+        else:
+            static_prefix = _WRITER_STATIC_PROMPT.substitute(
+                words_min=words_min,
+                words_max=words_max,
+                target_pages=target_pages,
+                exec_summary_words=exec_summary_words,
+                chapter_min_words=chapter_min_words
+            )
+            prompts = [(static_prefix, f"""# KERNFRAGE
 {self.claim_register.question_brief.core_question}
 
 # ZIEL-FORMAT: {format_label}
@@ -1039,43 +1880,12 @@ OUTPUT: NUR JSON, kein anderer Text!
 # VERWENDBARE CLAIMS MIT QUELLEN
 {claims_text}
 
-# STRIKTE SCHREIBREGELN
-
-## 1. Quellenverweise (KRITISCH!)
+# QUELLEN-LIMIT
 - Es existieren NUR Quellen [1] bis [{max_source_idx}] - KEINE ANDEREN!
 - Verwende AUSSCHLIESSLICH diese Nummern: [1], [2], ... [{max_source_idx}]
-- ERFINDE KEINE Quellenreferenzen! Referenzen wie [{invalid_example}] oder höher existieren NICHT!
-- Setze Quellenverweise DIREKT nach der Aussage: "ServiceNow ist eine Cloud-Plattform [1]."
-- Bei mehreren Quellen: "Dies wird von mehreren Studien bestätigt [2][3][5]."
-- KEINE Claim-Anchors im Text! Die (C-01) etc. sind nur für dich zur Orientierung.
-- Wenn du keine passende Quelle hast: Schreibe die Aussage OHNE Referenz oder lasse sie weg!
-
-## 2. Artikellänge (KRITISCH!)
-- Ziel: {words_min}-{words_max} Wörter ({target_pages} Seiten)
-- Executive Summary: ca. {exec_summary_words} Wörter
-- Jedes Hauptkapitel: MINDESTENS {chapter_min_words} Wörter
-- Ausführliche Erklärungen, Beispiele, Kontext!
-
-## 3. Struktur
-- Beginne mit "# [Titel]"
-- Dann "## Executive Summary" (PFLICHT!)
-- Dann die weiteren Kapitel gemäß Outline
-- Jedes Kapitel mit "## [Nummer]. [Titel]"
-- Unterkapitel mit "### [Titel]" wenn sinnvoll
-
-## 4. Stil
-- Wissenschaftlich, aber verständlich
-- Konkrete Beispiele und Anwendungsfälle
-- Kritische Einordnung wo angebracht
-- Am Ende: "## Limitations" Abschnitt
-
-## 5. VERBOTEN
-- Keine erfundenen Fakten ohne Quelle
-- Keine Claim-Anchors (C-01) im finalen Text
-- Kein "laut Quelle X" - nutze [X] Notation
-- Keine Aufzählungen als Hauptinhalt - ausführliche Fließtexte!
+- Referenzen wie [{invalid_example}] oder höher existieren NICHT!
 
-SCHREIBE JETZT DEN VOLLSTÄNDIGEN ARTIKEL ({words_min}-{words_max} Wörter):"""
+SCHREIBE JETZT DEN VOLLSTÄNDIGEN ARTIKEL ({words_min}-{words_max} Wörter):""")]
 
         # === LOGGING: Start Writer Step ===
         step_idx = self.logger.start_step(
@@ -1088,55 +1898,10 @@ SCHREIBE JETZT DEN VOLLSTÄNDIGEN ARTIKEL ({words_min}-{words_max} Wörter):"""
         )
         
         try:
-            # Provider-spezifischer API-Aufruf
-            if provider == "openai":
-                from openai import OpenAI
-                from config import OPENAI_API_KEY
-                
-                client = OpenAI(api_key=OPENAI_API_KEY)
-                response = client.chat.completions.create(
-                    model=model_name,
-                    messages=[{"role": "user", "content": prompt}],
-                    max_completion_tokens=16000  # Mehr Tokens für längeren Artikel
-                )
-                article = response.choices[0].message.content
-                tokens = {
-                    "input": response.usage.prompt_tokens if hasattr(response, 'usage') else 0,
-                    "output": response.usage.completion_tokens if hasattr(response, 'usage') else 0
-                }
-            elif provider == "gemini":
-                import google.generativeai as genai
-                from config import GEMINI_API_KEY
-                
-                genai.configure(api_key=GEMINI_API_KEY)
-                model = genai.GenerativeModel(model_name)
-                response = model.generate_content(
-                    prompt,
-                    generation_config=genai.GenerationConfig(
-                        max_output_tokens=16000
-                    )
-                )
-                article = response.text
-                # Gemini gibt Token-Counts in usage_metadata
-                tokens = {
-                    "input": response.usage_metadata.prompt_token_count if hasattr(response, 'usage_metadata') else 0,
-                    "output": response.usage_metadata.candidates_token_count if hasattr(response, 'usage_metadata') else 0
-                }
-            else:
-                from anthropic import Anthropic
-                from config import ANTHROPIC_API_KEY
-                
-                client = Anthropic(api_key=ANTHROPIC_API_KEY)
-                response = client.messages.create(
-                    model=model_name,
-                    max_tokens=16000,  # Erhöht für längere Artikel
-                    messages=[{"role": "user", "content": prompt}]
-                )
-                article = response.content[0].text
-                tokens = {
-                    "input": response.usage.input_tokens if hasattr(response, 'usage') else 0,
-                    "output": response.usage.output_tokens if hasattr(response, 'usage') else 0
-                }
+            # Writer-LLM-Call und Quellen-Rating (Phase 5) laufen überlappend
+            article, tokens, rated_count = asyncio.run(
+                self._awrite_and_rate(prompts, model_name, provider)
+            )
             
             word_count = len(article.split())
             
@@ -1150,10 +1915,13 @@ SCHREIBE JETZT DEN VOLLSTÄNDIGEN ARTIKEL ({words_min}-{words_max} Wörter):"""
                     "claims_provided": len(claims_with_sources),
                     "article_chars": len(article),
                     "article_words": word_count,
-                    "model_used": model_name
+                    "model_used": model_name,
+                    "parallel_parts": len(prompts) if len(prompts) > 1 else None
                 }
             )
             
+            yield from self._phase_5_rating(rated_count)
+            
             yield AgentEvent(
                 event_type=EventType.STATUS,
                 agent_name="Writer",
@@ -1164,20 +1932,233 @@ SCHREIBE JETZT DEN VOLLSTÄNDIGEN ARTIKEL ({words_min}-{words_max} Wörter):"""
                     "model_used": model_name
                 }
             )
-            
-            # Post-Processing: Entferne ungültige Quellenreferenzen
-            article = self._sanitize_source_references(article)
-            
-            return article
-            
-        except Exception as e:
-            # === LOGGING: End Writer Step (Error) ===
-            self.logger.end_step(
-                step_idx,
-                status="error",
-                error=str(e)
+            
+            # Post-Processing: Entferne ungültige Quellenreferenzen
+            article = self._sanitize_source_references(article)
+            
+            return article
+            
+        except Exception as e:
+            # === LOGGING: End Writer Step (Error) ===
+            self.logger.end_step(
+                step_idx,
+                status="error",
+                error=str(e)
+            )
+            raise
+    
+    def _build_section_prompts(
+        self,
+        claims_text: str,
+        claim_spans: Dict[str, tuple],
+        outline_text: str,
+        format_spec: Dict[str, Any],
+        max_source_idx: int
+    ) -> List[tuple[str, str]]:
+        """
+        Baut die (static_prefix, prompt)-Paare für das parallele Schreiben:
+        [Titel + Executive Summary, Kapitel 1..n, Limitations].
+        
+        Jedes Kapitel bekommt nur seine eigenen Claims (expected_claim_ids
+        bzw. section_id), ausgeschnitten aus dem bereits formatierten claims_text.
+        Kapitel und Rahmenteile teilen sich jeweils einen Präfix.
+        Outline-Sektionen für Executive Summary/Limitations werden übersprungen -
+        sie schreibt der Rahmen-Prompt (sonst stünden sie doppelt im Artikel).
+        """
+        question = self.claim_register.question_brief.core_question
+        frame_prefix = _FRAME_STATIC_PROMPT.substitute(
+            question=question,
+            outline=outline_text,
+            claims=claims_text,
+            max_source_idx=max_source_idx
+        )
+        section_prefix = _SECTION_STATIC_PROMPT.substitute(
+            question=question,
+            outline=outline_text,
+            max_source_idx=max_source_idx
+        )
+        
+        prompts = [(frame_prefix, _FRAME_WRITING_PROMPT.substitute(
+            task=f'Beginne mit "# [Titel]", dann "## Executive Summary" '
+                 f'(ca. {format_spec["exec_summary"]} Wörter) mit den Kernaussagen des Artikels. '
+                 f'Schreibe NUR Titel und Executive Summary.'
+        ))]
+        
+        for section in self.claim_register.outline.sections:
+            if _FRAME_SECTION_TITLE_RE.search(section.title):
+                continue
+            claim_ids = dict.fromkeys(section.expected_claim_ids)
+            claim_ids.update(
+                (c.claim_id, None) for c in self.claim_register.claims
+                if c.section_id == section.number
+            )
+            section_claims = "".join(
+                claims_text[slice(*claim_spans[cid])] for cid in claim_ids if cid in claim_spans
+            )
+            prompts.append((section_prefix, _SECTION_WRITING_PROMPT.substitute(
+                number=section.number,
+                title=section.title,
+                goal=section.goal,
+                chapter_min=format_spec["chapter_min"],
+                claims=section_claims or "(keine Claims - nur belegbares Grundlagenwissen ohne Zahlen)"
+            )))
+        
+        prompts.append((frame_prefix, _FRAME_WRITING_PROMPT.substitute(
+            task='Schreibe NUR den Abschnitt "## Limitations": Grenzen der Evidenzlage, '
+                 'nicht oder schwach belegte Claims und offene Unsicherheiten.'
+        )))
+        return prompts
+    
+    async def _awrite_and_rate(
+        self,
+        prompts: List[tuple[str, str]],
+        model_name: str,
+        provider: str
+    ) -> tuple[str, Dict[str, int], int]:
+        """
+        Führt Writer-LLM-Call(s) und Quellen-Rating parallel aus.
+        
+        Ein Prompt: ein Call für den ganzen Artikel. Mehrere Prompts (Kapitel):
+        parallele Calls, begrenzt durch SECTION_WRITE_CONCURRENCY, in
+        Prompt-Reihenfolge zusammengesetzt. Prompts sind (static_prefix, prompt)-Paare.
+        """
+        # Ein Async-Client für alle Calls des Laufs: die Kapitel teilen sich
+        # seinen Connection-Pool (Keep-Alive statt TLS-Handshake pro Kapitel)
+        async with self._async_llm_client(provider) as client:
+            if len(prompts) == 1:
+                static_prefix, prompt = prompts[0]
+                (article, tokens), rated_count = await asyncio.gather(
+                    self._acall_llm(
+                        prompt, model_name, provider,
+                        max_tokens=16000, static_prefix=static_prefix, client=client
+                    ),
+                    asyncio.to_thread(self._rate_sources)
+                )
+                return article, tokens, rated_count
+            
+            sem = asyncio.Semaphore(self.SECTION_WRITE_CONCURRENCY)
+            
+            async def write_part(static_prefix: str, prompt: str):
+                async with sem:
+                    return await self._acall_llm(
+                        prompt, model_name, provider,
+                        max_tokens=self.SECTION_MAX_TOKENS, static_prefix=static_prefix, client=client
+                    )
+            
+            parts, rated_count = await asyncio.gather(
+                asyncio.gather(*(write_part(*p) for p in prompts)),
+                asyncio.to_thread(self._rate_sources)
+            )
+        article = "\n\n".join(text.strip() for text, _ in parts)
+        tokens = {
+            "input": sum(t["input"] for _, t in parts),
+            "output": sum(t["output"] for _, t in parts)
+        }
+        return article, tokens, rated_count
+    
+    @staticmethod
+    def _async_llm_client(provider: str):
+        """
+        Async-Client für den Writer-Provider als Context-Manager.
+        
+        Async-Clients sind an ihren Event-Loop gebunden und werden daher pro
+        asyncio.run() neu erzeugt. Gemini (Legacy-SDK) hat keinen -> None.
+        """
+        if provider == "openai":
+            return AsyncOpenAI(api_key=OPENAI_API_KEY)
+        if provider == "gemini":
+            return contextlib.nullcontext()
+        return AsyncAnthropic(api_key=ANTHROPIC_API_KEY)
+    
+    async def _acall_llm(
+        self,
+        prompt: str,
+        model_name: str,
+        provider: str,
+        max_tokens: int,
+        static_prefix: str = "",
+        client=None
+    ) -> tuple[str, Dict[str, int]]:
+        """
+        Asynchroner LLM-Aufruf mit Retry bei transienten Fehlern
+        (Backoff wie _with_llm_retry, ohne den Event-Loop zu blockieren).
+        
+        Returns:
+            (text, tokens)
+        """
+        for attempt in range(1, self.LLM_MAX_ATTEMPTS + 1):
+            try:
+                return await self._acall_llm_once(
+                    prompt, model_name, provider, max_tokens, static_prefix, client
+                )
+            except Exception as e:
+                if attempt == self.LLM_MAX_ATTEMPTS or not _is_transient_llm_error(e):
+                    raise
+                await asyncio.sleep(self._llm_retry_delay(attempt))
+    
+    async def _acall_llm_once(
+        self,
+        prompt: str,
+        model_name: str,
+        provider: str,
+        max_tokens: int,
+        static_prefix: str = "",
+        client=None
+    ) -> tuple[str, Dict[str, int]]:
+        """
+        Asynchroner LLM-Aufruf mit AsyncOpenAI / AsyncAnthropic.
+        
+        OpenAI und Anthropic werden gestreamt: die Deltas landen direkt in
+        einem StringIO-Puffer, statt auf die komplette Antwort zu warten.
+        `static_prefix` steht als cachebarer Teil vor dem Prompt, `client`
+        ist der Client aus _async_llm_client() (geteilt über alle Kapitel).
+        
+        Returns:
+            (text, tokens)
+        """
+        buf = io.StringIO()
+        
+        if provider == "openai":
+            stream = await client.chat.completions.create(
+                model=model_name,
+                messages=_llm_messages(prompt, static_prefix, provider),
+                max_completion_tokens=max_tokens,
+                stream=True,
+                stream_options={"include_usage": True}
+            )
+            usage = None
+            async for chunk in stream:
+                if chunk.choices:
+                    buf.write(chunk.choices[0].delta.content or "")
+                # Der letzte Chunk trägt nur die Usage (choices ist leer)
+                if getattr(chunk, "usage", None):
+                    usage = chunk.usage
+            text = buf.getvalue()
+            tokens = {
+                "input": usage.prompt_tokens if usage else 0,
+                "output": usage.completion_tokens if usage else 0
+            }
+        elif provider == "gemini":
+            # Das Legacy-SDK hat keinen Async-Client -> Worker-Thread
+            text, tokens = await asyncio.to_thread(
+                self._gemini_generate, _flat_prompt(prompt, static_prefix), model_name, max_tokens
             )
-            raise
+        else:
+            async with client.messages.stream(
+                model=model_name,
+                max_tokens=max_tokens,
+                messages=_llm_messages(prompt, static_prefix, provider)
+            ) as stream:
+                async for delta in stream.text_stream:
+                    buf.write(delta)
+                response = await stream.get_final_message()
+            text = buf.getvalue()
+            tokens = {
+                "input": response.usage.input_tokens if hasattr(response, 'usage') else 0,
+                "output": response.usage.output_tokens if hasattr(response, 'usage') else 0
+            }
+        
+        return text, tokens
     
     def _sanitize_source_references(self, text: str) -> str:
         """Entfernt ungültige Quellenreferenzen aus dem Text.
@@ -1199,14 +2180,14 @@ SCHREIBE JETZT DEN VOLLSTÄNDIGEN ARTIKEL ({words_min}-{words_max} Wörter):"""
             return match.group(0)  # Gültige Referenz behalten
         
         # Ersetze ungültige Referenzen
-        sanitized = re.sub(r'\[(\d+)\]', replace_invalid_ref, text)
+        sanitized = _REF_RE.sub(replace_invalid_ref, text)
         
         # Bereinige doppelte Leerzeichen die entstehen könnten
-        sanitized = re.sub(r'  +', ' ', sanitized)
+        sanitized = _MULTISPACE_RE.sub(' ', sanitized)
         
         # Zähle entfernte Referenzen für Logging
-        original_refs = set(int(m) for m in re.findall(r'\[(\d+)\]', text))
-        remaining_refs = set(int(m) for m in re.findall(r'\[(\d+)\]', sanitized))
+        original_refs = set(int(m) for m in _REF_RE.findall(text))
+        remaining_refs = set(int(m) for m in _REF_RE.findall(sanitized))
         removed_refs = original_refs - remaining_refs
         
         if removed_refs:
@@ -1236,30 +2217,23 @@ SCHREIBE JETZT DEN VOLLSTÄNDIGEN ARTIKEL ({words_min}-{words_max} Wörter):"""
             return self.article
         
         # Finde alle im Artikel verwendeten Quellennummern [1], [2], etc.
-        used_refs = set(int(m) for m in re.findall(r'\[(\d+)\]', self.article))
-        
-        # Sortiere nach Index
-        sorted_sources = sorted(self.source_index.items(), key=lambda x: x[1])
+        used_refs = set(map(int, _REF_RE.findall(self.article)))
         
-        # Sammle Source-Details
-        url_to_source = {}
-        for pack in self.evidence_packs.values():
-            for source in pack.sources:
-                if source.url not in url_to_source:
-                    url_to_source[source.url] = source
+        # Artikel und Verzeichnis in einen Puffer schreiben: eine Kopie am
+        # Ende statt Join der Einträge plus Verkettung mit dem Artikel
+        buf = io.StringIO()
+        buf.write(self.article)
+        buf.write("\n\n---\n\n## Literaturverzeichnis\n\n")
         
-        bib = "\n\n---\n\n## Literaturverzeichnis\n\n"
+        # Nur referenzierte Nummern durchgehen, die es im Index gibt (sortiert)
         included_count = 0
-        for url, idx in sorted_sources:
-            # Nur Quellen aufnehmen die im Text referenziert werden
-            if idx not in used_refs:
-                continue
-            
-            source = url_to_source.get(url)
+        for idx in sorted(used_refs.intersection(self._idx_to_url)):
+            url = self._idx_to_url[idx]
+            source = self._url_to_source.get(url)
             if source:
-                bib += f"[{idx}] {source.publisher}: {source.title}. {url}\n\n"
+                buf.write(f"[{idx}] {source.publisher}: {source.title}. {url}\n\n")
             else:
-                bib += f"[{idx}] {url}\n\n"
+                buf.write(f"[{idx}] {url}\n\n")
             included_count += 1
         
         # === LOGGING: End Bibliography Step ===
@@ -1268,35 +2242,22 @@ SCHREIBE JETZT DEN VOLLSTÄNDIGEN ARTIKEL ({words_min}-{words_max} Wörter):"""
             status="success",
             result_length=included_count,
             details={
-                "unique_sources": len(sorted_sources),
+                "unique_sources": len(self.source_index),
                 "sources_in_article": included_count,
-                "filtered_out": len(sorted_sources) - included_count
+                "filtered_out": len(self.source_index) - included_count
             }
         )
         
-        return self.article + bib
+        return buf.getvalue()
     
     def _select_tool(self, claim: Claim) -> str:
         """Wählt Tool für Claim."""
-        text = claim.claim_text.lower()
-        
-        if any(kw in text for kw in ["studie", "forschung", "prozent", "wissenschaft"]):
-            return "semantic_scholar"
-        if any(kw in text for kw in ["release", "version", "2024", "2025", "2026", "aktuell"]):
-            return "gnews"
-        if any(kw in text for kw in ["erfahrung", "vergleich", "community", "entwickler"]):
-            return "hackernews"
-        
-        return "tavily"
+        match = _TOOL_RE.match(claim.claim_text)
+        return match.lastgroup if match else "tavily"
     
     def _extract_publisher(self, url: str) -> str:
         """Extrahiert Publisher aus URL."""
-        try:
-            from urllib.parse import urlparse
-            domain = urlparse(url).netloc.replace("www.", "")
-            return domain.split(".")[0].title()
-        except:
-            return "Unbekannt"
+        return publisher_from_url(url)
     
     def _polish_article(self, article: str) -> str:
         """
@@ -1311,44 +2272,21 @@ SCHREIBE JETZT DEN VOLLSTÄNDIGEN ARTIKEL ({words_min}-{words_max} Wörter):"""
         if not article:
             return article
         
-        # Patterns für Prozess-Artefakte
-        patterns_to_remove = [
-            # Überschriften-Zusätze in Klammern
-            r'\s*\(Abschnitt\s+(?:vervollständigt|ergänzt|überarbeitet|neu)\)',
-            r'\s*\((?:neu|ergänzt|überarbeitet|erweitert)(?:;[^)]+)?\)',
-            r'\s*\(zuvor\s+(?:fehlend|unvollständig|abstrakt)\)',
-            r'\s*\(praxisorientiert\s+ergänzt[^)]*\)',
-            r'\s*\(Hamburg[‑-]Bezug\s+geschärft\)',
-            
-            # Meta-Sätze über Überarbeitungen (am Satzanfang)
-            r'(?:^|\n)Die\s+ursprüngliche\s+(?:Fassung|Version)\s+[^.]+\.\s*',
-            r'(?:^|\n)Der\s+ursprüngliche\s+Text\s+[^.]+\.\s*',
-            r'(?:^|\n)In\s+der\s+(?:ursprünglichen|vorherigen)\s+(?:Fassung|Version)\s+[^.]+\.\s*',
-            r'(?:^|\n)Dieser\s+Abschnitt\s+wurde\s+(?:überarbeitet|ergänzt|erweitert)[^.]*\.\s*',
-            r'(?:^|\n)Die\s+vorliegende\s+Überarbeitung\s+[^.]+\.\s*',
-            
-            # Fettgedruckte Meta-Hinweise
-            r'\*\*Ergänzend[^*]+\*\*',
-            r'\*\*(?:Zur\s+)?(?:Behebung|Schließung)\s+der\s+(?:zuvor\s+)?kritisierten\s+(?:Lücke|Lücken)[^*]*\*\*',
-            r'\*\*(?:Neu|Ergänzt|Korrigiert)[^*]*\*\*:?\s*',
-            
-            # Hinweise in Klammern im Fließtext
-            r'\s*\((?:siehe|vgl\.?)\s+(?:ursprüngliche|vorherige)\s+(?:Fassung|Version)\)',
-            r'\s*\((?:diese|jene)\s+Lücke\s+wurde\s+(?:geschlossen|behoben)\)',
-        ]
         
-        cleaned = article
-        for pattern in patterns_to_remove:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE | re.MULTILINE)
+        # Ein Durchlauf pro Runde; weitere Runden nur, wenn Entfernungen neue
+        # Treffer freilegen (z.B. Meta-Satz rückt an den Zeilenanfang)
+        cleaned, removed = _POLISH_RE.subn('', article)
+        while removed:
+            cleaned, removed = _POLISH_RE.subn('', cleaned)
         
         # Aufräumen: Mehrfache Leerzeilen reduzieren
-        cleaned = re.sub(r'\n{4,}', '\n\n\n', cleaned)
+        cleaned = _MULTI_NEWLINE_RE.sub('\n\n\n', cleaned)
         
         # Aufräumen: Leerzeichen vor Satzzeichen
-        cleaned = re.sub(r'\s+([.,;:!?])', r'\1', cleaned)
+        cleaned = _SPACE_BEFORE_PUNCT_RE.sub(r'\1', cleaned)
         
         # Aufräumen: Mehrfache Leerzeichen
-        cleaned = re.sub(r'  +', ' ', cleaned)
+        cleaned = _MULTISPACE_RE.sub(' ', cleaned)
         
         return cleaned.strip()
     
@@ -1372,18 +2310,11 @@ SCHREIBE JETZT DEN VOLLSTÄNDIGEN ARTIKEL ({words_min}-{words_max} Wörter):"""
         if not self.source_index:
             return "(Keine Quellen verfügbar)"
         
-        # Sammle Source-Details
-        url_to_source = {}
-        for pack in self.evidence_packs.values():
-            for source in pack.sources:
-                if source.url not in url_to_source:
-                    url_to_source[source.url] = source
-        
         lines = []
         sorted_sources = sorted(self.source_index.items(), key=lambda x: x[1])[:25]  # Max 25
         
         for url, idx in sorted_sources:
-            source = url_to_source.get(url)
+            source = self._url_to_source.get(url)
             if source:
                 # Kürze Extract auf 100 Zeichen
                 extract = source.extract[:100] + "..." if len(source.extract) > 100 else source.extract
@@ -1401,15 +2332,19 @@ SCHREIBE JETZT DEN VOLLSTÄNDIGEN ARTIKEL ({words_min}-{words_max} Wörter):"""
         """Speichert Artikel."""
         os.makedirs(OUTPUT_DIR, exist_ok=True)
         
-        safe_name = "".join(c if c.isalnum() or c in " -_" else "" for c in question[:50])
+        safe_name = question[:50].translate(_SAFE_FILENAME_TABLE)
         safe_name = safe_name.strip().replace(" ", "_").lower()
         
-        timestamp = self.logger.session_id if self.logger else datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = self.logger.session_id if self.logger else self._started_at.strftime("%Y%m%d_%H%M%S")
         filename = f"{safe_name}_{timestamp}.md"
         filepath = os.path.join(OUTPUT_DIR, filename)
         
-        with open(filepath, "w", encoding="utf-8") as f:
+        # Atomar schreiben: erst in Temp-Datei, dann umbenennen
+        # (kein halb geschriebener Artikel, falls der Prozess abbricht)
+        tmp_path = filepath + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
             f.write(self.article)
+        os.replace(tmp_path, filepath)
         
         return filepath
     
@@ -1424,8 +2359,6 @@ SCHREIBE JETZT DEN VOLLSTÄNDIGEN ARTIKEL ({words_min}-{words_max} Wörter):"""
         Returns:
             EditorVerdict mit verdict (approved/revise/research)
         """
-        from agents.editor import EditorVerdict
-        
         # Dynamische Modellauswahl
         model_name, provider = self._get_model("editor")
         tier = self.tiers.get("editor", "premium")
@@ -1437,10 +2370,11 @@ SCHREIBE JETZT DEN VOLLSTÄNDIGEN ARTIKEL ({words_min}-{words_max} Wörter):"""
         )
         
         # Statistiken für den Editor
-        word_count = len(self.article.split())
-        source_refs = len(re.findall(r'\[\d+\]', self.article))
-        has_exec_summary = "Executive Summary" in self.article or "Management Summary" in self.article
-        has_limitations = "Limitation" in self.article
+        stats = _article_stats(self.article)
+        word_count = stats["word_count"]
+        source_refs = stats["ref_count"]
+        has_exec_summary = stats["has_exec_summary"]
+        has_limitations = stats["has_limitations"]
         
         # === NEU: Quellen-Snippets für Editor aufbereiten ===
         # HINWEIS: Claims werden nicht mehr an Editor gesendet - nur der Artikel selbst wird geprüft
@@ -1455,12 +2389,17 @@ SCHREIBE JETZT DEN VOLLSTÄNDIGEN ARTIKEL ({words_min}-{words_max} Wörter):"""
         # Dynamische Mindestlänge für Editor (80% des Minimums)
         editor_min_words = int(words_min * 0.8)
         
-        prompt = f"""Du bist ein kritischer Editor für wissenschaftliche Fachartikel.
-
-# ARTIKEL ZU PRÜFEN
-{self.article[:40000]}  # Erhöht von 15000 auf 40000 für vollständige Prüfung
-
-# ZIEL-FORMAT: {format_label} ({words_min}-{words_max} Wörter)
+        static_prefix = _EDITOR_STATIC_PROMPT.substitute(
+            format_label=format_label,
+            words_min=words_min,
+            words_max=words_max,
+            editor_min_words=editor_min_words
+        )
+        
+        article_excerpt = _truncate_for_editor(self.article, self.EDITOR_ARTICLE_MAX_TOKENS)
+        
+        prompt = f"""# VERFÜGBARE QUELLEN (zum Faktencheck)
+{sources_summary}
 
 # ARTIKEL-STATISTIKEN
 - Wörter: {word_count}
@@ -1468,137 +2407,40 @@ SCHREIBE JETZT DEN VOLLSTÄNDIGEN ARTIKEL ({words_min}-{words_max} Wörter):"""
 - Executive Summary vorhanden: {has_exec_summary}
 - Limitations-Abschnitt vorhanden: {has_limitations}
 
-# VERFÜGBARE QUELLEN (zum Faktencheck)
-{sources_summary}
-
-# PRÜFKRITERIEN
-
-WICHTIG: Prüfe NUR den ARTIKEL-TEXT oben! 
-Ignoriere Claims die nicht im Artikel vorkommen - wenn etwas nicht im Artikel steht, ist es KEIN Problem!
-
-## 1. Länge (KRITISCH!)
-- ZIEL: {words_min}-{words_max} Wörter ({format_label})
-- Aktuell: {word_count} Wörter
-- Bei < {editor_min_words}: verdict = "revise"
-
-## 2. Quellenreferenzierung
-- Sind Quellen [1], [2], etc. im Text referenziert?
-- Werden verschiedene Quellen genutzt (nicht nur [1]-[3])?
-- Aktuell: {source_refs} Quellenverweise
-
-## 3. Struktur
-- Hat der Artikel eine Executive Summary?
-- Sind alle Kapitel ausreichend ausgeführt (nicht nur 2-3 Sätze)?
-- Gibt es einen Limitations-Abschnitt?
-
-## 4. Inhaltliche Qualität
-- Werden die Kernfragen beantwortet?
-- Sind die Informationen konsistent?
-- Gibt es Lücken oder fehlende wichtige Aspekte?
-
-## 5. HALLUZINATIONS-CHECK (KRITISCH!)
-- Prüfe NUR Aussagen die TATSÄCHLICH IM ARTIKEL STEHEN!
-- Wenn eine Behauptung NICHT im Artikel vorkommt → KEIN Issue melden!
-- Prüfe: Welche Faktenbehauptungen im Artikel haben KEINE Quellenreferenz [X]?
-- Vergleiche Aussagen im Artikel mit den verfügbaren Quellen oben
-- Wenn der Artikel Fakten behauptet die NICHT durch eine der Quellen gedeckt sind → type="hallucination"
-- Besonders kritisch: Zahlen, Statistiken, Zitate ohne [X]-Referenz
-- NICHT prüfen: Dinge die "fehlen" oder "nicht erwähnt werden" - das ist KEIN Halluzinations-Problem!
-
-# OUTPUT-FORMAT (JSON!)
-
-Antworte NUR mit diesem JSON (keine weitere Erklärung):
-
-```json
-{{
-  "verdict": "approved|revise|research",
-  "confidence": 0.0-1.0,
-  "summary": "Kurze Zusammenfassung der Bewertung",
-  "issues": [
-    {{
-      "type": "length|sources|structure|content_gap|hallucination",
-      "description": "Was ist das Problem?",
-      "severity": "critical|major|minor",
-      "location": "Abschnitt/Satz wo das Problem ist (bei hallucination)",
-      "suggested_action": "revise|research|remove",
-      "research_query": "Falls research nötig: Suchquery"
-    }}
-  ]
-}}
-```
-
-WICHTIG: 
-- "approved" NUR wenn Artikel im Zielbereich UND gute Quellenreferenzierung UND vollständige Struktur UND keine Halluzinationen
-- "revise" bei Strukturproblemen, zu kurz, oder stilistischen Issues
-- "research" NUR wenn GENERELLE Informationen fehlen (z.B. "Was ist X?" ohne Erklärung)
-
-HALLUZINATIONS-BEHANDLUNG (KRITISCH!):
-- Bei SPEZIFISCHEN ZAHLEN ohne Beleg (z.B. "72 Punkte", "unter 20 FPS", "150 Mitarbeiter") → suggested_action = "remove"
-- Bei KONKRETEN STATISTIKEN ohne Quelle → suggested_action = "remove"  
-- Bei ZITATEN ohne Beleg → suggested_action = "remove"
-- NUR bei ALLGEMEINEN Aussagen die ergänzbar sind → suggested_action = "research"
-- STANDARD für hallucination sollte "remove" sein, nicht "research"!
+# ARTIKEL ZU PRÜFEN
+{article_excerpt}
 
 DEIN VERDICT:"""
 
-        # === LOGGING: Start Editor Step ===
-        step_idx = self.logger.start_step(
-            agent="EditorialReviewer",
-            model=model_name,
-            provider=provider,
-            tier=tier,
-            action="editorial_review",
-            task=f"Prüfe Artikel (Revision {revision_round})"
-        )
-        
         try:
-            # Provider-spezifischer API-Aufruf
-            if provider == "anthropic":
-                from anthropic import Anthropic
-                from config import ANTHROPIC_API_KEY
-                
-                client = Anthropic(api_key=ANTHROPIC_API_KEY)
-                response = client.messages.create(
-                    model=model_name,
-                    max_tokens=2000,
-                    messages=[{"role": "user", "content": prompt}]
+            with self.logger.step(
+                agent="EditorialReviewer",
+                model=model_name,
+                provider=provider,
+                tier=tier,
+                action="editorial_review",
+                task=f"Prüfe Artikel (Revision {revision_round})"
+            ) as step:
+                # Provider-spezifischer API-Aufruf (gestreamt)
+                result_text, tokens = yield from self._with_llm_retry(
+                    lambda: self._stream_text(
+                        prompt, model_name, provider, max_tokens=2000, agent_name="Editor",
+                        static_prefix=static_prefix
+                    ),
+                    agent_name="Editor"
                 )
-                result_text = response.content[0].text
-                tokens = {
-                    "input": response.usage.input_tokens if hasattr(response, 'usage') else 0,
-                    "output": response.usage.output_tokens if hasattr(response, 'usage') else 0
-                }
-            else:
-                from openai import OpenAI
-                from config import OPENAI_API_KEY
                 
-                client = OpenAI(api_key=OPENAI_API_KEY)
-                response = client.chat.completions.create(
-                    model=model_name,
-                    messages=[{"role": "user", "content": prompt}],
-                    max_completion_tokens=2000
-                )
-                result_text = response.choices[0].message.content
-                tokens = {
-                    "input": response.usage.prompt_tokens if hasattr(response, 'usage') else 0,
-                    "output": response.usage.completion_tokens if hasattr(response, 'usage') else 0
-                }
-            
-            # Verdict parsen
-            # DEBUG: Log raw response für Analyse
-            print(f"[Editor DEBUG] Response length: {len(result_text)}")
-            print(f"[Editor DEBUG] First 500 chars: {result_text[:500]}")
-            print(f"[Editor DEBUG] Last 500 chars: {result_text[-500:]}")
-            
-            verdict = EditorVerdict.from_response(result_text)
-            
-            # === LOGGING: End Editor Step ===
-            self.logger.end_step(
-                step_idx,
-                status="success",
-                tokens=tokens,
-                result_length=len(result_text),
-                details={
+                # Verdict parsen
+                # DEBUG: Log raw response für Analyse
+                print(f"[Editor DEBUG] Response length: {len(result_text)}")
+                print(f"[Editor DEBUG] First 500 chars: {result_text[:500]}")
+                print(f"[Editor DEBUG] Last 500 chars: {result_text[-500:]}")
+                
+                verdict = EditorVerdict.from_response(result_text)
+                
+                step.tokens = tokens
+                step.result_length = len(result_text)
+                step.details = {
                     "verdict": verdict.verdict,
                     "confidence": verdict.confidence,
                     "issues_count": len(verdict.issues),
@@ -1607,12 +2449,11 @@ DEIN VERDICT:"""
                     "word_count_checked": word_count,
                     "model_used": model_name,
                     # DEBUG: Wie viel vom Artikel hat der Editor gesehen?
-                    "debug_article_chars_sent": min(len(self.article), 40000),
+                    "debug_article_chars_sent": len(article_excerpt),
                     "debug_article_total_chars": len(self.article),
                     # DEBUG: Raw Editor Response (erste 2000 Zeichen für Analyse)
                     "debug_raw_response_preview": result_text[:2000] if result_text else ""
                 }
-            )
             
             yield AgentEvent(
                 event_type=EventType.STATUS,
@@ -1626,18 +2467,19 @@ DEIN VERDICT:"""
             return verdict
             
         except Exception as e:
-            self.logger.end_step(step_idx, status="error", error=str(e))
+            # Schritt wurde von logger.step() bereits als "error" beendet
             # Fallback: approved um weiterzumachen
             return EditorVerdict(verdict="approved", confidence=0.3, summary=f"Fehler: {e}")
     
-    def _handle_research_gaps(self, verdict) -> Generator[AgentEvent, None, None]:
+    def _handle_research_gaps(self, verdict) -> Generator[AgentEvent, None, int]:
         """
         Führt Nachrecherche für identifizierte Lücken durch.
+        Gibt die Anzahl neu gefundener Quellen zurück.
         """
         research_queries = verdict.get_research_queries()
         
         if not research_queries:
-            return
+            return 0
         
         yield AgentEvent(
             event_type=EventType.STATUS,
@@ -1660,27 +2502,37 @@ DEIN VERDICT:"""
         queries_executed = []
         errors = []
         
-        for query in research_queries[:5]:  # Max 5 Nachrecherchen
+        # Doppelte Queries entfernen, dann als ein paralleler Batch über
+        # _search_many: Disk-Cache, Retry und In-Memory-Dedup des Laufs
+        # (Queries früherer Revisionsrunden werden nicht erneut gesucht).
+        # Quellen danach im aktuellen Thread in Query-Reihenfolge übernehmen
+        # (source_index bleibt seriell)
+        queries = list(dict.fromkeys(q.strip() for q in research_queries if q and q.strip()))
+        queries = queries[:5]  # Max 5 Nachrecherchen
+        results = self._search_many("tavily", queries)
+        
+        for query, result in zip(queries, results):
             query_result = {"query": query[:80], "sources_found": 0, "tool": "tavily"}
             try:
                 tools_used.add("tavily")
-                result = self.mcp.call_tool("tavily_search", {"query": query, "max_results": 3})
+                error = self._retrieval_error(result)
+                if error:
+                    raise RuntimeError(error)
                 
                 if result and result.get("results"):
                     for item in result["results"]:
                         url = item.get("url", "")
                         if url and url not in self.source_index:
                             # Neue Quelle hinzufügen
-                            new_idx = max(self.source_index.values(), default=0) + 1
+                            new_idx = self._next_source_idx
+                            self._next_source_idx += 1
                             self.source_index[url] = new_idx
+                            self._idx_to_url[new_idx] = url
                             
-                            source = Source(
-                                source_id=f"S-GAP-{new_idx:02d}",
-                                title=item.get("title", ""),
-                                publisher=self._extract_publisher(url),
-                                url=url,
-                                extract=item.get("snippet", "")[:400],
-                                supports_claims=["GAP"]
+                            source = Source.from_search_item(f"S-GAP-{new_idx:02d}", "GAP", item)
+                            self._url_to_source[url] = source
+                            self._sources_by_claim.setdefault("GAP", []).append(
+                                self._source_entry(new_idx, source)
                             )
                             
                             # Zu einem neuen EvidencePack hinzufügen
@@ -1707,7 +2559,7 @@ DEIN VERDICT:"""
             tool_calls=list(tools_used),
             details={
                 "queries_count": len(research_queries),
-                "queries_executed": min(len(research_queries), 5),
+                "queries_executed": len(queries),
                 "new_sources_found": new_sources,
                 "queries": [q["query"] for q in queries_executed],
                 "sources_per_query": [q["sources_found"] for q in queries_executed],
@@ -1720,6 +2572,96 @@ DEIN VERDICT:"""
             agent_name="Retriever",
             content=f"✅ {new_sources} neue Quellen gefunden"
         )
+        
+        return new_sources
+    
+    def _revision_prompt_tail(self, article: str) -> str:
+        """
+        Verdict-unabhängiger Teil des Revisions-Prompts (Artikel + Längen-Check).
+        """
+        # Aktuelle Wortanzahl für den Prompt
+        current_word_count = _article_stats(article)["word_count"] if article else 0
+        
+        return f"""# AKTUELLER ARTIKEL
+{article}
+
+# LÄNGEN-CHECK
+- Aktuelle Wörter: {current_word_count}
+- Zielbereich: 1200-1800 Wörter (Übersichtsartikel)
+- Wenn nach Löschungen die Wortanzahl unter 1200 fällt: Erweitere belegte Abschnitte!
+
+ÜBERARBEITETER ARTIKEL:"""
+    
+    def _sections_for_issues(self, sections: List[str], issues) -> Optional[List[int]]:
+        """
+        Ordnet jedes Issue einem oder mehreren Abschnitten zu.
+        
+        Treffer: location ist die ganze Überschriftenzeile eines Abschnitts
+        (mit oder ohne Nummer) oder eine zitierte Stelle im Abschnittstext.
+        
+        Returns:
+            Sortierte Abschnitts-Indizes, oder None wenn ein Issue nicht lokal
+            zuordenbar ist (dann wird der ganze Artikel überarbeitet)
+        """
+        if not issues:
+            return None
+        
+        # Pro Abschnitt die Überschriftenzeile mit und ohne Nummer - verglichen
+        # wird nur die ganze Zeile, ein Teilstring ("KI") träfe sonst fremde Abschnitte
+        headings = []
+        for section in sections:
+            line = section.split("\n", 1)[0].lstrip("#").strip().lower()
+            headings.append({line, _HEADING_NUMBER_RE.sub("", line)})
+        targets = set()
+        for issue in issues:
+            if issue.type not in self.SECTION_REVISION_TYPES:
+                return None
+            location = (issue.location or "").strip()
+            heading = location.lstrip("#").strip(" \"'„“").lower()
+            # Teil 0 (Titel/Vorspann) wird nie einzeln überarbeitet
+            hits = {i for i in range(1, len(sections)) if heading and heading in headings[i]}
+            if not hits and len(location) >= 20:
+                hits = {i for i in range(1, len(sections)) if location in sections[i]}
+            if not hits:
+                return None
+            targets |= hits
+        return sorted(targets)
+    
+    def _section_revision_tail(self, excerpt: List[str], total_sections: int) -> str:
+        """Prompt-Teil für die abschnittsweise Revision (statt des ganzen Artikels)."""
+        return f"""# ZU ÜBERARBEITENDE ABSCHNITTE ({len(excerpt)} von {total_sections})
+{"".join(excerpt).rstrip()}
+
+# RÜCKGABE (ABWEICHEND VON "VOLLSTÄNDIGKEIT")
+- Du siehst NUR die betroffenen Abschnitte, der Rest des Artikels bleibt unverändert
+- Gib GENAU diese {len(excerpt)} Abschnitte überarbeitet zurück, in derselben Reihenfolge
+- Jeder Abschnitt beginnt mit seiner unveränderten "## "-Überschrift
+- Keine weiteren Abschnitte, kein Artikeltitel
+
+ÜBERARBEITETE ABSCHNITTE:"""
+    
+    @staticmethod
+    def _merge_revised_sections(sections: List[str], targets: List[int], revised: str) -> Optional[str]:
+        """
+        Setzt die überarbeiteten Abschnitte in den Artikel ein.
+        
+        Returns:
+            Den zusammengesetzten Artikel, oder None wenn die Antwort nicht
+            genau die angefragten Abschnitte enthält (-> Revision des ganzen Artikels)
+        """
+        revised_sections = [
+            part for part in _SECTION_SPLIT_RE.split((revised or "").strip())
+            if part.startswith("## ")
+        ]
+        if len(revised_sections) != len(targets):
+            return None
+        
+        merged = list(sections)
+        for i, new_section in zip(targets, revised_sections):
+            # Abstand zum nächsten Abschnitt wie im Original beibehalten
+            original = merged[i]
+            merged[i] = new_section.rstrip() + original[len(original.rstrip()):]
+        return "".join(merged)
     
     def _revise_article(self, verdict) -> Generator[AgentEvent, None, str]:
         """
@@ -1736,111 +2678,47 @@ DEIN VERDICT:"""
         )
         
         # Feedback aufbereiten - mit expliziten Anweisungen
-        issues_text = ""
+        issue_parts = []
         for issue in verdict.issues:
-            issues_text += f"- [{issue.severity.upper()}] {issue.type}: {issue.description}\n"
+            issue_parts.append(f"- [{issue.severity.upper()}] {issue.type}: {issue.description}\n")
             if issue.suggested_action == "remove":
-                issues_text += f"  ⚠️ AKTION: LÖSCHE DEN GESAMTEN SATZ! Keine weichere Formulierung!\n"
+                issue_parts.append("  ⚠️ AKTION: LÖSCHE DEN GESAMTEN SATZ! Keine weichere Formulierung!\n")
             elif issue.suggested_action == "research":
-                issues_text += f"  AKTION: Ergänze Quellenbeleg oder LÖSCHE falls keine Quelle vorhanden\n"
+                issue_parts.append("  AKTION: Ergänze Quellenbeleg oder LÖSCHE falls keine Quelle vorhanden\n")
             else:
-                issues_text += f"  Aktion: {issue.suggested_action}\n"
+                issue_parts.append(f"  Aktion: {issue.suggested_action}\n")
+            if issue.location:
+                issue_parts.append(f"  Stelle: {issue.location}\n")
+        issues_text = "".join(issue_parts)
         
         # Neue Quellen falls vorhanden
         new_sources_text = ""
         if "GAP" in self.evidence_packs:
-            new_sources_text = "\n\n# NEUE QUELLEN (aus Nachrecherche)\n"
+            source_parts = ["\n\n# NEUE QUELLEN (aus Nachrecherche)\n"]
             for source in self.evidence_packs["GAP"].sources:
                 idx = self.source_index.get(source.url, "?")
-                new_sources_text += f"[{idx}] {source.publisher}: {source.title}\n"
-                new_sources_text += f"    URL: {source.url}\n"
-                new_sources_text += f"    Auszug: {source.extract[:200]}...\n\n"
+                source_parts.append(
+                    f"[{idx}] {source.publisher}: {source.title}\n"
+                    f"    URL: {source.url}\n"
+                    f"    Auszug: {source.extract[:200]}...\n\n"
+                )
+            new_sources_text = "".join(source_parts)
         
-        # Aktuelle Wortanzahl für den Prompt
-        current_word_count = len(self.article.split()) if self.article else 0
+        # Lassen sich alle Issues einzelnen Abschnitten zuordnen, werden nur
+        # diese gesendet und danach in den unveränderten Rest eingesetzt
+        sections = _SECTION_SPLIT_RE.split(self.article)
+        targets = self._sections_for_issues(sections, verdict.issues)
+        if not (targets and sum(len(sections[i]) for i in targets) <= len(self.article) * self.SECTION_REVISION_MAX_SHARE):
+            targets = None
         
-        prompt = f"""Du bist ein erfahrener wissenschaftlicher Lektor. Deine Aufgabe ist eine GEZIELTE ÜBERARBEITUNG.
-
-# EDITOR-FEEDBACK
+        feedback = f"""# EDITOR-FEEDBACK
 {verdict.summary}
 
 ## Zu behebende Probleme:
 {issues_text}
 {new_sources_text}
 
-# AKTUELLER ARTIKEL
-{self.article}
-
-# ÜBERARBEITUNGSANLEITUNG
-
-## Dein Auftrag
-Behebe EXAKT die oben genannten Probleme. Nicht mehr, nicht weniger.
-
-## Issue-spezifische Maßnahmen
-- "sources": Füge an den kritisierten Stellen fehlende Quellenverweise [X] ein
-- "structure": Ergänze konkret die fehlenden Abschnitte (z.B. Executive Summary, Limitations)
-- "content_gap": Vertiefe GENAU die genannten Themen mit den neuen Quellen
-- "consistency": Korrigiere PRÄZISE die genannten Widersprüche
-- "length": Erweitere die KONKRET kritisierten dünnen Passagen
-
-## HALLUZINATIONS-BEHANDLUNG (KRITISCH - LIES DAS GENAU!)
-
-### Bei action "remove": KOMPLETTE LÖSCHUNG!
-**WICHTIG:** "remove" bedeutet den GESAMTEN SATZ LÖSCHEN, nicht nur die Zahlen ersetzen!
-
-FALSCH:
-- "Studien zeigen 30-55% Produktivitätssteigerung" → "Studien diskutieren Produktivitätssteigerung"
-- Das ist KEINE Löschung, das ist eine Abschwächung! Der Editor wird das WIEDER finden!
-
-RICHTIG:
-- "Studien zeigen 30-55% Produktivitätssteigerung" → SATZ KOMPLETT STREICHEN
-- Der Satz verschwindet aus dem Artikel, keine weichere Version!
-
-### Konkrete Regeln für "remove":
-1. Finde den GANZEN SATZ der die unbelegte Behauptung enthält
-2. LÖSCHE den Satz KOMPLETT aus dem Artikel
-3. Wenn nötig, passe den Übergang zum nächsten Satz an
-4. KEINE "softeren" Formulierungen wie "Es wird diskutiert...", "Berichte deuten an..."
-
-### WICHTIG: Abschnitte NICHT leer lassen!
-Nach dem Löschen von Halluzinationen:
-- Prüfe ob der Abschnitt noch genug Inhalt hat (mind. 2-3 Absätze)
-- Wenn ein Abschnitt fast leer wird: Fülle ihn mit BELEGTEN Informationen aus den verfügbaren Quellen
-- Nutze Fakten aus dem Quellenmaterial die zum Abschnittsthema passen
-- Jeder neue Satz MUSS eine Quellenreferenz [X] haben
-- Lieber kürzere, belegte Abschnitte als leere Überschriften!
-
-### Bei action "research": 
-- Ergänze Quellenreferenz [X] NUR wenn die neue Quelle EXAKT diese Behauptung belegt
-- Wenn neue Quelle andere Zahlen nennt → passe die Zahl im Artikel an die Quelle an!
-- Wenn keine passende Quelle gefunden wurde → behandle wie "remove"!
-
-## Qualitätsprinzipien
-1. CHIRURGISCHE PRÄZISION: Ändere nur, was kritisiert wurde
-2. KONTEXT BEWAHREN: Bestehende gute Passagen bleiben unverändert
-3. QUELLENINTEGRITÄT: Alle [X]-Verweise müssen erhalten bleiben
-4. VOLLSTÄNDIGKEIT: Gib den GESAMTEN Artikel zurück (nicht nur Änderungen)
-
-## KRITISCH - KEINE META-KOMMENTARE!
-Der finale Artikel ist für LESER bestimmt, NICHT für Editoren. Daher:
-- KEINE Hinweise auf "ursprüngliche Fassung" oder "vorherige Version"
-- KEINE Kommentare wie "(Abschnitt vervollständigt)", "(neu)", "(ergänzt)"
-- KEINE Erklärungen wie "Dieser Abschnitt wurde überarbeitet weil..."
-- KEINE Metainformationen über den Überarbeitungsprozess
-- Der Leser darf NICHT merken, dass der Text überarbeitet wurde
-- Schreibe so, als wäre es die ERSTE und EINZIGE Version
-
-## WICHTIG
-- Keine proaktiven "Verbesserungen" an Stellen ohne Kritik
-- Kein Fülltext - jede Ergänzung muss einen Issue adressieren
-- Der wissenschaftliche Ton bleibt durchgehend sachlich
-
-## LÄNGEN-CHECK
-- Aktuelle Wörter: {current_word_count}
-- Zielbereich: 1200-1800 Wörter (Übersichtsartikel)
-- Wenn nach Löschungen die Wortanzahl unter 1200 fällt: Erweitere belegte Abschnitte!
-
-ÜBERARBEITETER ARTIKEL:"""
+"""
 
         # === LOGGING: Start Revision Step ===
         step_idx = self.logger.start_step(
@@ -1852,58 +2730,48 @@ Der finale Artikel ist für LESER bestimmt, NICHT für Editoren. Daher:
             task=f"Überarbeite basierend auf {len(verdict.issues)} Issues"
         )
         
+        def revise(tail: str) -> Generator[AgentEvent, None, tuple]:
+            # OpenAI / Anthropic gestreamt (die UI sieht den Fortschritt), Gemini blockierend
+            return self._with_llm_retry(
+                lambda: self._stream_text(
+                    feedback + tail, model_name, provider,
+                    max_tokens=16000,  # Erhöht für längere Revisionen
+                    agent_name="Writer",
+                    static_prefix=_REVISION_STATIC_PROMPT
+                ),
+                agent_name="Writer"
+            )
+        
         try:
-            # Provider-spezifischer API-Aufruf
-            if provider == "openai":
-                from openai import OpenAI
-                from config import OPENAI_API_KEY
-                
-                client = OpenAI(api_key=OPENAI_API_KEY)
-                response = client.chat.completions.create(
-                    model=model_name,
-                    messages=[{"role": "user", "content": prompt}],
-                    max_completion_tokens=16000  # Erhöht für längere Revisionen
+            revised_article = None
+            tokens = {"input": 0, "output": 0}
+            section_merge_failed = False
+            if targets is not None:
+                revised_sections, tokens = yield from revise(
+                    self._section_revision_tail([sections[i] for i in targets], len(sections) - 1)
                 )
-                revised_article = response.choices[0].message.content
-                tokens = {
-                    "input": response.usage.prompt_tokens if hasattr(response, 'usage') else 0,
-                    "output": response.usage.completion_tokens if hasattr(response, 'usage') else 0
-                }
-            elif provider == "gemini":
-                import google.generativeai as genai
-                from config import GEMINI_API_KEY
-                
-                genai.configure(api_key=GEMINI_API_KEY)
-                model = genai.GenerativeModel(model_name)
-                response = model.generate_content(
-                    prompt,
-                    generation_config=genai.GenerationConfig(
-                        max_output_tokens=16000
+                revised_article = self._merge_revised_sections(sections, targets, revised_sections)
+                if revised_article is None:
+                    # Antwort enthält nicht genau die angefragten Abschnitte:
+                    # ganzen Artikel überarbeiten statt die Issues zu verwerfen
+                    section_merge_failed = True
+                    yield AgentEvent(
+                        event_type=EventType.STATUS,
+                        agent_name="Writer",
+                        content="⚠️ Abschnitte nicht zuordenbar - überarbeite ganzen Artikel...",
+                        data={
+                            "status": "section_merge_failed",
+                            "requested_sections": len(targets)
+                        }
                     )
-                )
-                revised_article = response.text
-                tokens = {
-                    "input": response.usage_metadata.prompt_token_count if hasattr(response, 'usage_metadata') else 0,
-                    "output": response.usage_metadata.candidates_token_count if hasattr(response, 'usage_metadata') else 0
-                }
-            else:
-                from anthropic import Anthropic
-                from config import ANTHROPIC_API_KEY
-                
-                client = Anthropic(api_key=ANTHROPIC_API_KEY)
-                response = client.messages.create(
-                    model=model_name,
-                    max_tokens=16000,  # Erhöht für längere Revisionen
-                    messages=[{"role": "user", "content": prompt}]
-                )
-                revised_article = response.content[0].text
-                tokens = {
-                    "input": response.usage.input_tokens if hasattr(response, 'usage') else 0,
-                    "output": response.usage.output_tokens if hasattr(response, 'usage') else 0
-                }
+                    targets = None
+            
+            if revised_article is None:
+                revised_article, full_tokens = yield from revise(self._revision_prompt_tail(self.article))
+                tokens = {key: tokens[key] + full_tokens.get(key, 0) for key in tokens}
             
-            word_count = len(revised_article.split()) if revised_article else 0
-            original_word_count = len(self.article.split()) if self.article else 0
+            word_count = _article_stats(revised_article)["word_count"] if revised_article else 0
+            original_word_count = _article_stats(self.article)["word_count"] if self.article else 0
             
             # === FALLBACK: Wenn Revision leer oder viel kürzer, behalte Original ===
             if word_count < 500 or (original_word_count > 0 and word_count < original_word_count * 0.3):
@@ -1925,7 +2793,13 @@ Der finale Artikel ist für LESER bestimmt, NICHT für Editoren. Daher:
                 yield AgentEvent(
                     event_type=EventType.STATUS,
                     agent_name="Writer",
-                    content=f"⚠️ Revision fehlgeschlagen ({word_count} Wörter) - behalte Original ({original_word_count} Wörter)"
+                    content=f"⚠️ Revision fehlgeschlagen ({word_count} Wörter) - behalte Original ({original_word_count} Wörter)",
+                    data={
+                        "status": "revision_fallback",
+                        "word_count": word_count,
+                        "original_word_count": original_word_count,
+                        "model": model_name
+                    }
                 )
                 
                 return self.article  # Behalte das Original!
@@ -1940,6 +2814,8 @@ Der finale Artikel ist für LESER bestimmt, NICHT für Editoren. Daher:
                     "issues_addressed": len(verdict.issues),
                     "new_word_count": word_count,
                     "model_used": model_name,
+                    "revised_sections": len(targets) if targets is not None else None,
+                    "section_merge_failed": section_merge_failed,
                     # DEBUG: Was wurde an den Reviser gesendet?
                     "debug_issues_sent": [
                         {
@@ -1957,7 +2833,14 @@ Der finale Artikel ist für LESER bestimmt, NICHT für Editoren. Daher:
             yield AgentEvent(
                 event_type=EventType.STATUS,
                 agent_name="Writer",
-                content=f"✅ Revision: {word_count} Wörter"
+                content=f"✅ Revision: {word_count} Wörter",
+                data={
+                    "status": "revision_done",
+                    "word_count": word_count,
+                    "original_word_count": original_word_count,
+                    "revised_sections": len(targets) if targets is not None else None,
+                    "model": model_name
+                }
             )
             
             # Post-Processing: Entferne ungültige Quellenreferenzen
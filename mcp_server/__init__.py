@@ -2,9 +2,25 @@
 HayMAS MCP Server - Stellt Tools für Agenten bereit
 """
 
+import importlib
+
 from .tools.tavily_search import tavily_search
-from .tools.ppt_generator import create_ppt
-from .tools.file_tools import save_markdown, read_markdown
+
+# Legacy Tools erst beim ersten Zugriff importieren (PEP 562)
+_LAZY_TOOLS = {
+    "create_ppt": ".tools.ppt_generator",
+    "save_markdown": ".tools.file_tools",
+    "read_markdown": ".tools.file_tools",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_TOOLS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     "tavily_search",
@@ -0,0 +1,84 @@
+"""
+HayMAS Search Cache
+
+Persistenter Cache für Such-Tool-Ergebnisse (SQLite, nur Standardbibliothek).
+Schlüssel ist (tool, query, max_results); die Gültigkeit (TTL) hängt vom
+Tool ab - News veralten schneller als wissenschaftliche Paper.
+"""
+
+import os
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, Optional
+
+import sys
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT_DIR not in sys.path:
+    sys.path.append(_ROOT_DIR)
+
+from config import SEARCH_CACHE_PATH, SEARCH_CACHE_ENABLED, SEARCH_CACHE_TTL, SEARCH_CACHE_DEFAULT_TTL
+
+
+class SearchCache:
+    """
+    Thread-sicherer Key-Value-Cache auf SQLite-Basis.
+
+    Es werden nur erfolgreiche Ergebnisse gespeichert, damit Fehler
+    (Rate-Limits, Timeouts) beim nächsten Lauf erneut versucht werden.
+    """
+
+    def __init__(self, path: str = SEARCH_CACHE_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS search_cache ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " expires_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def _key(tool: str, query: str, max_results: int) -> str:
+        return json.dumps([tool, query, max_results], ensure_ascii=False)
+
+    def get(self, tool: str, query: str, max_results: int) -> Optional[Dict[str, Any]]:
+        """Gibt ein gültiges Ergebnis zurück oder None (Miss / abgelaufen)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM search_cache WHERE key = ?",
+                (self._key(tool, query, max_results),)
+            ).fetchone()
+        if row is None or row[1] < time.time():
+            return None
+        return json.loads(row[0])
+
+    def set(self, tool: str, query: str, max_results: int, result: Dict[str, Any]):
+        """Speichert ein Ergebnis mit der TTL des Tools."""
+        if not result or result.get("success") is False:
+            return
+        ttl = SEARCH_CACHE_TTL.get(tool, SEARCH_CACHE_DEFAULT_TTL)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (self._key(tool, query, max_results), json.dumps(result, ensure_ascii=False), time.time() + ttl)
+            )
+            self._conn.commit()
+
+
+# Globale Cache-Instanz
+_cache_instance = None
+
+
+def get_search_cache() -> Optional[SearchCache]:
+    """Gibt die globale Cache-Instanz zurück (None wenn deaktiviert)."""
+    global _cache_instance
+    if not SEARCH_CACHE_ENABLED:
+        return None
+    if _cache_instance is None:
+        _cache_instance = SearchCache()
+    return _cache_instance
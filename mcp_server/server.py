@@ -7,11 +7,14 @@ Dies ist eine vereinfachte MCP-Implementation für den Prototypen.
 Die Research-Tools werden automatisch aus der Tool-Registry geladen.
 """
 
-from typing import Dict, Any, Callable, List
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, List, Optional, Tuple
 from dataclasses import dataclass, field
 
 # Research Tools aus der Registry
 from .tools.registry import get_all_tools as get_all_research_tools, get_tool as get_research_tool
+from .tools.async_runner import run_async
 
 # Legacy Tools (Datei-Operationen, PPT)
 from .tools.file_tools import (
@@ -42,6 +45,9 @@ class ToolRegistry:
     # Tool-Definitionen für Anthropic Format
     _anthropic_tools: Dict[str, Dict] = field(default_factory=dict)
     
+    # Gefilterte Tool-Listen pro (Provider, Namen), invalidiert bei register()
+    _tool_list_cache: Dict[Tuple[str, Any], Tuple[Dict, ...]] = field(default_factory=dict)
+    
     def register(
         self, 
         name: str, 
@@ -53,6 +59,18 @@ class ToolRegistry:
         self._tools[name] = func
         self._openai_tools[name] = openai_def
         self._anthropic_tools[name] = anthropic_def
+        self._tool_list_cache.clear()
+    
+    def register_many(self, tools: Dict[str, Tuple[Callable, Dict, Dict]]):
+        """Registriert mehrere Tools auf einmal: {Name: (Funktion, OpenAI-Def, Anthropic-Def)}"""
+        self._tools.update({name: spec[0] for name, spec in tools.items()})
+        self._openai_tools.update({name: spec[1] for name, spec in tools.items()})
+        self._anthropic_tools.update({name: spec[2] for name, spec in tools.items()})
+        self._tool_list_cache.clear()
+    
+    def register_internal(self, name: str, func: Callable):
+        """Registriert ein Tool nur für direkte Aufrufe (nicht in LLM-Tool-Listen)"""
+        self._tools[name] = func
     
     def get_tool(self, name: str) -> Callable:
         """Gibt die Funktion für ein Tool zurück"""
@@ -60,15 +78,27 @@ class ToolRegistry:
     
     def get_openai_tools(self, names: List[str] = None) -> List[Dict]:
         """Gibt Tool-Definitionen im OpenAI Format zurück"""
-        if names:
-            return [self._openai_tools[n] for n in names if n in self._openai_tools]
-        return list(self._openai_tools.values())
+        return list(self._tool_list("openai", names))
     
     def get_anthropic_tools(self, names: List[str] = None) -> List[Dict]:
         """Gibt Tool-Definitionen im Anthropic Format zurück"""
-        if names:
-            return [self._anthropic_tools[n] for n in names if n in self._anthropic_tools]
-        return list(self._anthropic_tools.values())
+        return list(self._tool_list("anthropic", names))
+    
+    def _tool_list(self, provider: str, names: List[str] = None) -> Tuple[Dict, ...]:
+        """
+        Gefilterte Tool-Liste, gecacht pro (Provider, Namen) - wird für
+        jeden LLM-Turn abgefragt, ändert sich aber nur bei register().
+        """
+        key = (provider, tuple(names) if names else None)
+        tools = self._tool_list_cache.get(key)
+        if tools is None:
+            defs = self._openai_tools if provider == "openai" else self._anthropic_tools
+            if names:
+                tools = tuple(defs[n] for n in names if n in defs)
+            else:
+                tools = tuple(defs.values())
+            self._tool_list_cache[key] = tools
+        return tools
     
     def call_tool(self, name: str, **kwargs) -> Dict[str, Any]:
         """Ruft ein Tool mit den gegebenen Argumenten auf"""
@@ -87,6 +117,61 @@ class ToolRegistry:
             }
 
 
+# Max. parallele Einzelsuchen innerhalb eines Batch-Aufrufs
+BATCH_MAX_WORKERS = 4
+
+
+def _batch_error(query: str, e: Exception) -> Dict[str, Any]:
+    """Ergebnis-Eintrag für eine fehlgeschlagene Query im Batch"""
+    return {
+        "success": False,
+        "query": query,
+        "results": [],
+        "error": f"Fehler bei Tool-Aufruf: {str(e)}"
+    }
+
+
+def _make_batch_search(search_func: Callable, search_func_async: Optional[Callable] = None) -> Callable:
+    """
+    Baut aus einer Such-Funktion eine Batch-Variante.
+    
+    Die Queries laufen parallel; ein Fehler in einer Query betrifft nur
+    deren Eintrag in results_per_query (Reihenfolge = Reihenfolge der Queries).
+    Hat das Tool eine Coroutine-Variante, laufen die Queries per gather auf
+    dem gemeinsamen Tools-Loop (max. BATCH_MAX_WORKERS gleichzeitig) statt
+    in Worker-Threads.
+    """
+    def _search_one(query: str, max_results: int) -> Dict[str, Any]:
+        try:
+            return search_func(query=query, max_results=max_results)
+        except Exception as e:
+            return _batch_error(query, e)
+    
+    async def _gather(queries: List[str], max_results: int) -> List[Dict[str, Any]]:
+        semaphore = asyncio.Semaphore(BATCH_MAX_WORKERS)
+        
+        async def _search_one_async(query: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await search_func_async(query=query, max_results=max_results)
+                except Exception as e:
+                    return _batch_error(query, e)
+        
+        return await asyncio.gather(*(_search_one_async(q) for q in queries))
+    
+    def batch_search(queries: List[str], max_results: int = 5) -> Dict[str, Any]:
+        if not queries:
+            return {"success": True, "results_per_query": []}
+        if search_func_async is not None:
+            results = run_async(_gather(queries, max_results))
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(queries), BATCH_MAX_WORKERS)) as pool:
+                results = list(pool.map(lambda q: _search_one(q, max_results), queries))
+        return {"success": True, "results_per_query": results}
+    
+    return batch_search
+
+
 class MCPServer:
     """
     MCP Server für HayMAS
@@ -95,6 +180,16 @@ class MCPServer:
     Research-Tools werden automatisch aus der Tool-Registry geladen.
     """
     
+    # Tool-Zuordnung pro Agent (Defaults)
+    AGENT_TOOLS = {
+        "orchestrator": (),  # Orchestrator ruft andere Agenten auf, keine direkten Tools
+        "researcher": ("tavily_search",),  # Default, kann überschrieben werden
+        "writer": ("save_markdown",),  # Writer speichert Artikel
+        "editor": ("read_markdown",),   # Editor liest Artikel
+        "structurer": ("save_markdown", "read_markdown"),  # Legacy
+        "ppt_generator": ("create_ppt",)  # Optional für PPT
+    }
+    
     def __init__(self):
         self.registry = ToolRegistry()
         self._register_all_tools()
@@ -108,15 +203,21 @@ class MCPServer:
         # Import der Tools triggert deren Registrierung in der Research-Registry
         from .tools import tavily_search, wikipedia_search, gnews_search, hackernews_search
         
-        # Research-Tools aus der Registry laden und hier registrieren
-        for research_tool in get_all_research_tools():
-            if research_tool.search_func and research_tool.tool_schema_openai:
-                self.registry.register(
-                    name=f"{research_tool.id}_search",
-                    func=research_tool.search_func,
-                    openai_def=research_tool.tool_schema_openai,
-                    anthropic_def=research_tool.tool_schema_anthropic
-                )
+        # Research-Tools aus der Registry laden und gesammelt registrieren
+        research_tools = [
+            t for t in get_all_research_tools()
+            if t.search_func and t.tool_schema_openai
+        ]
+        self.registry.register_many({
+            f"{t.id}_search": (t.search_func, t.tool_schema_openai, t.tool_schema_anthropic)
+            for t in research_tools
+        })
+        # Batch-Variante: mehrere Queries in einem Aufruf
+        for t in research_tools:
+            self.registry.register_internal(
+                name=f"{t.id}_search_batch",
+                func=_make_batch_search(t.search_func, t.search_func_async)
+            )
         
         # =================================================================
         # LEGACY TOOLS (Datei-Operationen, PPT)
@@ -162,21 +263,8 @@ class MCPServer:
         Returns:
             Liste von Tool-Definitionen
         """
-        # Tool-Zuordnung pro Agent (Defaults)
-        agent_tools = {
-            "orchestrator": [],  # Orchestrator ruft andere Agenten auf, keine direkten Tools
-            "researcher": ["tavily_search"],  # Default, kann überschrieben werden
-            "writer": ["save_markdown"],  # Writer speichert Artikel
-            "editor": ["read_markdown"],   # Editor liest Artikel
-            "structurer": ["save_markdown", "read_markdown"],  # Legacy
-            "ppt_generator": ["create_ppt"]  # Optional für PPT
-        }
-        
         # Spezifische Tools überschreiben die Defaults
-        if specific_tools:
-            allowed_tools = specific_tools
-        else:
-            allowed_tools = agent_tools.get(agent_type, [])
+        allowed_tools = specific_tools or self.AGENT_TOOLS.get(agent_type)
         
         # Filtern auf erlaubte Tools
         if not allowed_tools:
@@ -2,8 +2,12 @@
 HayMAS Tools - Verfügbare Tools für MCP Server
 
 Die Tool-Registry wird automatisch befüllt, wenn die Tool-Module importiert werden.
+Die Legacy-Tools (PPT, Dateien) registrieren sich nicht selbst und werden erst
+beim ersten Zugriff importiert (PEP 562).
 """
 
+import importlib
+
 # Registry zuerst importieren
 from .registry import (
     get_all_tools,
@@ -25,9 +29,21 @@ from .semantic_scholar_tool import semantic_scholar_search
 from .arxiv_tool import arxiv_search
 from .ted_tool import ted_search
 
-# Legacy Tools
-from .ppt_generator import create_ppt
-from .file_tools import save_markdown, read_markdown
+# Legacy Tools: lazy (Name -> Modul)
+_LAZY_TOOLS = {
+    "create_ppt": ".ppt_generator",
+    "save_markdown": ".file_tools",
+    "read_markdown": ".file_tools",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_TOOLS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     # Registry
@@ -6,11 +6,16 @@ Besonders stark in: Machine Learning, KI, Physik, Mathematik, Computer Science.
 Kostenlos und ohne API-Key!
 """
 
-import httpx
 from typing import Dict, Any, List, Optional
-import asyncio
+import io
 import re
-from xml.etree import ElementTree
+
+# lxml ist optional (libxml2, deutlich schneller); Fallback auf stdlib.
+# Beide bieten iterparse/find/ParseError mit gleicher API.
+try:
+    from lxml import etree as ElementTree
+except ImportError:
+    from xml.etree import ElementTree
 
 from .registry import (
     register_tool,
@@ -19,6 +24,8 @@ from .registry import (
     create_openai_schema,
     create_anthropic_schema
 )
+from .async_runner import run_async, get_http_client
+from .search_memo import memoize_search
 
 
 async def _arxiv_search_async(
@@ -50,70 +57,90 @@ async def _arxiv_search_async(
         "User-Agent": "HayMAS/1.0 (Research Tool)"
     }
     
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, params=params, headers=headers, timeout=15.0)
-        
-        if response.status_code == 200:
-            return _parse_arxiv_response(response.text)
-        else:
-            return []
+    client = get_http_client()
+    response = await client.get(url, params=params, headers=headers, timeout=15.0)
+    
+    if response.status_code == 200:
+        return _parse_arxiv_response(response.content)
+    else:
+        return []
+
+
+# Atom-Tags in Clark-Notation (direkt vergleichbar, kein Namespace-Mapping pro find)
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_ENTRY_TAG = _ATOM + "entry"
+_ID_TAG = _ATOM + "id"
+_TITLE_TAG = _ATOM + "title"
+_SUMMARY_TAG = _ATOM + "summary"
+_AUTHOR_TAG = _ATOM + "author"
+_NAME_TAG = _ATOM + "name"
+_PUBLISHED_TAG = _ATOM + "published"
+_CATEGORY_TAG = _ATOM + "category"
+_LINK_TAG = _ATOM + "link"
 
+# Whitespace-Folgen (Zeilenumbrüche, Tabs, Einrückung im Feed) -> ein Leerzeichen
+_WS_RE = re.compile(r"\s+")
 
-def _parse_arxiv_response(xml_text: str) -> List[Dict]:
-    """Parst die arXiv Atom XML Response."""
+
+def _parse_arxiv_response(xml_bytes: bytes) -> List[Dict]:
+    """
+    Parst die arXiv Atom XML Response.
     
-    results = []
+    Streaming per iterparse: jeder <entry> wird bei seinem End-Tag
+    ausgewertet und danach geleert, statt den ganzen Baum aufzubauen.
+    Erwartet die Roh-Bytes; das Decoding übernimmt der XML-Parser.
+    """
     
-    # Namespace für Atom
-    namespaces = {
-        'atom': 'http://www.w3.org/2005/Atom',
-        'arxiv': 'http://arxiv.org/schemas/atom'
-    }
+    results = []
     
     try:
-        root = ElementTree.fromstring(xml_text)
-        
-        for entry in root.findall('atom:entry', namespaces):
+        for _, entry in ElementTree.iterparse(io.BytesIO(xml_bytes), events=("end",)):
+            if entry.tag != _ENTRY_TAG:
+                continue
+            
             # ID (arXiv ID)
-            id_elem = entry.find('atom:id', namespaces)
+            id_elem = entry.find(_ID_TAG)
             arxiv_url = id_elem.text if id_elem is not None else ""
             arxiv_id = arxiv_url.split('/')[-1] if arxiv_url else ""
             
             # Titel
-            title_elem = entry.find('atom:title', namespaces)
-            title = title_elem.text.strip().replace('\n', ' ') if title_elem is not None else ""
+            title_elem = entry.find(_TITLE_TAG)
+            title = _WS_RE.sub(" ", title_elem.text).strip() if title_elem is not None else ""
             
             # Abstract
-            summary_elem = entry.find('atom:summary', namespaces)
-            abstract = summary_elem.text.strip().replace('\n', ' ') if summary_elem is not None else ""
+            summary_elem = entry.find(_SUMMARY_TAG)
+            abstract = _WS_RE.sub(" ", summary_elem.text).strip() if summary_elem is not None else ""
             if len(abstract) > 500:
                 abstract = abstract[:497] + "..."
             
-            # Autoren
-            authors = []
-            for author in entry.findall('atom:author', namespaces):
-                name_elem = author.find('atom:name', namespaces)
+            # Autoren (Namen nur für die ersten 3, Gesamtzahl für "et al.")
+            author_elems = entry.findall(_AUTHOR_TAG)
+            names = []
+            for author in author_elems[:3]:
+                name_elem = author.find(_NAME_TAG)
                 if name_elem is not None:
-                    authors.append(name_elem.text)
+                    names.append(name_elem.text)
             
-            author_str = ", ".join(authors[:3])
-            if len(authors) > 3:
-                author_str += f" et al. ({len(authors)} authors)"
+            author_str = ", ".join(names)
+            if len(author_elems) > 3:
+                author_str += f" et al. ({len(author_elems)} authors)"
             
             # Datum
-            published_elem = entry.find('atom:published', namespaces)
+            published_elem = entry.find(_PUBLISHED_TAG)
             published = published_elem.text[:10] if published_elem is not None else ""
             
-            # Kategorien
+            # Kategorien (max. 3, Rest wird nicht gescannt)
             categories = []
-            for cat in entry.findall('atom:category', namespaces):
+            for cat in entry.iterfind(_CATEGORY_TAG):
                 term = cat.get('term', '')
                 if term:
                     categories.append(term)
+                    if len(categories) == 3:
+                        break
             
             # PDF Link
             pdf_url = ""
-            for link in entry.findall('atom:link', namespaces):
+            for link in entry.iterfind(_LINK_TAG):
                 if link.get('title') == 'pdf':
                     pdf_url = link.get('href', '')
                     break
@@ -129,15 +156,58 @@ def _parse_arxiv_response(xml_text: str) -> List[Dict]:
                 "authors": author_str,
                 "published": published,
                 "arxiv_id": arxiv_id,
-                "categories": categories[:3]  # Max 3 Kategorien
+                "categories": categories
             })
             
+            # Eintrag ausgewertet -> Unterelemente freigeben
+            entry.clear()
+            
     except ElementTree.ParseError:
         pass
     
     return results
 
 
+@memoize_search()
+async def arxiv_search_async(
+    query: str,
+    max_results: int = 10,
+    sort_by: str = "relevance"
+) -> Dict[str, Any]:
+    """
+    Async-Variante von arxiv_search für Aufrufer mit Event-Loop.
+    
+    Muss auf dem gemeinsamen Tools-Loop laufen (run_async).
+    """
+    try:
+        papers = await _arxiv_search_async(
+            query=query,
+            max_results=min(max_results, 20),
+            sort_by=sort_by
+        )
+        
+        # _parse_arxiv_response liefert bereits das Ergebnisformat
+        results = papers
+        
+        return {
+            "success": True,
+            "tool": "arxiv",
+            "query": query,
+            "results": results,
+            "result_count": len(results)
+        }
+        
+    except Exception as e:
+        return {
+            "success": False,
+            "tool": "arxiv",
+            "query": query,
+            "results": [],
+            "result_count": 0,
+            "error": str(e)
+        }
+
+
 def arxiv_search(
     query: str,
     max_results: int = 10,
@@ -154,55 +224,8 @@ def arxiv_search(
     Returns:
         Dict mit Suchergebnissen
     """
-    
-    async def _search():
-        try:
-            papers = await _arxiv_search_async(
-                query=query,
-                max_results=min(max_results, 20),
-                sort_by=sort_by
-            )
-            
-            results = [
-                {
-                    "title": p["title"],
-                    "url": p["url"],
-                    "pdf_url": p["pdf_url"],
-                    "snippet": p["snippet"],
-                    "authors": p["authors"],
-                    "published": p["published"],
-                    "arxiv_id": p["arxiv_id"],
-                    "categories": p["categories"]
-                }
-                for p in papers
-            ]
-            
-            return {
-                "success": True,
-                "tool": "arxiv",
-                "query": query,
-                "results": results,
-                "result_count": len(results)
-            }
-            
-        except Exception as e:
-            return {
-                "success": False,
-                "tool": "arxiv",
-                "query": query,
-                "results": [],
-                "result_count": 0,
-                "error": str(e)
-            }
-    
-    # Async in sync wrapper
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    
-    return loop.run_until_complete(_search())
+    # Async in sync wrapper: gemeinsamer Hintergrund-Loop statt Loop pro Aufruf
+    return run_async(arxiv_search_async(query, max_results, sort_by))
 
 
 # =============================================================================
@@ -262,6 +285,7 @@ register_tool(ResearchTool(
     icon="📄",
     is_free=True,
     search_func=arxiv_search,
+    search_func_async=arxiv_search_async,
     requires_api_key=False,
     tool_schema_openai=ARXIV_TOOL,
     tool_schema_anthropic=ARXIV_TOOL_ANTHROPIC
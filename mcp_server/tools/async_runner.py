@@ -0,0 +1,81 @@
+"""
+HayMAS Async Runner
+
+Gemeinsamer Event-Loop und HTTP-Client für die async Research-Tools
+(arXiv, Semantic Scholar, Wikipedia, Hacker News, TED).
+
+Die Tools werden synchron aufgerufen (oft aus Worker-Threads der Batch-Suche).
+Statt pro Aufruf einen eigenen Event-Loop aufzusetzen, laufen alle Coroutinen
+auf einem Loop in einem Hintergrund-Thread, der beim ersten Aufruf startet.
+Da alle Requests auf diesem Loop laufen, teilen sie sich einen
+httpx.AsyncClient (Keep-Alive statt TCP/TLS-Aufbau pro Suche).
+"""
+
+import asyncio
+import atexit
+import threading
+from typing import Any, Coroutine, Optional
+
+import httpx
+
+
+# Connection-Pool des gemeinsamen Clients
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Gibt den Hintergrund-Loop zurück (startet ihn beim ersten Aufruf)."""
+    global _loop
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever,
+                    name="haymas-tools-loop",
+                    daemon=True
+                ).start()
+                _loop = loop
+    return _loop
+
+
+def run_async(coro: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Führt eine Coroutine auf dem gemeinsamen Loop aus und wartet auf das
+    Ergebnis (blockiert nur den aufrufenden Thread).
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Gemeinsamer httpx.AsyncClient für alle Tool-Requests.
+    
+    Nur aus Coroutinen aufrufen, die über run_async() laufen - der Client
+    ist an den Hintergrund-Loop gebunden.
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(limits=HTTP_POOL_LIMITS)
+    return _http_client
+
+
+@atexit.register
+def close_http_client():
+    """
+    Schließt die Keep-Alive-Verbindungen des gemeinsamen Clients (best effort).
+    
+    Wird beim Beenden automatisch aufgerufen; Server können es zusätzlich beim
+    Shutdown aufrufen. Ein späterer get_http_client() legt einen neuen Client an.
+    """
+    global _http_client
+    client, _http_client = _http_client, None
+    if client is not None and _loop is not None and _loop.is_running():
+        try:
+            asyncio.run_coroutine_threadsafe(client.aclose(), _loop).result(timeout=2)
+        except Exception:
+            pass
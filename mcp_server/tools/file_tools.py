@@ -12,9 +12,16 @@ from typing import Dict, Any
 OUTPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "output")
 
 
+# Wird nach dem ersten makedirs gesetzt (spart den stat-Aufruf pro Speichern)
+_output_dir_ready = False
+
+
 def ensure_output_dir():
     """Stellt sicher, dass das Output-Verzeichnis existiert"""
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    global _output_dir_ready
+    if not _output_dir_ready:
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
+        _output_dir_ready = True
 
 
 def save_markdown(content: str, filename: str = None) -> Dict[str, Any]:
@@ -88,7 +95,10 @@ def read_markdown(filename: str) -> Dict[str, Any]:
         
         filepath = os.path.join(OUTPUT_DIR, filename)
         
-        if not os.path.exists(filepath):
+        try:
+            with open(filepath, "r", encoding="utf-8") as f:
+                content = f.read()
+        except FileNotFoundError:
             return {
                 "success": False,
                 "content": None,
@@ -96,9 +106,6 @@ def read_markdown(filename: str) -> Dict[str, Any]:
                 "error": f"Datei nicht gefunden: {filename}"
             }
         
-        with open(filepath, "r", encoding="utf-8") as f:
-            content = f.read()
-        
         return {
             "success": True,
             "content": content,
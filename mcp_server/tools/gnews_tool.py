@@ -5,7 +5,9 @@ Ermöglicht Zugriff auf aktuelle Nachrichten via gnews Library.
 Kostenlos und ohne API-Key nutzbar.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+import asyncio
+import threading
 from datetime import datetime
 
 from .registry import (
@@ -15,27 +17,69 @@ from .registry import (
     create_openai_schema,
     create_anthropic_schema
 )
+from .async_runner import run_async
+from .search_memo import memoize_search
 
-# gnews wird lazy importiert
-_gnews_client = None
+# gnews wird lazy importiert; Clients werden pro Parameter-Kombination
+# wiederverwendet (jede Instanz baut intern eine eigene HTTP-Session auf)
+_GNEWS_CLIENTS: Dict[Tuple[str, str, str, int], Any] = {}
+_gnews_clients_lock = threading.Lock()
 
 
-def _get_gnews_client(language: str = "de", country: str = "DE", period: str = "7d"):
-    """Lazy initialization des GNews Clients"""
-    global _gnews_client
-    try:
-        from gnews import GNews
-        _gnews_client = GNews(
-            language=language,
-            country=country,
-            period=period,
-            max_results=10
-        )
-        return _gnews_client
-    except ImportError:
-        raise ImportError("gnews nicht installiert. Bitte 'pip install gnews' ausführen.")
+def _get_gnews_client(
+    language: str = "de",
+    country: str = "DE",
+    period: str = "7d",
+    max_results: int = 10
+):
+    """Gibt den GNews Client für diese Parameter zurück (lazy erstellt)"""
+    key = (language, country, period, max_results)
+    client = _GNEWS_CLIENTS.get(key)
+    if client is None:
+        with _gnews_clients_lock:
+            client = _GNEWS_CLIENTS.get(key)
+            if client is None:
+                from gnews import GNews
+                client = GNews(
+                    language=language,
+                    country=country,
+                    period=period,
+                    max_results=max_results
+                )
+                _GNEWS_CLIENTS[key] = client
+    return client
+
+
+async def _gnews_search_async(
+    query: str,
+    max_results: int,
+    period: str,
+    language: str,
+    country: str
+) -> List[Dict]:
+    """
+    Führt die Suche aus. gnews ist synchron (Scraping via requests), daher
+    läuft get_news in einem Worker-Thread und blockiert den Loop nicht.
+    """
+    client = _get_gnews_client(language, country, period, max_results)
+    raw_results = await asyncio.to_thread(client.get_news, query)
+    
+    results = []
+    for item in raw_results or []:
+        # Datum parsen
+        published = item.get("published date", "")
+        
+        results.append({
+            "title": item.get("title", ""),
+            "url": item.get("url", ""),
+            "snippet": item.get("description", ""),
+            "published": published,
+            "source": item.get("publisher", {}).get("title", "Unbekannt")
+        })
+    return results
 
 
+@memoize_search()
 def gnews_search(
     query: str,
     max_results: int = 10,
@@ -57,31 +101,13 @@ def gnews_search(
         Dict mit Suchergebnissen
     """
     try:
-        from gnews import GNews
-        
-        # Neuen Client für diese Anfrage erstellen (wegen Parametern)
-        gnews = GNews(
-            language=language,
-            country=country,
+        results = run_async(_gnews_search_async(
+            query=query,
+            max_results=min(max_results, 20),
             period=period,
-            max_results=min(max_results, 20)
-        )
-        
-        # Suche durchführen
-        raw_results = gnews.get_news(query)
-        
-        results = []
-        for item in raw_results or []:
-            # Datum parsen
-            published = item.get("published date", "")
-            
-            results.append({
-                "title": item.get("title", ""),
-                "url": item.get("url", ""),
-                "snippet": item.get("description", ""),
-                "published": published,
-                "source": item.get("publisher", {}).get("title", "Unbekannt")
-            })
+            language=language,
+            country=country
+        ))
         
         return {
             "success": True,
@@ -5,7 +5,6 @@ Ermöglicht Zugriff auf Tech-Diskussionen der Hacker News Community.
 Nutzt die offizielle Algolia API - kostenlos und ohne API-Key.
 """
 
-import httpx
 from typing import Dict, Any, List, Optional
 
 from .registry import (
@@ -15,6 +14,8 @@ from .registry import (
     create_openai_schema,
     create_anthropic_schema
 )
+from .async_runner import run_async, get_http_client
+from .search_memo import memoize_search
 
 
 async def _hackernews_search_async(
@@ -36,10 +37,71 @@ async def _hackernews_search_async(
         "tags": "(story,poll)"  # Nur Stories und Polls, keine Kommentare
     }
     
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, params=params, timeout=10.0)
-        data = response.json()
-        return data.get("hits", [])
+    client = get_http_client()
+    response = await client.get(url, params=params, timeout=10.0)
+    data = response.json()
+    return data.get("hits", [])
+
+
+@memoize_search()
+async def hackernews_search_async(
+    query: str,
+    max_results: int = 10,
+    sort_by: str = "relevance",
+    min_points: int = 0
+) -> Dict[str, Any]:
+    """
+    Async-Variante von hackernews_search für Aufrufer mit Event-Loop.
+    
+    Muss auf dem gemeinsamen Tools-Loop laufen (run_async).
+    """
+    try:
+        hits = await _hackernews_search_async(
+            query=query,
+            limit=min(max_results, 30),
+            sort_by=sort_by
+        )
+        
+        results = []
+        for hit in hits:
+            points = hit.get("points", 0) or 0
+            
+            # Filter nach Mindestpunkten
+            if points < min_points:
+                continue
+            
+            # URL: Entweder externer Link oder HN-Diskussion
+            url = hit.get("url") or f"https://news.ycombinator.com/item?id={hit.get('objectID', '')}"
+            
+            results.append({
+                "title": hit.get("title", ""),
+                "url": url,
+                "hn_url": f"https://news.ycombinator.com/item?id={hit.get('objectID', '')}",
+                "snippet": hit.get("story_text", "")[:300] if hit.get("story_text") else "",
+                "points": points,
+                "comments": hit.get("num_comments", 0) or 0,
+                "author": hit.get("author", ""),
+                "created_at": hit.get("created_at", "")
+            })
+        
+        return {
+            "success": True,
+            "tool": "hackernews",
+            "query": query,
+            "sort_by": sort_by,
+            "results": results,
+            "result_count": len(results)
+        }
+        
+    except Exception as e:
+        return {
+            "success": False,
+            "tool": "hackernews",
+            "query": query,
+            "results": [],
+            "result_count": 0,
+            "error": str(e)
+        }
 
 
 def hackernews_search(
@@ -60,65 +122,8 @@ def hackernews_search(
     Returns:
         Dict mit Suchergebnissen
     """
-    import asyncio
-    
-    async def _search():
-        try:
-            hits = await _hackernews_search_async(
-                query=query,
-                limit=min(max_results, 30),
-                sort_by=sort_by
-            )
-            
-            results = []
-            for hit in hits:
-                points = hit.get("points", 0) or 0
-                
-                # Filter nach Mindestpunkten
-                if points < min_points:
-                    continue
-                
-                # URL: Entweder externer Link oder HN-Diskussion
-                url = hit.get("url") or f"https://news.ycombinator.com/item?id={hit.get('objectID', '')}"
-                
-                results.append({
-                    "title": hit.get("title", ""),
-                    "url": url,
-                    "hn_url": f"https://news.ycombinator.com/item?id={hit.get('objectID', '')}",
-                    "snippet": hit.get("story_text", "")[:300] if hit.get("story_text") else "",
-                    "points": points,
-                    "comments": hit.get("num_comments", 0) or 0,
-                    "author": hit.get("author", ""),
-                    "created_at": hit.get("created_at", "")
-                })
-            
-            return {
-                "success": True,
-                "tool": "hackernews",
-                "query": query,
-                "sort_by": sort_by,
-                "results": results,
-                "result_count": len(results)
-            }
-            
-        except Exception as e:
-            return {
-                "success": False,
-                "tool": "hackernews",
-                "query": query,
-                "results": [],
-                "result_count": 0,
-                "error": str(e)
-            }
-    
-    # Async in sync wrapper
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    
-    return loop.run_until_complete(_search())
+    # Async in sync wrapper: gemeinsamer Hintergrund-Loop statt Loop pro Aufruf
+    return run_async(hackernews_search_async(query, max_results, sort_by, min_points))
 
 
 # =============================================================================
@@ -181,6 +186,7 @@ register_tool(ResearchTool(
     icon="🔶",
     is_free=True,
     search_func=hackernews_search,
+    search_func_async=hackernews_search_async,
     requires_api_key=False,
     tool_schema_openai=HACKERNEWS_SEARCH_TOOL,
     tool_schema_anthropic=HACKERNEWS_SEARCH_TOOL_ANTHROPIC
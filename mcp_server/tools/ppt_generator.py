@@ -2,16 +2,27 @@
 PowerPoint Generator Tool für HayMAS
 
 Erstellt PowerPoint-Präsentationen aus Markdown-Struktur.
+
+python-pptx (inkl. lxml/PIL) wird erst beim Erstellen einer Präsentation
+importiert - Läufe ohne PPT zahlen die Importzeit nicht.
 """
 
+from __future__ import annotations
+
 import os
 import re
 from datetime import datetime
-from typing import Dict, Any, List, Tuple
-from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.dml.color import RGBColor
-from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
+from typing import TYPE_CHECKING, Dict, Any, List, Tuple
+
+if TYPE_CHECKING:
+    from pptx.presentation import Presentation
+    from pptx.dml.color import RGBColor
+
+# Folien-Header: "# Folie X: Titel" oder "## Folie X: Titel"
+_SLIDE_TITLE_RE = re.compile(r'^#{1,2}\s*Folie\s*\d+[:\s]*(.+?)$', re.MULTILINE)
+
+# Aufzählungszeichen für Bullet Points
+_BULLET_PREFIXES = ("- ", "* ", "• ")
 
 # Output-Verzeichnis
 OUTPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "output")
@@ -40,18 +51,15 @@ def parse_markdown_slides(markdown_content: str) -> List[Dict[str, Any]]:
     """
     slides = []
     
-    # Split nach Folien-Headern
-    # Matche: # Folie X: Titel oder ## Folie X: Titel
-    pattern = r'^#{1,2}\s*Folie\s*\d+[:\s]*(.+?)$'
+    # Ein Durchlauf über die Folien-Header: Inhalt einer Folie reicht vom
+    # Titel bis zum nächsten Header (Text vor der ersten Folie wird ignoriert)
+    matches = list(_SLIDE_TITLE_RE.finditer(markdown_content))
     
-    # Aufteilen nach Folien
-    parts = re.split(r'^#{1,2}\s*Folie\s*\d+[:\s]*', markdown_content, flags=re.MULTILINE)
-    titles = re.findall(pattern, markdown_content, flags=re.MULTILINE)
-    
-    # Erste Teil ist vor der ersten Folie (ignorieren)
-    contents = parts[1:] if len(parts) > 1 else []
-    
-    for i, (title, content) in enumerate(zip(titles, contents)):
+    for i, match in enumerate(matches):
+        title = match.group(1)
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(markdown_content)
+        content = markdown_content[match.start(1):end]
+        
         slide_data = {
             "title": title.strip(),
             "subtitle": "",
@@ -69,7 +77,7 @@ def parse_markdown_slides(markdown_content: str) -> List[Dict[str, Any]]:
                 continue
             
             # Bullet Points erkennen
-            if line.startswith("- ") or line.startswith("* ") or line.startswith("• "):
+            if line.startswith(_BULLET_PREFIXES):
                 bullet_text = line[2:].strip()
                 bullets.append(bullet_text)
             elif line.startswith("**") and line.endswith("**"):
@@ -123,6 +131,10 @@ def create_ppt(
                 "error": "Keine Folien im Markdown gefunden. Erwartet: '# Folie 1: Titel'"
             }
         
+        from pptx import Presentation
+        from pptx.util import Inches
+        from pptx.dml.color import RGBColor
+        
         # Neue Präsentation erstellen
         prs = Presentation()
         prs.slide_width = Inches(13.333)  # 16:9 Format
@@ -178,6 +190,8 @@ def _create_title_slide(prs: Presentation, slide_data: Dict, title_color: RGBCol
     
     # Hintergrund-Rechteck oben
     from pptx.enum.shapes import MSO_SHAPE
+    from pptx.enum.text import PP_ALIGN
+    from pptx.util import Inches, Pt
     shape = slide.shapes.add_shape(
         MSO_SHAPE.RECTANGLE,
         Inches(0), Inches(0),
@@ -233,7 +247,10 @@ def _create_content_slide(prs: Presentation, slide_data: Dict, title_color: RGBC
     slide = prs.slides.add_slide(blank_layout)
     
     # Header-Bereich
+    from pptx.dml.color import RGBColor
     from pptx.enum.shapes import MSO_SHAPE
+    from pptx.enum.text import PP_ALIGN
+    from pptx.util import Inches, Pt
     header = slide.shapes.add_shape(
         MSO_SHAPE.RECTANGLE,
         Inches(0), Inches(0),
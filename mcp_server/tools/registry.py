@@ -41,6 +41,7 @@ class ResearchTool:
     
     # Technisch
     search_func: Optional[Callable] = None  # Die eigentliche Suchfunktion
+    search_func_async: Optional[Callable] = None  # Optional: Coroutine-Variante (läuft auf dem Tools-Loop)
     requires_api_key: bool = False
     api_key_env_var: Optional[str] = None
     
@@ -55,6 +56,33 @@ class ResearchTool:
 
 _TOOL_REGISTRY: Dict[str, ResearchTool] = {}
 
+# Indizes (Reihenfolge = Registrierungsreihenfolge), neu aufgebaut bei register_tool
+_BY_CATEGORY: Dict[ToolCategory, List[ResearchTool]] = {}
+_BY_TOPIC: Dict[str, List[ResearchTool]] = {}
+_FREE_TOOLS: List[ResearchTool] = []
+_TOPIC_CACHE: Dict[str, List[ResearchTool]] = {}
+
+# Abgeleitete Ausgaben (Prompt-Text, API-Liste), ungültig bei register_tool
+_PROMPT_DESC_CACHE: Optional[str] = None
+_API_CACHE: Optional[List[Dict[str, Any]]] = None
+
+
+def _rebuild_indexes() -> None:
+    """Baut die Kategorie-/Themen-Indizes aus der Registry neu auf."""
+    global _PROMPT_DESC_CACHE, _API_CACHE
+    _PROMPT_DESC_CACHE = None
+    _API_CACHE = None
+    _BY_CATEGORY.clear()
+    _BY_TOPIC.clear()
+    _FREE_TOOLS.clear()
+    _TOPIC_CACHE.clear()
+    for tool in _TOOL_REGISTRY.values():
+        _BY_CATEGORY.setdefault(tool.category, []).append(tool)
+        for topic in dict.fromkeys(tool.topic_types):
+            _BY_TOPIC.setdefault(topic, []).append(tool)
+        if tool.is_free:
+            _FREE_TOOLS.append(tool)
+
 
 def register_tool(tool: ResearchTool) -> None:
     """
@@ -64,6 +92,9 @@ def register_tool(tool: ResearchTool) -> None:
         tool: ResearchTool-Instanz
     """
     _TOOL_REGISTRY[tool.id] = tool
+    # Registrierung nur beim Import der Tool-Module -> Komplett-Neuaufbau ist billig
+    # und behandelt auch das Ersetzen eines Tools mit gleicher ID
+    _rebuild_indexes()
 
 
 def get_tool(tool_id: str) -> Optional[ResearchTool]:
@@ -86,7 +117,7 @@ def get_all_tools() -> List[ResearchTool]:
 
 def get_tools_by_category(category: ToolCategory) -> List[ResearchTool]:
     """Gibt alle Tools einer Kategorie zurück."""
-    return [t for t in _TOOL_REGISTRY.values() if t.category == category]
+    return list(_BY_CATEGORY.get(category, ()))
 
 
 def get_tools_for_topic(topic_type: str) -> List[ResearchTool]:
@@ -99,15 +130,19 @@ def get_tools_for_topic(topic_type: str) -> List[ResearchTool]:
     Returns:
         Liste passender Tools, sortiert nach Relevanz
     """
-    matching = [t for t in _TOOL_REGISTRY.values() if topic_type in t.topic_types]
-    # Immer auch "general" Tools einschließen
-    general = [t for t in _TOOL_REGISTRY.values() if "general" in t.topic_types and t not in matching]
-    return matching + general
+    tools = _TOPIC_CACHE.get(topic_type)
+    if tools is None:
+        matching = _BY_TOPIC.get(topic_type, [])
+        # Immer auch "general" Tools einschließen
+        matching_ids = {id(t) for t in matching}
+        general = [t for t in _BY_TOPIC.get("general", ()) if id(t) not in matching_ids]
+        tools = _TOPIC_CACHE[topic_type] = matching + general
+    return list(tools)
 
 
 def get_free_tools() -> List[ResearchTool]:
     """Gibt alle kostenlosen Tools zurück."""
-    return [t for t in _TOOL_REGISTRY.values() if t.is_free]
+    return list(_FREE_TOOLS)
 
 
 def get_tools_description_for_prompt() -> str:
@@ -117,14 +152,17 @@ def get_tools_description_for_prompt() -> str:
     Returns:
         Formatierte Tool-Beschreibung
     """
-    lines = []
-    for tool in _TOOL_REGISTRY.values():
-        cost = "kostenlos" if tool.is_free else "kostenpflichtig"
-        lines.append(
-            f"- **{tool.id}** ({tool.icon} {tool.name}): {tool.description}\n"
-            f"  Gut für: {', '.join(tool.best_for)} | {cost}"
-        )
-    return "\n".join(lines)
+    global _PROMPT_DESC_CACHE
+    if _PROMPT_DESC_CACHE is None:
+        lines = []
+        for tool in _TOOL_REGISTRY.values():
+            cost = "kostenlos" if tool.is_free else "kostenpflichtig"
+            lines.append(
+                f"- **{tool.id}** ({tool.icon} {tool.name}): {tool.description}\n"
+                f"  Gut für: {', '.join(tool.best_for)} | {cost}"
+            )
+        _PROMPT_DESC_CACHE = "\n".join(lines)
+    return _PROMPT_DESC_CACHE
 
 
 def get_tools_for_api() -> List[Dict[str, Any]]:
@@ -132,21 +170,24 @@ def get_tools_for_api() -> List[Dict[str, Any]]:
     Gibt Tool-Informationen für die API zurück (für Frontend).
     
     Returns:
-        Liste von Tool-Dicts
+        Liste von Tool-Dicts (Kopien, der Cache bleibt unverändert)
     """
-    return [
-        {
-            "id": tool.id,
-            "name": tool.name,
-            "description": tool.description,
-            "category": tool.category.value,
-            "icon": tool.icon,
-            "is_free": tool.is_free,
-            "best_for": tool.best_for,
-            "topic_types": tool.topic_types,
-        }
-        for tool in _TOOL_REGISTRY.values()
-    ]
+    global _API_CACHE
+    if _API_CACHE is None:
+        _API_CACHE = [
+            {
+                "id": tool.id,
+                "name": tool.name,
+                "description": tool.description,
+                "category": tool.category.value,
+                "icon": tool.icon,
+                "is_free": tool.is_free,
+                "best_for": tool.best_for,
+                "topic_types": tool.topic_types,
+            }
+            for tool in _TOOL_REGISTRY.values()
+        ]
+    return [dict(entry) for entry in _API_CACHE]
 
 
 def execute_tool(tool_id: str, **kwargs) -> Dict[str, Any]:
@@ -0,0 +1,87 @@
+"""
+HayMAS Search Memo
+
+In-Prozess-Cache (LRU + TTL) für Such-Tools.
+
+Agenten stellen in Revisionsschleifen oft identische Anfragen. Der Memo
+beantwortet diese ohne Netzwerk-Roundtrip; anders als der persistente
+SearchCache greift er für jeden Aufrufer (auch Agent-Tool-Calls).
+Gespeichert werden nur erfolgreiche Ergebnisse.
+"""
+
+import copy
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict
+
+
+# Standard-Gültigkeit und -Größe des Memos
+MEMO_TTL = 600          # Sekunden
+MEMO_MAXSIZE = 256      # Einträge pro Tool
+
+
+def memoize_search(ttl: float = MEMO_TTL, maxsize: int = MEMO_MAXSIZE) -> Callable:
+    """
+    Dekorator für Such-Funktionen, die ein Ergebnis-Dict zurückgeben.
+
+    Der Schlüssel sind die gebundenen Argumente inkl. Defaults, d.h.
+    search("x") und search("x", max_results=10) teilen sich einen Eintrag.
+    Zurückgegeben wird jeweils eine Kopie, damit Aufrufer den Cache
+    nicht verändern.
+
+    Funktioniert auch für Coroutine-Funktionen (die *_search_async-Varianten);
+    deren sync Wrapper laufen über sie und teilen sich so denselben Memo.
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        signature = inspect.signature(func)
+        entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        lock = threading.Lock()
+
+        def _lookup(args: tuple, kwargs: dict) -> tuple:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = tuple(bound.arguments.items())
+            now = time.monotonic()
+            with lock:
+                entry = entries.get(key)
+                if entry is not None:
+                    if entry[0] > now:
+                        entries.move_to_end(key)
+                        return key, copy.deepcopy(entry[1])
+                    del entries[key]
+            return key, None
+
+        def _store(key: tuple, result: Dict[str, Any]):
+            if result and result.get("success") is not False:
+                with lock:
+                    entries[key] = (time.monotonic() + ttl, copy.deepcopy(result))
+                    entries.move_to_end(key)
+                    while len(entries) > maxsize:
+                        entries.popitem(last=False)
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs) -> Dict[str, Any]:
+                key, cached = _lookup(args, kwargs)
+                if cached is not None:
+                    return cached
+                result = await func(*args, **kwargs)
+                _store(key, result)
+                return result
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs) -> Dict[str, Any]:
+                key, cached = _lookup(args, kwargs)
+                if cached is not None:
+                    return cached
+                result = func(*args, **kwargs)
+                _store(key, result)
+                return result
+
+        wrapper.cache_clear = entries.clear
+        return wrapper
+
+    return decorator
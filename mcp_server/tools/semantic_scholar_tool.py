@@ -5,9 +5,7 @@ Ermöglicht Zugriff auf wissenschaftliche Paper und Forschung.
 200M+ Paper mit AI-Zusammenfassungen - kostenlos und ohne API-Key!
 """
 
-import httpx
 from typing import Dict, Any, List, Optional
-import asyncio
 
 from .registry import (
     register_tool,
@@ -16,6 +14,8 @@ from .registry import (
     create_openai_schema,
     create_anthropic_schema
 )
+from .async_runner import run_async, get_http_client
+from .search_memo import memoize_search
 
 
 async def _semantic_scholar_search_async(
@@ -44,14 +44,90 @@ async def _semantic_scholar_search_async(
         "User-Agent": "HayMAS/1.0 (Research Tool)"
     }
     
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, params=params, headers=headers, timeout=15.0)
+    client = get_http_client()
+    response = await client.get(url, params=params, headers=headers, timeout=15.0)
+    
+    if response.status_code == 200:
+        data = response.json()
+        return data.get("data", [])
+    else:
+        return []
+
+
+@memoize_search()
+async def semantic_scholar_search_async(
+    query: str,
+    max_results: int = 10,
+    year_from: Optional[int] = None,
+    fields_of_study: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Async-Variante von semantic_scholar_search für Aufrufer mit Event-Loop.
+    
+    Muss auf dem gemeinsamen Tools-Loop laufen (run_async).
+    """
+    try:
+        # Fields of Study parsen wenn angegeben
+        fos_list = None
+        if fields_of_study:
+            fos_list = [f.strip() for f in fields_of_study.split(",")]
+        
+        papers = await _semantic_scholar_search_async(
+            query=query,
+            limit=min(max_results, 20),
+            year_from=year_from,
+            fields_of_study=fos_list
+        )
+        
+        results = []
+        for paper in papers:
+            # Autoren formatieren
+            authors = paper.get("authors", [])
+            author_names = ", ".join([a.get("name", "") for a in authors[:3]])
+            if len(authors) > 3:
+                author_names += f" et al. ({len(authors)} authors)"
+            
+            # URL bestimmen (bevorzugt Open Access PDF)
+            url = paper.get("url", "")
+            open_access = paper.get("openAccessPdf")
+            if open_access and open_access.get("url"):
+                pdf_url = open_access["url"]
+            else:
+                pdf_url = None
+            
+            # Abstract kürzen
+            abstract = paper.get("abstract", "") or ""
+            if len(abstract) > 500:
+                abstract = abstract[:497] + "..."
+            
+            results.append({
+                "title": paper.get("title", ""),
+                "url": url,
+                "pdf_url": pdf_url,
+                "snippet": abstract,
+                "year": paper.get("year"),
+                "authors": author_names,
+                "citations": paper.get("citationCount", 0),
+                "venue": paper.get("venue", "")
+            })
         
-        if response.status_code == 200:
-            data = response.json()
-            return data.get("data", [])
-        else:
-            return []
+        return {
+            "success": True,
+            "tool": "semantic_scholar",
+            "query": query,
+            "results": results,
+            "result_count": len(results)
+        }
+        
+    except Exception as e:
+        return {
+            "success": False,
+            "tool": "semantic_scholar",
+            "query": query,
+            "results": [],
+            "result_count": 0,
+            "error": str(e)
+        }
 
 
 def semantic_scholar_search(
@@ -72,79 +148,8 @@ def semantic_scholar_search(
     Returns:
         Dict mit Suchergebnissen
     """
-    
-    async def _search():
-        try:
-            # Fields of Study parsen wenn angegeben
-            fos_list = None
-            if fields_of_study:
-                fos_list = [f.strip() for f in fields_of_study.split(",")]
-            
-            papers = await _semantic_scholar_search_async(
-                query=query,
-                limit=min(max_results, 20),
-                year_from=year_from,
-                fields_of_study=fos_list
-            )
-            
-            results = []
-            for paper in papers:
-                # Autoren formatieren
-                authors = paper.get("authors", [])
-                author_names = ", ".join([a.get("name", "") for a in authors[:3]])
-                if len(authors) > 3:
-                    author_names += f" et al. ({len(authors)} authors)"
-                
-                # URL bestimmen (bevorzugt Open Access PDF)
-                url = paper.get("url", "")
-                open_access = paper.get("openAccessPdf")
-                if open_access and open_access.get("url"):
-                    pdf_url = open_access["url"]
-                else:
-                    pdf_url = None
-                
-                # Abstract kürzen
-                abstract = paper.get("abstract", "") or ""
-                if len(abstract) > 500:
-                    abstract = abstract[:497] + "..."
-                
-                results.append({
-                    "title": paper.get("title", ""),
-                    "url": url,
-                    "pdf_url": pdf_url,
-                    "snippet": abstract,
-                    "year": paper.get("year"),
-                    "authors": author_names,
-                    "citations": paper.get("citationCount", 0),
-                    "venue": paper.get("venue", "")
-                })
-            
-            return {
-                "success": True,
-                "tool": "semantic_scholar",
-                "query": query,
-                "results": results,
-                "result_count": len(results)
-            }
-            
-        except Exception as e:
-            return {
-                "success": False,
-                "tool": "semantic_scholar",
-                "query": query,
-                "results": [],
-                "result_count": 0,
-                "error": str(e)
-            }
-    
-    # Async in sync wrapper
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    
-    return loop.run_until_complete(_search())
+    # Async in sync wrapper: gemeinsamer Hintergrund-Loop statt Loop pro Aufruf
+    return run_async(semantic_scholar_search_async(query, max_results, year_from, fields_of_study))
 
 
 # =============================================================================
@@ -206,6 +211,7 @@ register_tool(ResearchTool(
     icon="🎓",
     is_free=True,
     search_func=semantic_scholar_search,
+    search_func_async=semantic_scholar_search_async,
     requires_api_key=False,
     tool_schema_openai=SEMANTIC_SCHOLAR_TOOL,
     tool_schema_anthropic=SEMANTIC_SCHOLAR_TOOL_ANTHROPIC
@@ -6,9 +6,7 @@ Perfekt für: Öffentliche Verwaltung, IT-Beschaffung, Government.
 Kostenlos und ohne API-Key!
 """
 
-import httpx
 from typing import Dict, Any, List, Optional
-import asyncio
 from datetime import datetime, timedelta
 
 from .registry import (
@@ -18,6 +16,7 @@ from .registry import (
     create_openai_schema,
     create_anthropic_schema
 )
+from .async_runner import run_async, get_http_client
 
 
 async def _ted_search_async(
@@ -60,21 +59,21 @@ async def _ted_search_async(
     }
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url, 
-                params=search_params, 
-                headers=headers, 
-                timeout=15.0,
-                follow_redirects=True
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                return _parse_ted_response(data)
-            else:
-                # Fallback: Einfache Suche über TED Website
-                return await _ted_website_search(query, max_results, country)
+        client = get_http_client()
+        response = await client.get(
+            url, 
+            params=search_params, 
+            headers=headers, 
+            timeout=15.0,
+            follow_redirects=True
+        )
+        
+        if response.status_code == 200:
+            data = response.json()
+            return _parse_ted_response(data)
+        else:
+            # Fallback: Einfache Suche über TED Website
+            return await _ted_website_search(query, max_results, country)
     except Exception:
         # Fallback bei API-Problemen
         return await _ted_website_search(query, max_results, country)
@@ -107,21 +106,21 @@ async def _ted_website_search(
     }
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                base_url,
-                params=params,
-                headers=headers,
-                timeout=15.0,
-                follow_redirects=True
-            )
-            
-            if response.status_code == 200:
-                try:
-                    data = response.json()
-                    return _parse_ted_response(data)
-                except:
-                    pass
+        client = get_http_client()
+        response = await client.get(
+            base_url,
+            params=params,
+            headers=headers,
+            timeout=15.0,
+            follow_redirects=True
+        )
+        
+        if response.status_code == 200:
+            try:
+                data = response.json()
+                return _parse_ted_response(data)
+            except:
+                pass
     except:
         pass
     
@@ -255,14 +254,8 @@ def ted_search(
                 "error": str(e)
             }
     
-    # Async in sync wrapper
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    
-    return loop.run_until_complete(_search())
+    # Async in sync wrapper: gemeinsamer Hintergrund-Loop statt Loop pro Aufruf
+    return run_async(_search())
 
 
 # =============================================================================
@@ -5,7 +5,6 @@ Ermöglicht Zugriff auf enzyklopädisches Grundlagenwissen.
 Kostenlos und ohne API-Key nutzbar.
 """
 
-import httpx
 from typing import Dict, Any, List, Optional
 
 from .registry import (
@@ -15,6 +14,7 @@ from .registry import (
     create_openai_schema,
     create_anthropic_schema
 )
+from .async_runner import run_async, get_http_client
 
 
 async def _wikipedia_search_async(query: str, limit: int = 5, language: str = "de") -> List[Dict]:
@@ -34,10 +34,10 @@ async def _wikipedia_search_async(query: str, limit: int = 5, language: str = "d
         "User-Agent": "HayMAS/1.0 (Research Tool; https://github.com/haymas)"
     }
     
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, params=params, headers=headers, timeout=10.0)
-        data = response.json()
-        return data.get("query", {}).get("search", [])
+    client = get_http_client()
+    response = await client.get(url, params=params, headers=headers, timeout=10.0)
+    data = response.json()
+    return data.get("query", {}).get("search", [])
 
 
 async def _wikipedia_summary_async(title: str, language: str = "de") -> Dict:
@@ -51,11 +51,11 @@ async def _wikipedia_summary_async(title: str, language: str = "de") -> Dict:
         "User-Agent": "HayMAS/1.0 (Research Tool; https://github.com/haymas)"
     }
     
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=headers, timeout=10.0)
-        if response.status_code == 200:
-            return response.json()
-        return {}
+    client = get_http_client()
+    response = await client.get(url, headers=headers, timeout=10.0)
+    if response.status_code == 200:
+        return response.json()
+    return {}
 
 
 def wikipedia_search(
@@ -76,8 +76,6 @@ def wikipedia_search(
     Returns:
         Dict mit Suchergebnissen
     """
-    import asyncio
-    
     async def _search():
         try:
             # Suche durchführen
@@ -125,14 +123,8 @@ def wikipedia_search(
                 "error": str(e)
             }
     
-    # Async in sync wrapper
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    
-    return loop.run_until_complete(_search())
+    # Async in sync wrapper: gemeinsamer Hintergrund-Loop statt Loop pro Aufruf
+    return run_async(_search())
 
 
 # =============================================================================
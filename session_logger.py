@@ -3,18 +3,28 @@ HayMAS Session Logger
 
 Persistentes Logging für jeden Artikel-Generierungsprozess.
 Wird nach jedem Schritt gespeichert - auch bei Abbruch verfügbar.
+Schnell aufeinanderfolgende Änderungen werden zu einem Schreibvorgang
+zusammengefasst (höchstens alle SAVE_INTERVAL Sekunden).
 """
 
+import atexit
 import os
 import json
+import threading
+import time
+import weakref
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Iterator
 from dataclasses import dataclass, field, asdict
 
 LOGS_DIR = os.path.join(os.path.dirname(__file__), "logs")
 
+# Logger mit noch nicht geschriebenen Änderungen (werden beim Beenden geflusht)
+_pending_loggers: "weakref.WeakSet[SessionLogger]" = weakref.WeakSet()
 
-@dataclass
+
+@dataclass(slots=True)
 class AgentStep:
     """Ein einzelner Schritt im Generierungsprozess"""
     timestamp: str
@@ -33,6 +43,17 @@ class AgentStep:
     details: Optional[Dict[str, Any]] = None  # Für Event-Details (z.B. Editor-Verdict)
 
 
+@dataclass(slots=True)
+class StepRecord:
+    """Ergebnis eines laufenden Schritts, wird im step()-Block befüllt"""
+    status: str = "success"
+    tokens: Optional[Dict[str, int]] = None
+    tool_calls: List[str] = field(default_factory=list)
+    result_length: Optional[int] = None
+    error: Optional[str] = None
+    details: Optional[Dict[str, Any]] = None
+
+
 @dataclass
 class SessionLog:
     """Komplettes Log einer Session"""
@@ -57,8 +78,14 @@ class SessionLogger:
     """
     Logger für eine Artikel-Generierungs-Session.
     Speichert nach jedem Schritt persistent.
+    
+    Innerhalb von SAVE_INTERVAL wird nur einmal geschrieben; spätere
+    Änderungen schreibt ein Timer nach. Abschluss, Abbruch und Fehler
+    werden sofort geschrieben.
     """
     
+    SAVE_INTERVAL = 0.5  # Sekunden
+    
     def __init__(
         self,
         question: str,
@@ -76,9 +103,12 @@ class SessionLogger:
         self.log_path = os.path.join(LOGS_DIR, f"session_{self.session_id}.json")
         self._current_step_start: Optional[datetime] = None
         self._total_tokens = {"input": 0, "output": 0}
+        self._save_lock = threading.Lock()
+        self._last_save = 0.0
+        self._flush_timer: Optional[threading.Timer] = None
         
         # Initial speichern
-        self._save()
+        self._save(force=True)
     
     def start_step(
         self,
@@ -145,6 +175,40 @@ class SessionLogger:
         
         self._save()
     
+    @contextmanager
+    def step(
+        self,
+        agent: str,
+        model: str,
+        provider: str,
+        tier: str,
+        action: str,
+        task: str
+    ) -> Iterator[StepRecord]:
+        """
+        Context-Manager für einen Schritt: start_step beim Eintritt,
+        genau ein end_step beim Verlassen.
+        
+        Bei einer Exception wird der Schritt als "error" beendet und die
+        Exception weitergereicht.
+        """
+        step_index = self.start_step(agent, model, provider, tier, action, task)
+        record = StepRecord()
+        try:
+            yield record
+        except Exception as e:
+            self.end_step(step_index, status="error", error=str(e))
+            raise
+        self.end_step(
+            step_index,
+            status=record.status,
+            tokens=record.tokens,
+            tool_calls=record.tool_calls,
+            result_length=record.result_length,
+            error=record.error,
+            details=record.details
+        )
+    
     def log_tool_call(self, step_index: int, tool_name: str):
         """Fügt einen Tool-Call zum aktuellen Schritt hinzu"""
         if step_index < len(self.log.timeline):
@@ -199,7 +263,7 @@ class SessionLogger:
             "article_words": article_words
         }
         
-        self._save()
+        self._save(force=True)
     
     def abort(self, reason: str = "User cancelled"):
         """Markiert die Session als abgebrochen"""
@@ -213,7 +277,7 @@ class SessionLogger:
                 step.error = reason
                 break
         
-        self._save()
+        self._save(force=True)
     
     def error(self, error_message: str):
         """Markiert die Session als fehlerhaft"""
@@ -225,7 +289,7 @@ class SessionLogger:
             self.log.timeline[-1].status = "error"
             self.log.timeline[-1].error = error_message
         
-        self._save()
+        self._save(force=True)
     
     def _estimate_cost(self) -> float:
         """Schätzt die Kosten basierend auf Token-Counts (grobe Schätzung)"""
@@ -238,16 +302,63 @@ class SessionLogger:
         
         return round(input_cost + output_cost, 4)
     
-    def _save(self):
-        """Speichert das Log persistent"""
+    def _save(self, force: bool = False):
+        """
+        Speichert das Log persistent - sofort, wenn der letzte Schreibvorgang
+        SAVE_INTERVAL zurückliegt (oder force), sonst per Timer danach.
+        """
+        with self._save_lock:
+            elapsed = time.monotonic() - self._last_save
+            if force or elapsed >= self.SAVE_INTERVAL:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                self._write()
+                return
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.SAVE_INTERVAL - elapsed, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+                _pending_loggers.add(self)
+    
+    def flush(self):
+        """Schreibt ausstehende Änderungen sofort"""
+        with self._save_lock:
+            if self._flush_timer is None:
+                return
+            self._flush_timer.cancel()
+            self._flush_timer = None
+            try:
+                self._write()
+            except RuntimeError:
+                # Timeline wurde während der Serialisierung verändert -> erneut planen
+                self._flush_timer = threading.Timer(self.SAVE_INTERVAL, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def _write(self):
+        """Schreibt das komplette Log (Aufruf nur unter _save_lock)"""
+        data = json.dumps(self.log.to_dict(), ensure_ascii=False, indent=2)
         with open(self.log_path, "w", encoding="utf-8") as f:
-            json.dump(self.log.to_dict(), f, ensure_ascii=False, indent=2)
+            f.write(data)
+        self._last_save = time.monotonic()
+        _pending_loggers.discard(self)
     
     def get_log_filename(self) -> str:
         """Gibt den Dateinamen des Logs zurück"""
         return f"session_{self.session_id}.json"
 
 
+@atexit.register
+def _flush_pending_loggers():
+    """Schreibt beim Beenden alle noch ausstehenden Logs (best effort)"""
+    for logger in list(_pending_loggers):
+        try:
+            logger.flush()
+        except Exception:
+            pass
+
+
 def get_log_for_article(article_filename: str) -> Optional[Dict]:
     """
     Findet das Log für einen Artikel basierend auf dem Timestamp.